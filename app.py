@@ -7,6 +7,7 @@ from parts_database import (
     get_compatible_parts,
 )
 from physics_engine import generate_physics
+from build_optimizer import optimize_build
 
 app = Flask(__name__)
 
@@ -45,6 +46,37 @@ def api_generate():
         return jsonify(result), 400
     return jsonify(result)
 
+@app.route('/api/optimize', methods=['POST'])
+def api_optimize():
+    """Cheapest builds meeting numeric targets; a [low, high] list is a range."""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get("targets", {}), dict):
+        return jsonify({"error": "Expected a JSON object with a targets object"}), 400
+    try:
+        targets = {k: _optimize_target(v) for k, v in data.get("targets", {}).items()}
+        top, tolerance = int(data.get("top", 5)), float(data.get("tolerance", 0.05))
+    except (TypeError, ValueError):
+        return jsonify({"error": "Targets must be numbers or [low, high] ranges; top and tolerance numbers"}), 400
+    if not isinstance(data.get("car_id"), str):
+        return jsonify({"error": "car_id must be a string"}), 400
+    parts = data.get("parts")
+    if parts is not None and not (isinstance(parts, dict) and all(
+            isinstance(v, list) and all(isinstance(p, str) for p in v) for v in parts.values())):
+        return jsonify({"error": "parts must map axes to lists of part ids"}), 400
+    try:
+        builds = optimize_build(data.get("car_id"), targets, top=top, tolerance=tolerance, parts=parts)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    return jsonify({"builds": [b.__dict__ for b in builds]})
+
+def _optimize_target(value):
+    """A JSON target as optimize_build takes it: a float, or a (low, high) tuple."""
+    if isinstance(value, list):
+        if len(value) != 2:
+            raise ValueError(value)
+        return tuple(None if x is None else float(x) for x in value)
+    return float(value)
+
 @app.route('/api/download', methods=['POST'])
 def api_download():
     data = request.get_json()
@@ -1,8 +1,11 @@
 """RealiSimHQ AC Physics Tool v2 — Drag & Drop Workflow"""
-import os, json, io, zipfile, re, math, shutil, tempfile
+import os, json, io, zipfile, math, shutil, tempfile
 from flask import Flask, request, render_template_string, send_file, jsonify
-from src.ini_parser import parse_ini_file, parse_ini_string, get_value, get_raw
-from src.car_detector import detect_car, _identify_from_name, CarIdentity
+from src.ini_parser import PARSE_CACHE, IniDocument, decode_text, detect_encoding, get_value, get_raw
+from src.analyzer import CarPipeline
+from src.archive_scanner import ARCHIVE_ERRORS, CarArchive
+from src.fingerprint import FINGERPRINT_SOURCE, FingerprintIndex
+from car_database import CAR_DATABASE
 from parts_database import (
     COILOVERS, ANGLE_KITS, WHEEL_SETUPS, BRAKE_KITS, DIFF_TYPES, TIRE_COMPOUNDS,
     get_compatible_parts,
@@ -11,6 +14,10 @@ from parts_database import (
 app = Flask(__name__)
 UPLOAD_DIR = tempfile.mkdtemp(prefix="rsimhq_")
 
+# Built-in cars, for identifying uploads by physics when their names don't
+FINGERPRINTS = FingerprintIndex()
+FINGERPRINTS.add_database(CAR_DATABASE)
+
 # ── Helpers ───────────────────────────────────────────────────────
 
 def _session_dir():
@@ -32,9 +39,10 @@ def _parse_uploaded_files(directory):
         fp = os.path.join(directory, f)
         if os.path.isfile(fp) and f.lower().endswith('.ini'):
             try:
-                parsed[f.lower()] = parse_ini_file(fp)
-                with open(fp, 'r', encoding='utf-8', errors='replace') as fh:
-                    raw_contents[f.lower()] = fh.read()
+                with open(fp, 'rb') as fh:
+                    content = decode_text(fh.read())
+                parsed[f.lower()] = PARSE_CACHE.parse_string(content)
+                raw_contents[f.lower()] = content
             except Exception:
                 pass
     return parsed, raw_contents
@@ -288,19 +296,9 @@ def _calculate_physics(stock, parts_selection):
 
 def _apply_changes_to_content(content, sections_changes):
     """Apply key=value changes to an INI file's raw content, preserving structure."""
-    for section, values in sections_changes.items():
-        for key, new_val in values.items():
-            pattern = rf'((?:^|\n)(\s*){re.escape(key)}\s*=)\s*[^\n;]*'
-            new_content = re.sub(pattern, rf'\g<1>{new_val}', content, flags=re.IGNORECASE)
-            if new_content != content:
-                content = new_content
-            else:
-                # Key not found — try to append in section
-                sec_pattern = rf'(\[{re.escape(section)}\][^\[]*)'
-                def append_key(m):
-                    return m.group(0).rstrip() + f'\n{key}={new_val}\n'
-                content = re.sub(sec_pattern, append_key, content, count=1, flags=re.IGNORECASE)
-    return content
+    doc = IniDocument(content)
+    doc.apply(sections_changes)
+    return doc.dumps()
 
 
 # ── API Routes ────────────────────────────────────────────────────
@@ -311,21 +309,27 @@ def api_upload():
     _clear_session()
     sdir = _session_dir()
     
-    # Check for zip file
+    # Check for zip/7z archive: spool it to disk and read only the physics
+    # members of the first car in it, never the models and textures. An
+    # archive of loose files that doesn't look like a car gives up all its
+    # .ini/.lut members instead
     if 'zipfile' in request.files:
-        zf = request.files['zipfile']
+        # A file per request: concurrent uploads must not share one path
+        with tempfile.NamedTemporaryFile(dir=UPLOAD_DIR, delete=False) as fh:
+            archive_path = fh.name
+            request.files['zipfile'].save(fh)
         try:
-            with zipfile.ZipFile(io.BytesIO(zf.read())) as z:
-                for name in z.namelist():
-                    if name.endswith('/'):
-                        continue
-                    basename = os.path.basename(name)
-                    if basename.lower().endswith(('.ini', '.lut')):
-                        with z.open(name) as src:
-                            with open(os.path.join(sdir, basename), 'wb') as dst:
-                                dst.write(src.read())
-        except zipfile.BadZipFile:
-            return jsonify({"error": "Invalid zip file"}), 400
+            with CarArchive(archive_path) as archive:
+                if archive.cars:
+                    archive.extract_physics(archive.cars[0], sdir)
+                else:
+                    archive.extract([m for m in archive.members if m.suffix.lower() in ('.ini', '.lut')], sdir)
+        except (ImportError, FileExistsError) as e:
+            return jsonify({"error": str(e)}), 400
+        except ARCHIVE_ERRORS:
+            return jsonify({"error": "Invalid archive (expected .zip or .7z)"}), 400
+        finally:
+            os.remove(archive_path)
     else:
         # Individual files
         files = request.files.getlist('files')
@@ -343,19 +347,10 @@ def api_upload():
 
     stock = _extract_stock_values(parsed)
 
-    # Detect car identity
+    # Detect car identity from the files already parsed above (no folder
+    # name to go on for an upload)
     identity_name = stock.get('screen_name', '')
-    detected = CarIdentity()
-    if identity_name:
-        _identify_from_name(detected, identity_name, 'SCREEN_NAME')
-    if detected.confidence < 0.5:
-        # Try folder-level detection on any available name
-        for key in ['short_name']:
-            v = get_raw(parsed.get('car.ini', {}), 'INFO', key.upper(), '')
-            if v:
-                _identify_from_name(detected, v, key)
-                if detected.confidence >= 0.5:
-                    break
+    detected = CarPipeline(sdir, files=parsed, folder_name='', fingerprints=FINGERPRINTS).identity
 
     # Save stock values for later
     # Make stock JSON-serializable
@@ -378,6 +373,8 @@ def api_upload():
             "chassis": detected.chassis_code,
             "year": detected.year_range,
             "confidence": detected.confidence,
+            # A fingerprint match is a guess from mass and dimensions, not a detection
+            "identified_by": "fingerprint" if detected.source.startswith(FINGERPRINT_SOURCE) else "detected",
         },
         "stock": stock_ser,
         "files": files_found,
@@ -430,13 +427,15 @@ def api_download():
             if fname.startswith('_') or not fname.lower().endswith(('.ini', '.lut')):
                 continue
             fpath = os.path.join(sdir, fname)
-            with open(fpath, 'r', encoding='utf-8', errors='replace') as fh:
+            with open(fpath, 'rb') as fh:
                 content = fh.read()
             
-            # Apply changes if we have them for this file
+            # Apply changes if we have them for this file, keeping its encoding
             fl = fname.lower()
             if fl in result['changes']:
-                content = _apply_changes_to_content(content, result['changes'][fl])
+                encoding = detect_encoding(content)
+                text = _apply_changes_to_content(str(content, encoding, 'replace'), result['changes'][fl])
+                content = text.encode(encoding, errors='replace')
             
             zf.writestr(f"data/{fname}", content)
 
@@ -606,7 +605,7 @@ footer { text-align: center; color: var(--text3); font-size: .8em; padding: 40px
             <div class="subtitle">Drag & drop a zip, folder, or individual .ini files</div>
             <div class="formats">
                 <span>car.ini</span><span>suspensions.ini</span><span>tyres.ini</span>
-                <span>drivetrain.ini</span><span>brakes.ini</span><span>.zip</span>
+                <span>drivetrain.ini</span><span>brakes.ini</span><span>.zip</span><span>.7z</span>
             </div>
             <input type="file" id="fileInput" multiple>
             <input type="file" id="folderInput" webkitdirectory multiple>
@@ -673,7 +672,7 @@ folderInput.addEventListener('change', e => handleFileInput(e.target.files));
 async function handleDrop(dt) {
     // Check for zip
     const files = dt.files;
-    if (files.length === 1 && files[0].name.toLowerCase().endsWith('.zip')) {
+    if (files.length === 1 && /\.(zip|7z)$/.test(files[0].name.toLowerCase())) {
         await uploadZip(files[0]);
         return;
     }
@@ -718,7 +717,7 @@ function traverseEntry(entry, result) {
 }
 
 async function handleFileInput(files) {
-    if (files.length === 1 && files[0].name.toLowerCase().endsWith('.zip')) {
+    if (files.length === 1 && /\.(zip|7z)$/.test(files[0].name.toLowerCase())) {
         await uploadZip(files[0]);
     } else {
         await uploadFiles(Array.from(files));
@@ -794,7 +793,7 @@ function renderParts() {
     document.getElementById('carBanner').innerHTML = `
         <div>
             <div class="name">${c.name || c.model || 'Unknown Car'}</div>
-            <div class="detail">${c.make} ${c.model}${c.chassis ? ' · '+c.chassis : ''}${c.year ? ' · '+c.year : ''}</div>
+            <div class="detail">${c.make} ${c.model}${c.chassis ? ' · '+c.chassis : ''}${c.year ? ' · '+c.year : ''}${c.identified_by === 'fingerprint' ? ' · best guess from physics' : ''}</div>
         </div>
         <div class="stats">
             <span class="stat">${s.total_mass} kg</span>
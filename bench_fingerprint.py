@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark physics-fingerprint lookups against large reference sets.
+
+Builds synthetic reference sets by jittering the cars in CAR_DATABASE,
+checks that FingerprintIndex.nearest returns the same cars as a brute
+force scan, and times queries at several reference counts.
+"""
+import sys
+import time
+import random
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+from car_database import CAR_DATABASE
+from src.fingerprint import FingerprintIndex, SCALES, DRIVETRAIN_PENALTY, _drivetrain_group
+
+
+def synthetic_refs(count, rng):
+    """count reference cars spread around the real ones."""
+    base = list(CAR_DATABASE.values())
+    refs = []
+    for i in range(count):
+        car = rng.choice(base)
+        refs.append((
+            f"ref_{i}",
+            car['mass_kg'] * rng.uniform(0.7, 1.4),
+            car['wheelbase_m'] * rng.uniform(0.9, 1.1),
+            car['track_f_m'] * rng.uniform(0.93, 1.07),
+            car['track_r_m'] * rng.uniform(0.93, 1.07),
+            rng.choice(('RWD', 'RWD', 'AWD', 'FWD')),
+        ))
+    return refs
+
+
+def brute_force(refs, query, k):
+    *values, drivetrain = query
+    scored = []
+    for key, *features, ref_dt in refs:
+        d2 = sum(((q - f) / s) ** 2 for q, f, s in zip(values, features, SCALES))
+        if _drivetrain_group(ref_dt) != _drivetrain_group(drivetrain):
+            d2 += DRIVETRAIN_PENALTY ** 2
+        scored.append((d2, key))
+    return [key for _, key in sorted(scored)[:k]]
+
+
+if __name__ == '__main__':
+    rng = random.Random(42)
+    k = 5
+    print(f"🧬 Fingerprint lookups, k={k}\n")
+    for count in (1_000, 10_000, 50_000):
+        refs = synthetic_refs(count, rng)
+        index = FingerprintIndex()
+        start = time.perf_counter()
+        for key, mass, wb, tf, tr, dt in refs:
+            index.add(key, 'Make', 'Model', mass, wb, tf, tr, drivetrain=dt)
+        index.nearest(1200, 2.5, 1.5, 1.5, 'RWD')  # builds the trees
+        built = time.perf_counter() - start
+
+        queries = [q[1:] for q in synthetic_refs(200, rng)]
+        for query in queries[:20]:
+            got = [m.key for m in index.nearest(*query, k=k)]
+            want = brute_force(refs, query, k)
+            assert got == want, (query, got, want)
+
+        start = time.perf_counter()
+        for query in queries:
+            index.nearest(*query, k=k)
+        per_query = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        for query in queries[:5]:
+            brute_force(refs, query, k)
+        per_brute = (time.perf_counter() - start) / 5
+        print(f"  {count:>6} refs  build {built*1000:7.1f} ms   query {per_query*1e6:6.0f} µs   "
+              f"brute force {per_brute*1e3:7.1f} ms")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Benchmark fleet queries on a columnar FleetStore against a loop over records.
+
+Analyzes every car in the pack corpus (docs/data/*.json), grows that into
+a synthetic fleet by jittering the numeric columns, saves it as .npy and
+reopens it memory-mapped. Then runs the same filter + aggregation as
+vectorized masks and as a plain loop over record dicts.
+"""
+import sys
+import json
+import time
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+from src.analyzer import CarPipeline, report_record
+from src.fleet_store import FleetStore
+from src.ini_parser import parse_ini_string
+
+
+def pack_records():
+    """report_record() of every car in docs/data/*.json."""
+    records = []
+    for pack in sorted((ROOT / 'docs' / 'data').glob('*.json')):
+        data = json.loads(pack.read_text(encoding='utf-8'))
+        if not isinstance(data, dict):
+            continue
+        for name, car in data.get('cars', {}).items():
+            files = {f: parse_ini_string(text) for f, text in car.get('files', {}).items()
+                     if f.endswith('.ini')}
+            if 'car.ini' not in files:
+                continue
+            report = CarPipeline(Path(tempfile.gettempdir()) / '_no_such_car', files=files,
+                                 folder_name=name).report
+            records.append({'path': f"{pack.stem}/{name}", **report_record(report)})
+    return records
+
+
+def grow(store: FleetStore, size: int, rng) -> FleetStore:
+    """A fleet of `size` cars drawn from store, numeric columns jittered ±10%."""
+    data = store.data[rng.integers(0, len(store), size)].copy()
+    for name in data.dtype.names:
+        if data.dtype[name].kind == 'f':
+            data[name] *= rng.uniform(0.9, 1.1, size)
+    data['path'] = [f"car_{i:06d}" for i in range(size)]
+    return FleetStore(data)
+
+
+def query_loop(records):
+    rwd = [r for r in records if r['drivetrain_type'] == 'RWD' and r['wheelbase'] <= 2.5
+           and r['front_spring_rate'] >= 60000]
+    by_make = {}
+    for r in records:
+        by_make.setdefault(r['make'], []).append(r['total_mass'])
+    return len(rwd), {m: sum(v) / len(v) for m, v in by_make.items()}
+
+
+def filter_store(store):
+    return int(store.mask(drivetrain_type='RWD', wheelbase=(None, 2.5), front_spring_rate=(60000, None)).sum())
+
+
+def aggregate_store(store):
+    return {m: s['mean'] for m, s in store.aggregate('total_mass', by='make').items()}
+
+
+def timed(fn, *args, rounds=5):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        result = fn(*args)
+    return (time.perf_counter() - start) / rounds, result
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(7)
+    base = FleetStore.from_records(pack_records())
+    print(f"🗄  {len(base)} pack cars, {len(base.columns)} columns\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (10_000, 100_000):
+            fleet = grow(base, size, rng)
+            path = Path(tmp) / f'fleet_{size}.npy'
+            fleet.save(path)
+
+            opened, store = timed(FleetStore.load, path)
+            records = store.records()
+            t_loop, (n_loop, means_loop) = timed(query_loop, records)
+            t_first, _ = timed(aggregate_store, store, rounds=1)
+            t_filter, n_store = timed(filter_store, store)
+            t_agg, means_store = timed(aggregate_store, store)
+            assert n_loop == n_store
+            assert all(abs(means_loop[m] - means_store[m]) < 1e-6 * abs(means_loop[m]) for m in means_loop)
+
+            print(f"  {size:>7} cars, {path.stat().st_size / 1e6:.1f} MB, opened in {opened*1000:.2f} ms, "
+                  f"{n_store} matches")
+            print(f"           loop over records      {t_loop*1000:7.1f} ms")
+            print(f"           store filter           {t_filter*1000:7.2f} ms")
+            print(f"           store mean by make     {t_agg*1000:7.2f} ms ({t_first*1000:.1f} ms the first time)")
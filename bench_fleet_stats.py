@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Benchmark fleet statistics: per-group distributions and z-score outliers
+from fleet_stats against the same numbers from a loop over records.
+
+Uses bench_fleet's synthetic fleet (the pack corpus, jittered and grown),
+grouped by make.
+"""
+import math
+import statistics
+
+import numpy as np
+
+from bench_fleet import pack_records, grow, timed
+from src.fleet_store import FleetStore
+from src.fleet_stats import distributions, outliers
+
+
+def stats_loop(records, by, threshold):
+    """nat_freq_f mean/std/median per group, and its outliers, one car at a time."""
+    groups = {}
+    for r in records:
+        wdf = r['cg_location']
+        sprung = r['total_mass'] - 2 * r['front_hub_mass'] - 2 * r['rear_hub_mass']
+        m, k = sprung * wdf / 2, r['front_spring_rate']
+        if 0 < wdf < 1 and m > 0 and k > 0:
+            groups.setdefault(r[by], []).append((r['path'], math.sqrt(k / m) / (2 * math.pi)))
+    table, found = {}, []
+    for g, cars in groups.items():
+        values = [v for _, v in cars]
+        mean, std = statistics.fmean(values), statistics.pstdev(values)
+        table[g] = (mean, std, statistics.median(values))
+        if len(values) >= 5 and std > 0:
+            found += [p for p, v in cars if abs(v - mean) / std >= threshold]
+    return table, found
+
+
+def stats_store(store, by, threshold):
+    dist = distributions(store, by=by, metrics=('nat_freq_f',))
+    table = {g: (t['nat_freq_f']['mean'], t['nat_freq_f']['std'], t['nat_freq_f']['median'])
+             for g, t in dist.items() if t['nat_freq_f']['count']}
+    found = [o['path'] for o in outliers(store, by=by, metrics=('nat_freq_f',), threshold=threshold)]
+    return table, found
+
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(7)
+    base = FleetStore.from_records(pack_records())
+    print(f"🗄  {len(base)} pack cars\n")
+
+    for size in (10_000, 100_000):
+        store = grow(base, size, rng)
+        records = store.records()
+        t_loop, (table_loop, found_loop) = timed(stats_loop, records, 'make', 2.0, rounds=3)
+        t_store, (table_store, found_store) = timed(stats_store, store, 'make', 2.0, rounds=3)
+        t_all, _ = timed(distributions, store, 'make', rounds=3)
+        assert table_loop.keys() == table_store.keys()
+        assert all(abs(a - b) < 1e-9 for g in table_loop for a, b in zip(table_loop[g], table_store[g]))
+        assert sorted(found_loop) == sorted(found_store)
+
+        print(f"  {size:>7} cars, {len(table_store)} makes, {len(found_store)} nat_freq_f outliers")
+        print(f"           loop over records      {t_loop*1000:7.1f} ms")
+        print(f"           fleet_stats            {t_store*1000:7.1f} ms")
+        print(f"           all metrics by make    {t_all*1000:7.1f} ms")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Benchmark make/chassis keyword matching over the catalog's car names.
+
+Checks that _identify_from_name and catalog_app.parse_car_name give the
+same answers as the per-keyword substring loops they used before
+KeywordMatcher for every name in catalog/cars.csv. Then times the
+keyword lookup alone, loops against matchers.
+"""
+import csv
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+from src.car_detector import (CHASSIS_CODES, KNOWN_MAKES, CarIdentity, _identify_from_name,
+                               _CHASSIS_MATCHER, _MAKE_MATCHER)
+from catalog_app import CAR_MAKES, MAKE_MATCHER, parse_car_name
+
+
+def load_names():
+    with open(ROOT / 'catalog' / 'cars.csv', newline='') as f:
+        return [row['Name'] for row in csv.DictReader(f)]
+
+
+def loop_identify(name):
+    """The keyword loops _identify_from_name ran before, for comparison."""
+    name_lower = name.lower().strip()
+    for code in CHASSIS_CODES:
+        if code in name_lower.replace('-', '').replace(' ', ''):
+            return ('code', code)
+    for alias, make in KNOWN_MAKES.items():
+        if alias in name_lower:
+            return ('make', make)
+    return None
+
+
+def identified(name):
+    identity = CarIdentity()
+    _identify_from_name(identity, name, 'bench')
+    if identity.chassis_code:
+        return ('code', identity.chassis_code.lower())
+    if identity.confidence == 0.7:
+        return ('make', identity.make)
+    return None
+
+
+def matcher_identify(name):
+    """The same lookup through the shared matchers."""
+    name_lower = name.lower().strip()
+    hit = _CHASSIS_MATCHER.match(name_lower.replace('-', '').replace(' ', ''))
+    if hit:
+        return ('code', hit[0])
+    hit = _MAKE_MATCHER.match(name_lower)
+    return ('make', hit[1]) if hit else None
+
+
+def loop_make(name):
+    """The nested make loop parse_car_name ran before."""
+    for make, keywords in CAR_MAKES.items():
+        for kw in keywords:
+            if kw.lower() in name.lower():
+                return make
+    return "Other"
+
+
+def timed(fn, names, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for name in names:
+            fn(name)
+    return (time.perf_counter() - start) / (rounds * len(names))
+
+
+if __name__ == '__main__':
+    names = load_names()
+    rounds = 50
+
+    mismatches = [n for n in names if loop_identify(n) != identified(n)]
+    mismatches += [n for n in names if loop_make(n) != parse_car_name(n)[0]]
+    assert not mismatches, mismatches
+    print(f"🏷  {len(names)} catalog names, same results as the keyword loops\n")
+
+    for label, old, new in (
+        ('_identify_from_name', loop_identify, matcher_identify),
+        ('parse_car_name make', loop_make, lambda n: (MAKE_MATCHER.match(n) or (None, "Other"))[1]),
+    ):
+        t_old = timed(old, names, rounds)
+        t_new = timed(new, names, rounds)
+        print(f"  {label:<22} loops {t_old*1e6:6.1f} µs/name   "
+              f"matcher {t_new*1e6:6.1f} µs/name   ({t_old / t_new:.1f}x)")
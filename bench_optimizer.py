@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""Benchmark optimize_build, checked against a brute-force sweep.
+
+On the real catalog, the optimizer's builds must match the cheapest rows
+of sweep_physics over every combination. Then every parts table is grown
+tenfold with jittered copies of its parts and the queries are timed again.
+"""
+import sys
+import time
+import random
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from build_optimizer import optimize_build, _Search
+from physics_engine import SWEEP_AXES, sweep_physics
+
+CAR = 'nissan_s13_sr20'
+QUERIES = {
+    'freq + lock': {'natural_freq_f': 2.1, 'natural_freq_r': 2.0, 'max_angle': (60, None)},
+    'grip + brakes': {'grip_mult': (1.3, None), 'brake_torque': (1500, None), 'tire_radius_r': (None, 0.32)},
+    'full build': {'natural_freq_f': (2.0, 2.6), 'steer_lock': (500, None), 'diff_power': (0.9, None),
+                   'tire_width_r': (0.25, None), 'hub_mass_f': (None, 45)},
+    'impossible': {'natural_freq_f': 9.0},
+}
+
+
+def brute_force(targets, top=5):
+    full = sweep_physics(CAR, wheels_r=list(SWEEP_AXES['wheels_r']))
+    search = _Search(CAR, targets, top, 0.05, {}, {})
+    ok, miss = search.score(full, list(targets))
+    cost = sum(search.cost(axis, full[axis]) for axis in SWEEP_AXES)
+    rows = np.flatnonzero(ok)
+    best = rows[np.lexsort((miss[rows], cost[rows]))][:top]
+    return [(float(cost[i]), round(float(miss[i]), 9)) for i in best]
+
+
+def grow_catalog(factor, rng):
+    """Add factor-1 jittered copies of every part (stock parts excepted)."""
+    for table in {id(t): t for t in SWEEP_AXES.values()}.values():
+        for part_id, part in list(table.items()):
+            if part_id in ('stock', 'street'):
+                continue
+            for n in range(1, factor):
+                copy = {key: value * rng.uniform(0.9, 1.1) if isinstance(value, float) and key != 'bias'
+                        else value for key, value in part.items()}
+                table[f"{part_id}_{n}"] = copy
+
+
+def timed(targets, rounds=5):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        builds = optimize_build(CAR, targets)
+    return (time.perf_counter() - start) / rounds, builds
+
+
+if __name__ == '__main__':
+    for name, targets in QUERIES.items():
+        t, builds = timed(targets)
+        assert [(b.cost, round(b.miss, 9)) for b in builds] == brute_force(targets), name
+        print(f"🔧 {name:<14} {len(builds)} build(s), cheapest {builds[0].cost if builds else '-'}, "
+              f"{t*1000:.1f} ms (matches brute force)")
+
+    grow_catalog(10, random.Random(7))
+    sizes = ' × '.join(str(len(t)) for t in SWEEP_AXES.values())
+    print(f"\n📦 catalog ×10: {sizes} parts")
+    for name, targets in QUERIES.items():
+        t, builds = timed(targets)
+        print(f"🔧 {name:<14} {len(builds)} build(s), cheapest {builds[0].cost if builds else '-'}, {t*1000:.1f} ms")
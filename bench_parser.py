@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""Benchmark the INI parser against the pack corpus in docs/data/*.json."""
+import sys
+import re
+import json
+import time
+import tracemalloc
+from bisect import bisect_right
+from pathlib import Path
+from collections import OrderedDict
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+from src.ini_parser import (
+    parse_ini_string, parse_ini_bytes, parse_lut_string, get_value, LutTable, _parse_value,
+    IncrementalParser,
+)
+
+
+def load_corpus(ext='.ini'):
+    """Collect every file body with the given extension from the pack JSONs."""
+    files = []
+    for pack in sorted((ROOT / 'docs' / 'data').glob('*.json')):
+        data = json.loads(pack.read_text(encoding='utf-8'))
+        if not isinstance(data, dict):
+            continue  # packs.json is just the index
+        for car_id, car in data.get('cars', {}).items():
+            for name, content in car.get('files', {}).items():
+                if name.lower().endswith(ext) and content:
+                    files.append((f"{pack.stem}/{car_id}/{name}", content))
+    return files
+
+
+def parse_ini_string_regex(content: str) -> dict:
+    """The original per-line re.match parser, kept as the reference."""
+    sections = OrderedDict()
+    current_section = None
+    for line in content.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        section_match = re.match(r'^\[(.+)\]$', line)
+        if section_match:
+            current_section = section_match.group(1)
+            if current_section not in sections:
+                sections[current_section] = OrderedDict()
+            continue
+        if current_section is None:
+            continue
+        kv_match = re.match(r'^([A-Za-z0-9_]+)\s*=\s*(.*?)(?:\s*;(.*))?$', line)
+        if kv_match:
+            key = kv_match.group(1)
+            value = kv_match.group(2).strip()
+            comment = kv_match.group(3).strip() if kv_match.group(3) else None
+            entry = {'raw': value, 'value': _parse_value(value)}
+            if comment:
+                entry['comment'] = comment
+            if key in sections[current_section]:
+                n = 2
+                while f"{key}_{n}" in sections[current_section]:
+                    n += 1
+                key = f"{key}_{n}"
+            sections[current_section][key] = entry
+    return sections
+
+
+def timed(fn, corpus, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _, content in corpus:
+            fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_tokenizer(corpus, rounds=5):
+    for name, content in corpus:
+        if parse_ini_string(content) != parse_ini_string_regex(content):
+            raise AssertionError(f"Parser mismatch on {name}")
+    old = timed(parse_ini_string_regex, corpus, rounds)
+    new = timed(parse_ini_string, corpus, rounds)
+    print(f"  re.match per line : {old*1000:8.1f} ms")
+    print(f"  compiled tokenizer: {new*1000:8.1f} ms  ({old/new:.2f}x)")
+
+
+def bench_lazy(corpus, rounds=5):
+    """Full parse vs lazy parse when only a handful of keys are read."""
+    def read_few(doc):
+        get_value(doc, 'BASIC', 'TOTALMASS')
+        get_value(doc, 'BASIC', 'WHEELBASE')
+        get_value(doc, 'FRONT', 'SPRING_RATE')
+        get_value(doc, 'REAR', 'SPRING_RATE')
+    full = timed(lambda c: read_few(parse_ini_string(c)), corpus, rounds)
+    lazy = timed(lambda c: read_few(parse_ini_string(c, lazy=True)), corpus, rounds)
+    print(f"  full parse + 4 keys: {full*1000:8.1f} ms")
+    print(f"  lazy parse + 4 keys: {lazy*1000:8.1f} ms  ({full/lazy:.2f}x)")
+
+
+def bench_bytes(corpus, rounds=5):
+    """Text-mode decode + parse vs parsing the raw bytes, reading a few keys.
+    
+    The bytes path also sniffs the encoding, which the UTF-8 text path skips.
+    """
+    raw = [(name, content.encode('utf-8')) for name, content in corpus]
+    def read_few(doc):
+        get_value(doc, 'BASIC', 'TOTALMASS')
+        get_value(doc, 'FRONT', 'SPRING_RATE')
+    text = timed(lambda b: read_few(parse_ini_string(b.decode('utf-8', 'replace'), lazy=True)), raw, rounds)
+    full = timed(lambda b: read_few(parse_ini_bytes(b)), raw, rounds)
+    lazy = timed(lambda b: read_few(parse_ini_bytes(b, lazy=True)), raw, rounds)
+    print(f"  decode + lazy str   : {text*1000:8.1f} ms")
+    print(f"  parse_ini_bytes     : {full*1000:8.1f} ms")
+    print(f"  parse_ini_bytes lazy: {lazy*1000:8.1f} ms")
+
+
+def bench_incremental(corpus, rounds=5):
+    """Re-parse after editing one value: full parse vs IncrementalParser."""
+    edits = []
+    for name, content in corpus:
+        i = content.find('=')
+        if i > 0:
+            edits.append((name, content, content[:i + 1] + '9' + content[i + 1:]))
+    parsers = []
+    for _, content, _ in edits:
+        parser = IncrementalParser()
+        parser.update(content)
+        parsers.append(parser)
+    
+    best_full = best_inc = float('inf')
+    for r in range(rounds):
+        start = time.perf_counter()
+        for _, content, edited in edits:
+            parse_ini_string(edited if r % 2 else content)
+        best_full = min(best_full, time.perf_counter() - start)
+        start = time.perf_counter()
+        for parser, (_, content, edited) in zip(parsers, edits):
+            parser.update(content if r % 2 else edited)
+        best_inc = min(best_inc, time.perf_counter() - start)
+    print(f"  full re-parse     : {best_full*1000:8.1f} ms")
+    print(f"  IncrementalParser : {best_inc*1000:8.1f} ms  ({best_full/best_inc:.2f}x)")
+
+
+def bench_memory(corpus):
+    """Bytes held by every parsed file kept alive at once, dict vs compact."""
+    def held(**kwargs):
+        tracemalloc.start()
+        docs = [parse_ini_string(c, **kwargs) for _, c in corpus]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        keys = sum(len(sec) for doc in docs for sec in doc.values())
+        return size, keys
+    size_dict, keys = held()
+    size_compact, _ = held(compact=True)
+    print(f"  dict entries   : {size_dict/1e6:6.1f} MB  ({size_dict/keys:5.0f} B/key)")
+    print(f"  compact entries: {size_compact/1e6:6.1f} MB  ({size_compact/keys:5.0f} B/key)"
+          f"  ({size_dict/size_compact:.2f}x smaller)")
+
+
+def interp_points(points, x):
+    """Per-point pure Python LUT lookup, the baseline for LutTable.interp."""
+    xs = [p[0] for p in points]
+    i = bisect_right(xs, x)
+    if i == 0:
+        return points[0][1]
+    if i == len(points):
+        return points[-1][1]
+    (x0, y0), (x1, y1) = points[i - 1], points[i]
+    return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+
+
+def bench_lut(corpus, samples=2000):
+    tables = [parse_lut_string(c) for _, c in corpus]
+    tables = [t for t in tables if len(t) > 1 and all(a[0] < b[0] for a, b in zip(t, t[1:]))]
+    
+    start = time.perf_counter()
+    for points in tables:
+        lo, hi = points[0][0], points[-1][0]
+        step = (hi - lo) / (samples - 1)
+        for i in range(samples):
+            interp_points(points, lo + i * step)
+    old = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for points in tables:
+        table = LutTable.from_points(points)
+        table.interp(np.linspace(table.x[0], table.x[-1], samples))
+    new = time.perf_counter() - start
+    print(f"  {len(tables)} tables x {samples} samples")
+    print(f"  per-point Python : {old*1000:8.1f} ms")
+    print(f"  LutTable.interp  : {new*1000:8.1f} ms  ({old/new:.0f}x)")
+
+
+if __name__ == '__main__':
+    corpus = load_corpus('.ini')
+    size_mb = sum(len(c) for _, c in corpus) / 1e6
+    print(f"📦 Corpus: {len(corpus)} INI files, {size_mb:.1f} MB\n")
+    print("⏱  parse_ini_string (best of 5)")
+    bench_tokenizer(corpus)
+    print("\n⏱  Lazy documents (best of 5)")
+    bench_lazy(corpus)
+    print("\n⏱  Parsing from bytes (best of 5)")
+    bench_bytes(corpus)
+    print("\n⏱  Re-parse after a one-value edit (best of 5)")
+    bench_incremental(corpus)
+    print(f"\n💾 Memory for all {len(corpus)} files held at once")
+    bench_memory(corpus)
+    
+    try:
+        import numpy as np
+    except ImportError:
+        print("\n(numpy not installed, skipping LutTable benchmark)")
+    else:
+        print("\n📈 LUT evaluation")
+        bench_lut(load_corpus('.lut'))
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""Count the filesystem calls scan_folder/analyze_car make per car folder.
+
+Builds one car folder per supported layout in a temp dir from the first
+car of the pack corpus, then counts the os-level calls (scandir, listdir,
+stat, lstat) that scanning each one triggers, and times a scan loop.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+from pathlib import Path
+from collections import Counter
+
+ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(ROOT))
+
+from src.folder_scanner import scan_folder, scan_library
+from src.analyzer import CarPipeline, analyze_car
+from src.car_detector import detect_car
+from src.ini_parser import PARSE_CACHE
+
+COUNTED = ('scandir', 'listdir', 'stat', 'lstat')
+
+
+def sample_car():
+    """File name → content of the first car in docs/data/*.json."""
+    for pack in sorted((ROOT / 'docs' / 'data').glob('*.json')):
+        data = json.loads(pack.read_text(encoding='utf-8'))
+        if isinstance(data, dict):
+            for car in data.get('cars', {}).values():
+                if 'car.ini' in car.get('files', {}):
+                    return car['files']
+    raise SystemExit("No car found in docs/data")
+
+
+def build_layouts(base: Path, files: dict) -> dict:
+    """One folder per layout, each holding the same physics files."""
+    def write(directory, prefix=''):
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, content in files.items():
+            (directory / f"{prefix}{name}").write_text(content, encoding='utf-8')
+
+    layouts = {
+        'standard': base / 'standard',
+        'prefixed': base / 'prefixed',
+        'nested': base / 'nested',
+        'flat': base / 'flat',
+        'flat prefixed': base / 'flat_prefixed',
+    }
+    write(layouts['standard'] / 'data')
+    write(layouts['prefixed'] / 'data', 'BMW_E46_')
+    write(layouts['nested'] / 'data' / 'data')
+    write(layouts['nested'] / 'data', 'BMW_E46_')
+    write(layouts['flat'])
+    write(layouts['flat prefixed'], 'BMW_E46_')
+    for path in layouts.values():
+        (path / 'ui').mkdir(exist_ok=True)
+        (path / 'ui' / 'ui_car.json').write_text('{}')
+    return layouts
+
+
+def count_calls(fn):
+    """Run fn() with the os functions in COUNTED wrapped; return the counts."""
+    counts = Counter()
+    originals = {name: getattr(os, name) for name in COUNTED}
+
+    def wrap(name, original):
+        def counted(*args, **kwargs):
+            counts[name] += 1
+            return original(*args, **kwargs)
+        return counted
+
+    for name, original in originals.items():
+        setattr(os, name, wrap(name, original))
+    try:
+        fn()
+    finally:
+        for name, original in originals.items():
+            setattr(os, name, original)
+    return counts
+
+
+def analyzer_scans(path):
+    """The two scans analyze_car does, without its file parsing."""
+    listings = {}
+    scan_folder(path, listings)
+    scan_folder(path / 'data', listings)
+
+
+def with_latency(fn, seconds):
+    """Run fn() with every os.scandir() delayed, like a network share."""
+    original = os.scandir
+
+    def slow_scandir(*args, **kwargs):
+        time.sleep(seconds)
+        return original(*args, **kwargs)
+
+    os.scandir = slow_scandir
+    try:
+        return fn()
+    finally:
+        os.scandir = original
+
+
+def bench_library(base: Path, files: dict, cars=200, latency=0.002):
+    """scan_library over a synthetic library at several worker counts."""
+    library = base / 'cars'
+    for i in range(cars):
+        data = library / f"car_{i:04d}" / 'data'
+        data.mkdir(parents=True)
+        for name, content in files.items():
+            (data / name).write_text(content, encoding='utf-8')
+
+    print(f"  {cars} car folders, {latency*1000:.0f} ms added per scandir")
+    for workers in (0, 1, 4, 16, 32):
+        scan = scan_library(library, workers=workers)
+        valid = with_latency(lambda: sum(r.is_valid for r in scan), latency)
+        assert valid == cars
+        print(f"  workers={workers:<3} {scan.elapsed*1000:8.1f} ms  ({scan.rate:6.0f} cars/s)")
+
+
+def bench_pipeline(path: Path, rounds=300):
+    """Identity + report for one car: separately vs one shared CarPipeline,
+    each round with a cold parse cache."""
+    def separate():
+        detect_car(path / 'data')
+        analyze_car(path)
+
+    def shared():
+        pipeline = CarPipeline(path)
+        pipeline.identity
+        pipeline.report
+
+    for label, fn in (('detect_car + analyze_car', separate), ('CarPipeline', shared)):
+        PARSE_CACHE.clear()
+        before = PARSE_CACHE.stats()
+        calls = count_calls(fn)
+        after = PARSE_CACHE.stats()
+        parses = after['misses'] - before['misses']
+        lookups = parses + after['hits'] - before['hits']
+        elapsed = 0.0
+        for _ in range(rounds):
+            PARSE_CACHE.clear()
+            start = time.perf_counter()
+            fn()
+            elapsed += time.perf_counter() - start
+        print(f"  {label:<26} {elapsed / rounds * 1e6:7.0f} µs/car   "
+              f"{parses} parses, {lookups} cache lookups, {sum(calls.values())} fs calls")
+
+
+def fmt(counts):
+    total = sum(counts.values())
+    parts = ', '.join(f"{name} {counts[name]}" for name in COUNTED if counts[name])
+    return f"{total:3d}  ({parts})"
+
+
+if __name__ == '__main__':
+    files = sample_car()
+    with tempfile.TemporaryDirectory() as tmp:
+        layouts = build_layouts(Path(tmp), files)
+
+        print(f"🔍 Filesystem calls per car ({len(files)} files each)\n")
+        print(f"  {'layout':<14} {'scan_folder':<40} analyze_car scan")
+        for layout, path in layouts.items():
+            scan = count_calls(lambda: scan_folder(path))
+            both = count_calls(lambda: analyzer_scans(path))
+            print(f"  {layout:<14} {fmt(scan):<40} {fmt(both)}")
+
+        rounds = 500
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for path in layouts.values():
+                scan_folder(path)
+        elapsed = time.perf_counter() - start
+        print(f"\n⏱  {rounds * len(layouts)} scans: {elapsed*1000:.1f} ms "
+              f"({elapsed / (rounds * len(layouts)) * 1e6:.0f} µs/scan)")
+
+        analyze_car(layouts['standard'])  # smoke check the full path
+
+        print("\n🚗 Identity + report")
+        bench_pipeline(layouts['standard'])
+
+        print("\n📚 scan_library")
+        bench_library(Path(tmp), files)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Benchmark sweep_physics against a loop of generate_physics calls.
+
+Evaluates every compatible parts combination for a few cars both ways,
+checks the sweep reproduces the values generate_physics writes, and
+times them.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from physics_engine import generate_physics, sweep_physics
+
+CARS = ('nissan_s13_sr20', 'bmw_e46_m3', 'nissan_z33')
+SELECTION_KEYS = ('coilovers', 'angle_kit', 'wheels_f', 'wheels_r', 'brakes', 'diff', 'tire_compound')
+
+
+def loop(car_id, table):
+    rows = []
+    for i in range(len(table['coilovers'])):
+        selection = {key: str(table[key][i]) for key in SELECTION_KEYS}
+        rows.append(generate_physics(car_id, selection))
+    return rows
+
+
+def check(table, rows):
+    """The sweep's columns against what generate_physics writes, row by row."""
+    for i, out in enumerate(rows):
+        susp, tyres, s = out['changes']['suspensions.ini'], out['changes']['tyres.ini'], out['summary']
+        expected = {
+            'spring_rate_f': susp['FRONT_SPRING']['RATE'], 'spring_rate_r': susp['REAR_SPRING']['RATE'],
+            'damp_bump_f': susp['FRONT_DAMPER']['DAMP_BUMP'],
+            'damp_fast_rebound_r': susp['REAR_DAMPER']['DAMP_FAST_REBOUND'],
+            'arb_f': susp['ARB']['FRONT'], 'arb_r': susp['ARB']['REAR'],
+            'hub_mass_f': susp['FRONT']['HUB_MASS'], 'tire_radius_r': tyres['REAR']['RADIUS'],
+            'grip_mult': tyres['FRONT']['FRICTION_LIMIT_GRIP'],
+            'natural_freq_f': s['natural_freq_f'], 'natural_freq_r': s['natural_freq_r'],
+            'steer_lock': out['changes']['car.ini']['CONTROLS']['STEER_LOCK'], 'max_angle': s['max_angle'],
+            'brake_torque': out['changes']['brakes.ini']['DATA']['MAX_TORQUE'],
+            'diff_preload': out['changes']['drivetrain.ini']['DIFFERENTIAL']['PRELOAD'],
+        }
+        for name, value in expected.items():
+            got = table[name][i]
+            if name.startswith('spring') or name == 'steer_lock':
+                got = int(got)
+            elif name.startswith('natural'):
+                got = round(float(got), 2)
+            elif name in ('hub_mass_f', 'tire_radius_r'):
+                got = round(float(got), 4)
+            assert got == value, (i, name, got, value)
+
+
+if __name__ == '__main__':
+    for car_id in CARS:
+        start = time.perf_counter()
+        table = sweep_physics(car_id)
+        t_sweep = time.perf_counter() - start
+        n = len(table['coilovers'])
+
+        start = time.perf_counter()
+        rows = loop(car_id, table)
+        t_loop = time.perf_counter() - start
+        check(table, rows)
+
+        best = int(np.argmax(table['natural_freq_f']))
+        print(f"🔧 {car_id}: {n} combinations")
+        print(f"     generate_physics loop  {t_loop*1000:8.1f} ms")
+        print(f"     sweep_physics          {t_sweep*1000:8.1f} ms ({t_loop / t_sweep:.0f}x)")
+        print(f"     stiffest front: {table['coilovers'][best]} at {table['natural_freq_f'][best]:.2f} Hz")
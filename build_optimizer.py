@@ -0,0 +1,288 @@
+"""
+Build Optimizer — Finds the cheapest parts builds for a car that hit
+physics targets, e.g. "2.2 Hz front / 2.0 Hz rear with at least 60° lock".
+
+Candidate parts are scored in batches with physics_engine.sweep_physics,
+then combined by branch-and-bound on price: a partial build is dropped as
+soon as its cost plus the cheapest way to finish it can't beat the N-th
+best build found so far.
+"""
+import heapq
+import itertools
+from dataclasses import dataclass, field
+
+from car_database import get_car
+from parts_database import get_compatible_parts
+from physics_engine import SWEEP_AXES, sweep_physics, np
+
+
+# Cost of a part by its price_tier
+PRICE_TIER_COST = {"stock": 0, "budget": 1, "mid": 2, "premium": 3, "race": 4}
+# Tier of a part without one (the stock part of each axis is "stock")
+DEFAULT_TIER = "mid"
+STOCK_PARTS = {axis: "stock" for axis in SWEEP_AXES}
+STOCK_PARTS["tire_compound"] = "street"
+
+# The part axes each sweep_physics column depends on. Angle kits and brake
+# kits only reach the suspension through the front hub mass they add.
+_HUB = ("angle_kit", "brakes")
+COLUMN_AXES = {
+    "tire_width_f": ("wheels_f",), "tire_radius_f": ("wheels_f",),
+    "tire_width_r": ("wheels_r",), "tire_radius_r": ("wheels_r",),
+    "grip_mult": ("tire_compound", "wheels_f"),
+    "dx_ref": ("tire_compound", "wheels_f"), "dy_ref": ("tire_compound", "wheels_f"),
+    "hub_mass_f": _HUB, "hub_mass_r": (), "sprung_f_corner": _HUB, "sprung_r_corner": _HUB,
+    "spring_rate_f": ("coilovers",), "spring_rate_r": ("coilovers",),
+    "arb_f": ("coilovers",), "arb_r": ("coilovers",),
+    **{f"{name}_{axle}": ("coilovers",) + _HUB
+       for name in ("natural_freq", "damp_bump", "damp_fast_bump", "damp_rebound", "damp_fast_rebound")
+       for axle in ("f", "r")},
+    "max_angle": ("angle_kit",), "steer_lock": ("angle_kit",),
+    "brake_torque": ("brakes",), "brake_bias": ("brakes",),
+    "diff_power": ("diff",), "diff_coast": ("diff",), "diff_preload": ("diff",),
+}
+
+# Parts groups that no target couples together, each searched on its own
+_GROUPS = {
+    "chassis": ("coilovers", "angle_kit", "brakes"),
+    "front": ("wheels_f", "tire_compound"),
+    "rear": ("wheels_r",),
+    "diff": ("diff",),
+}
+
+
+@dataclass
+class Build:
+    """One parts selection meeting every target."""
+    parts: dict               # parts_selection for generate_physics
+    cost: float
+    miss: float               # summed relative distance from point targets
+    values: dict = field(default_factory=dict)  # the targeted values
+
+
+def optimize_build(car_id, targets, top=5, tolerance=0.05, parts=None, costs=None):
+    """
+    The `top` cheapest builds for a car that meet every target.
+
+    targets: {sweep_physics column: target}. A number must be hit within
+    `tolerance` (relative); a (low, high) tuple is an inclusive range, None
+    on either side leaving it open. E.g.
+        {"natural_freq_f": 2.2, "natural_freq_r": 2.0, "max_angle": (60, None)}
+    parts: optional {axis: [part ids]} to search instead of every
+    compatible part (ids the car can't take are dropped). costs: optional {axis: {part id: cost}} overriding
+    the price_tier costs.
+
+    Returns: Builds, cheapest first; equally priced builds closest to the
+    point targets first.
+    """
+    if np is None:
+        raise ImportError("optimize_build needs numpy (pip install numpy)")
+    if not get_car(car_id):
+        raise ValueError(f"Unknown car: {car_id}")
+    if top < 1:
+        raise ValueError(f"top must be at least 1, got {top}")
+    unknown = sorted(set(targets) - set(COLUMN_AXES))
+    if unknown:
+        raise ValueError(f"Unknown target(s): {', '.join(unknown)}")
+    unknown = sorted(set(parts or {}) - set(SWEEP_AXES))
+    if unknown:
+        raise ValueError(f"Unknown part axes: {', '.join(unknown)}")
+
+    search = _Search(car_id, targets, top, tolerance, parts or {}, costs or {})
+    options = [search.chassis(), search.group("front"), search.group("rear"), search.group("diff")]
+    return search.combine(options)
+
+
+class _Search:
+    """State shared by the steps of one optimize_build() call."""
+
+    def __init__(self, car_id, targets, top, tolerance, parts, costs):
+        self.car_id, self.targets, self.top, self.tolerance = car_id, targets, top, tolerance
+        self.costs = costs
+        self.parts = {}
+        for axis, table in SWEEP_AXES.items():
+            compatible = get_compatible_parts(car_id, table)
+            if parts.get(axis) is None:
+                self.parts[axis] = list(compatible)
+                continue
+            # An override narrows the search; it can't add parts the car can't take
+            self.parts[axis] = [part_id for part_id in parts[axis] if part_id in compatible]
+            if not self.parts[axis]:
+                raise ValueError(f"No compatible {axis} part among: {', '.join(map(str, parts[axis]))}")
+        # Each target is checked by the step that sees every axis it depends on
+        self.by_group = {group: [] for group in _GROUPS}
+        for column in targets:
+            axes = set(COLUMN_AXES[column])
+            group = next((g for g, members in _GROUPS.items() if axes and axes <= set(members)), "chassis")
+            self.by_group[group].append(column)
+
+    def cost(self, axis, part_ids):
+        table, override = SWEEP_AXES[axis], self.costs.get(axis, {})
+        out = []
+        for part_id in part_ids:
+            if part_id in override:
+                out.append(override[part_id])
+                continue
+            tier = table.get(part_id, {}).get("price_tier")
+            if tier is None:
+                tier = "stock" if part_id == STOCK_PARTS[axis] else DEFAULT_TIER
+            out.append(PRICE_TIER_COST.get(tier, PRICE_TIER_COST[DEFAULT_TIER]))
+        return np.array(out, dtype=np.float64)
+
+    def sweep(self, **axes):
+        """sweep_physics over the given axes, every other axis stock."""
+        for axis in SWEEP_AXES:
+            axes.setdefault(axis, [STOCK_PARTS[axis]])
+        return sweep_physics(self.car_id, **axes)
+
+    def score(self, table, columns):
+        """(rows meeting every target in columns, summed miss per row)."""
+        n = len(table["coilovers"])
+        ok, miss = np.ones(n, dtype=bool), np.zeros(n)
+        for column in columns:
+            values, target = table[column].astype(np.float64), self.targets[column]
+            if isinstance(target, tuple):
+                low, high = target
+                if low is not None:
+                    ok &= values >= low
+                if high is not None:
+                    ok &= values <= high
+            else:
+                err = np.abs(values - target) / max(abs(target), 1e-9)
+                ok &= err <= self.tolerance
+                miss += err
+        return ok, miss
+
+    def group(self, name):
+        """Options (cost, miss, parts, values) of a group whose parts are
+        all swept together, the `top` cheapest first."""
+        axes, columns = _GROUPS[name], self.by_group[name]
+        table = self.sweep(**{axis: self.parts[axis] for axis in axes})
+        ok, miss = self.score(table, columns)
+        cost = sum(self.cost(axis, table[axis]) for axis in axes)
+        rows = np.flatnonzero(ok)
+        best = rows[np.lexsort((miss[rows], cost[rows]))[:self.top]]
+        return [(float(cost[i]), float(miss[i]),
+                 {axis: str(table[axis][i]) for axis in axes},
+                 {column: table[column][i].item() for column in columns})
+                for i in best]
+
+    def chassis(self):
+        """Options for coilovers × angle kit × brakes.
+
+        Angle and brake kits are first filtered by their own (steering,
+        brake) targets. Every suspension value only rises or only falls with
+        the front hub mass the two kits add, so each coilover is evaluated
+        with the lightest and the heaviest surviving kits first and dropped
+        if even that range misses a suspension target. The rest are swept
+        in blocks of one price per part, cheapest total first, until `top`
+        options are found and no later block could be as cheap.
+        """
+        stage = {"angle_kit": [], "brakes": [], "suspension": []}
+        for column in self.by_group["chassis"]:
+            axes = COLUMN_AXES[column]
+            stage[axes[0] if len(axes) == 1 and axes[0] in stage else "suspension"].append(column)
+
+        kits = {}
+        for axis in ("angle_kit", "brakes"):
+            table = self.sweep(**{axis: self.parts[axis]})
+            ok, miss = self.score(table, stage[axis])
+            rows = np.flatnonzero(ok)
+            if not len(rows):
+                return []
+            kits[axis] = {
+                "ids": table[axis][rows], "cost": self.cost(axis, table[axis][rows]), "miss": miss[rows],
+                "hub": table["hub_mass_f"][rows], "values": {c: table[c][rows] for c in stage[axis]},
+            }
+
+        coils = np.array(self.parts["coilovers"])
+        if stage["suspension"]:
+            ends = [{axis: str(k["ids"][pick(k["hub"])]) for axis, k in kits.items()}
+                    for pick in (np.argmin, np.argmax)]
+            bounds = sweep_physics(self.car_id, selections=[{"coilovers": c, **end} for c in coils for end in ends])
+            coils = coils[self.reachable(bounds, stage["suspension"])]
+        coil_cost = self.cost("coilovers", coils)
+
+        def levels(ids, cost):
+            return {c: list(ids[cost == c]) for c in np.unique(cost)}
+
+        by_price = [levels(coils, coil_cost)] + [levels(k["ids"], k["cost"]) for k in kits.values()]
+        blocks = sorted((cc + ca + cb, cc, ca, cb) for cc in by_price[0] for ca in by_price[1] for cb in by_price[2])
+        lookup = {axis: dict(zip(k["ids"], range(len(k["ids"])))) for axis, k in kits.items()}
+
+        found = []
+        for total, cc, ca, cb in blocks:
+            if len(found) >= self.top and total > found[-1][0]:
+                break
+            table = self.sweep(coilovers=by_price[0][cc], angle_kit=by_price[1][ca], brakes=by_price[2][cb])
+            ok, miss = self.score(table, stage["suspension"])
+            rows = {}
+            for axis, k in kits.items():
+                ids, inverse = np.unique(table[axis], return_inverse=True)
+                rows[axis] = np.array([lookup[axis][i] for i in ids])[inverse.reshape(-1)]
+                miss = miss + k["miss"][rows[axis]]
+            keep = np.flatnonzero(ok)
+            for i in keep[np.argsort(miss[keep], kind="stable")[:self.top]]:
+                values = {c: table[c][i].item() for c in stage["suspension"]}
+                for axis, k in kits.items():
+                    values.update({c: v[rows[axis][i]].item() for c, v in k["values"].items()})
+                found.append((float(total), float(miss[i]),
+                              {axis: str(table[axis][i]) for axis in _GROUPS["chassis"]}, values))
+            found.sort(key=lambda o: o[:2])
+            del found[self.top:]
+        return found
+
+    def reachable(self, bounds, columns):
+        """Which coilovers can meet every target in columns, from their
+        values with the lightest and heaviest kits (alternate rows)."""
+        ok = np.ones(len(bounds["coilovers"]) // 2, dtype=bool)
+        for column in columns:
+            values = bounds[column].astype(np.float64).reshape(-1, 2)
+            low, high = values.min(axis=1), values.max(axis=1)
+            target = self.targets[column]
+            if isinstance(target, tuple):
+                want_low, want_high = target
+            else:
+                want_low, want_high = target - self.tolerance * abs(target), target + self.tolerance * abs(target)
+            if want_low is not None:
+                ok &= high >= want_low
+            if want_high is not None:
+                ok &= low <= want_high
+        return ok
+
+    def combine(self, groups):
+        """Branch-and-bound over the groups' options for the `top` builds."""
+        if any(not options for options in groups):
+            return []
+        # Cheapest way to complete a build from group i on
+        rest = [(0.0, 0.0)] * (len(groups) + 1)
+        for i in range(len(groups) - 1, -1, -1):
+            rest[i] = (rest[i + 1][0] + groups[i][0][0],
+                       rest[i + 1][1] + min(o[1] for o in groups[i]))
+        found = []  # max-heap of (-cost, -miss, n, parts, values)
+        tiebreak = itertools.count()
+
+        def branch(i, cost, miss, parts, values):
+            if i == len(groups):
+                entry = (-cost, -miss, next(tiebreak), parts, values)
+                if len(found) < self.top:
+                    heapq.heappush(found, entry)
+                elif (cost, miss) < (-found[0][0], -found[0][1]):
+                    heapq.heapreplace(found, entry)
+                return
+            for option_cost, option_miss, option_parts, option_values in groups[i]:
+                bound = (cost + option_cost + rest[i + 1][0], miss + option_miss + rest[i + 1][1])
+                if len(found) == self.top and bound >= (-found[0][0], -found[0][1]):
+                    # Options are by price, so every later one is out too
+                    # once even the price alone can't beat the worst kept
+                    if bound[0] > -found[0][0]:
+                        break
+                    continue
+                branch(i + 1, cost + option_cost, miss + option_miss,
+                       {**parts, **option_parts}, {**values, **option_values})
+
+        branch(0, 0.0, 0.0, {}, {})
+        builds = [Build(parts, cost=-c, miss=-m, values=values) for c, m, _, parts, values in found]
+        builds.sort(key=lambda b: (b.cost, b.miss))
+        return builds
+
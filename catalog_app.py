@@ -3,6 +3,8 @@
 import csv, json, os, re, base64
 from collections import defaultdict
 
+from src.car_detector import KeywordMatcher
+
 CATALOG_DIR = os.path.join(os.path.dirname(__file__), 'catalog')
 GDRIVE_LINK = "https://drive.google.com/file/d/{}/view?usp=drive_link"
 
@@ -31,6 +33,47 @@ EXCLUDED_CARS = {
     'parts',  # generic parts entries
 }
 
+# Make → name keywords; the first make with a keyword in the name wins
+CAR_MAKES = {
+    'BMW': ['BMW', 'bmw', 'E46', 'E36', 'E30', 'E92', 'M3', 'M2', 'M4', '1M', 'F22', 'G82', 'G87', 'Eurofighter'],
+    'Nissan': ['Nissan', 'nissan', 'Silvia', 'Sil80', 'Skyline', '180SX', '200SX', '240SX', '350Z', '350z', '370Z', '370z', '300ZX', '300zx', '400z', 'S13', 'S14', 'S15', 'S12', 'R34', 'R32', 'R33', 'R31', 'PS13', 'Onevia', 'Laurel', 'Fairlady', 'Sentra'],
+    'Toyota': ['Toyota', 'toyota', 'AE86', 'Supra', 'Trueno', 'Levin', 'GT86', 'GR86', 'GR_86', 'Chaser', 'Mark', 'Soarer', 'JZX', 'Corolla', 'Aristo', 'Altezza'],
+    'Lexus': ['Lexus', 'lexus', 'IS300', 'SC300', 'RCF', 'GS300'],
+    'Honda': ['Honda', 'honda', 'Civic', 'S2000', 'NSX', 'Integra', 'CRX', 'S600'],
+    'Acura': ['Acura', 'acura', 'NSX'],
+    'Mazda': ['Mazda', 'mazda', 'RX-7', 'RX7', 'RX_7', 'RX-8', 'Miata', 'MX-5', 'MX5'],
+    'Chevrolet': ['Chevy', 'chevy', 'Chevrolet', 'Corvette', 'Chevelle', 'C6', 'C5', 'C4', 'C7', 'C8', 'Camaro', 'C10', 'Nova', 'Impala'],
+    'Ford': ['Ford', 'ford', 'Mustang', 'RS200', 'Interceptor', 'Crown', 'Foxbody', 'Fox', 'Focus', 'Mavri'],
+    'Subaru': ['Subaru', 'subaru', 'WRX', 'Impreza', 'BRZ'],
+    'Mitsubishi': ['Mitsubishi', 'mitsubishi', 'Evo', 'Lancer', 'Eclipse'],
+    'Dodge': ['Dodge', 'dodge', 'Charger', 'Challenger', 'Viper'],
+    'Suzuki': ['Suzuki', 'suzuki', 'Cappuccino', 'Hayabusa', 'Swift', 'Skywave'],
+    'Kawasaki': ['Kawasaki', 'kawasaki', 'ZX'],
+    'Yamaha': ['Yamaha', 'yamaha'],
+    'Lancia': ['Lancia', 'lancia', 'Delta'],
+    'Peugeot': ['Peugeot', 'peugeot'],
+    'Porsche': ['Porsche', 'porsche', '718', '964', '959'],
+    'MG': ['MG', 'Metro'],
+    'Volkswagen': ['VW', 'Volkswagen', 'Golf', 'Corrado', 'Jetta'],
+    'Datsun': ['Datsun', 'datsun', '240Z', '260Z', '280Z'],
+    'Hyundai': ['Hyundai', 'hyundai', 'Genesis'],
+    'Infiniti': ['Infiniti', 'infiniti', 'G35'],
+    'Cadillac': ['Cadillac', 'cadillac', 'XLR'],
+    'Pontiac': ['Pontiac', 'pontiac', 'Solstice', 'Transam'],
+    'Scion': ['Scion', 'scion', 'TC'],
+    'Mercury': ['Mercury', 'mercury', 'Cougar'],
+    'Buick': ['Buick', 'buick', 'GNX'],
+    'Plymouth': ['Plymouth', 'plymouth', 'Barracuda', 'Road Runner'],
+    'GMC': ['GMC', 'gmc', 'Syclone'],
+    'Mercedes': ['Mercedes', 'mercedes', 'SL65'],
+    'Lada': ['Lada', 'lada'],
+    'Harley-Davidson': ['harley'],
+}
+
+MAKE_MATCHER = KeywordMatcher(
+    (kw, make) for make, keywords in CAR_MAKES.items() for kw in keywords
+)
+
 def parse_car_name(raw_name):
     name = raw_name
     prefix_found = ""
@@ -46,50 +89,8 @@ def parse_car_name(raw_name):
             name = name[len(prefix):]
             break
     
-    makes = {
-        'BMW': ['BMW', 'bmw', 'E46', 'E36', 'E30', 'E92', 'M3', 'M2', 'M4', '1M', 'F22', 'G82', 'G87', 'Eurofighter'],
-        'Nissan': ['Nissan', 'nissan', 'Silvia', 'Sil80', 'Skyline', '180SX', '200SX', '240SX', '350Z', '350z', '370Z', '370z', '300ZX', '300zx', '400z', 'S13', 'S14', 'S15', 'S12', 'R34', 'R32', 'R33', 'R31', 'PS13', 'Onevia', 'Laurel', 'Fairlady', 'Sentra'],
-        'Toyota': ['Toyota', 'toyota', 'AE86', 'Supra', 'Trueno', 'Levin', 'GT86', 'GR86', 'GR_86', 'Chaser', 'Mark', 'Soarer', 'JZX', 'Corolla', 'Aristo', 'Altezza'],
-        'Lexus': ['Lexus', 'lexus', 'IS300', 'SC300', 'RCF', 'GS300'],
-        'Honda': ['Honda', 'honda', 'Civic', 'S2000', 'NSX', 'Integra', 'CRX', 'S600'],
-        'Acura': ['Acura', 'acura', 'NSX'],
-        'Mazda': ['Mazda', 'mazda', 'RX-7', 'RX7', 'RX_7', 'RX-8', 'Miata', 'MX-5', 'MX5'],
-        'Chevrolet': ['Chevy', 'chevy', 'Chevrolet', 'Corvette', 'Chevelle', 'C6', 'C5', 'C4', 'C7', 'C8', 'Camaro', 'C10', 'Nova', 'Impala'],
-        'Ford': ['Ford', 'ford', 'Mustang', 'RS200', 'Interceptor', 'Crown', 'Foxbody', 'Fox', 'Focus', 'Mavri'],
-        'Subaru': ['Subaru', 'subaru', 'WRX', 'Impreza', 'BRZ'],
-        'Mitsubishi': ['Mitsubishi', 'mitsubishi', 'Evo', 'Lancer', 'Eclipse'],
-        'Dodge': ['Dodge', 'dodge', 'Charger', 'Challenger', 'Viper'],
-        'Suzuki': ['Suzuki', 'suzuki', 'Cappuccino', 'Hayabusa', 'Swift', 'Skywave'],
-        'Kawasaki': ['Kawasaki', 'kawasaki', 'ZX'],
-        'Yamaha': ['Yamaha', 'yamaha'],
-        'Lancia': ['Lancia', 'lancia', 'Delta'],
-        'Peugeot': ['Peugeot', 'peugeot'],
-        'Porsche': ['Porsche', 'porsche', '718', '964', '959'],
-        'MG': ['MG', 'Metro'],
-        'Volkswagen': ['VW', 'Volkswagen', 'Golf', 'Corrado', 'Jetta'],
-        'Datsun': ['Datsun', 'datsun', '240Z', '260Z', '280Z'],
-        'Hyundai': ['Hyundai', 'hyundai', 'Genesis'],
-        'Infiniti': ['Infiniti', 'infiniti', 'G35'],
-        'Cadillac': ['Cadillac', 'cadillac', 'XLR'],
-        'Pontiac': ['Pontiac', 'pontiac', 'Solstice', 'Transam'],
-        'Scion': ['Scion', 'scion', 'TC'],
-        'Mercury': ['Mercury', 'mercury', 'Cougar'],
-        'Buick': ['Buick', 'buick', 'GNX'],
-        'Plymouth': ['Plymouth', 'plymouth', 'Barracuda', 'Road Runner'],
-        'GMC': ['GMC', 'gmc', 'Syclone'],
-        'Mercedes': ['Mercedes', 'mercedes', 'SL65'],
-        'Lada': ['Lada', 'lada'],
-        'Harley-Davidson': ['harley'],
-    }
-    
-    detected_make = "Other"
-    for make, keywords in makes.items():
-        for kw in keywords:
-            if kw.lower() in name.lower():
-                detected_make = make
-                break
-        if detected_make != "Other":
-            break
+    hit = MAKE_MATCHER.match(name)
+    detected_make = hit[1] if hit else "Other"
     
     model = name.replace('_', ' ').replace('-', ' ').strip()
     
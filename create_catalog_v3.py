@@ -6,6 +6,8 @@ from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedSty
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 
+from src.car_detector import KeywordMatcher
+
 CATALOG_DIR = os.path.join(os.path.dirname(__file__), 'catalog')
 GDRIVE_BASE = "https://drive.google.com/file/d/{}/view?usp=drive_link"
 
@@ -51,6 +53,33 @@ def style_sheet_dark(ws, num_cols=6):
             cell.fill = dark_fill
 
 
+# Make → name keywords; the first make with a keyword in the name wins
+CAR_MAKES = {
+    'BMW': ['BMW', 'bmw'],
+    'Nissan': ['Nissan', 'nissan'],
+    'Toyota': ['Toyota', 'toyota', 'AE86', 'Supra'],
+    'Honda': ['Honda', 'honda', 'Civic', 'S2000'],
+    'Mazda': ['Mazda', 'mazda', 'RX-7', 'RX7', 'Miata', 'MX-5'],
+    'Chevrolet': ['Chevy', 'chevy', 'Chevrolet', 'Corvette', 'Chevelle', 'C6'],
+    'Ford': ['Ford', 'ford', 'Mustang', 'RS200'],
+    'Subaru': ['Subaru', 'subaru', 'WRX', 'Impreza'],
+    'Mitsubishi': ['Mitsubishi', 'mitsubishi', 'Evo', 'Lancer'],
+    'Dodge': ['Dodge', 'dodge', 'Charger', 'Challenger'],
+    'Suzuki': ['Suzuki', 'suzuki', 'Cappuccino', 'Hayabusa', 'Swift'],
+    'Kawasaki': ['Kawasaki', 'kawasaki', 'ZX'],
+    'Yamaha': ['Yamaha', 'yamaha'],
+    'Lancia': ['Lancia', 'lancia', 'Delta'],
+    'Peugeot': ['Peugeot', 'peugeot', '205'],
+    'Porsche': ['Porsche', 'porsche', '959'],
+    'MG': ['MG', 'Metro'],
+    'Volkswagen': ['VW', 'Volkswagen', 'Golf'],
+}
+
+MAKE_MATCHER = KeywordMatcher(
+    (kw, make) for make, keywords in CAR_MAKES.items() for kw in keywords
+)
+
+
 def parse_car_name(raw_name):
     """Try to extract Make and Model from car name."""
     name = raw_name
@@ -62,36 +91,8 @@ def parse_car_name(raw_name):
             name = name[len(prefix):]
             break
     
-    # Common make mappings
-    makes = {
-        'BMW': ['BMW', 'bmw'],
-        'Nissan': ['Nissan', 'nissan'],
-        'Toyota': ['Toyota', 'toyota', 'AE86', 'Supra'],
-        'Honda': ['Honda', 'honda', 'Civic', 'S2000'],
-        'Mazda': ['Mazda', 'mazda', 'RX-7', 'RX7', 'Miata', 'MX-5'],
-        'Chevrolet': ['Chevy', 'chevy', 'Chevrolet', 'Corvette', 'Chevelle', 'C6'],
-        'Ford': ['Ford', 'ford', 'Mustang', 'RS200'],
-        'Subaru': ['Subaru', 'subaru', 'WRX', 'Impreza'],
-        'Mitsubishi': ['Mitsubishi', 'mitsubishi', 'Evo', 'Lancer'],
-        'Dodge': ['Dodge', 'dodge', 'Charger', 'Challenger'],
-        'Suzuki': ['Suzuki', 'suzuki', 'Cappuccino', 'Hayabusa', 'Swift'],
-        'Kawasaki': ['Kawasaki', 'kawasaki', 'ZX'],
-        'Yamaha': ['Yamaha', 'yamaha'],
-        'Lancia': ['Lancia', 'lancia', 'Delta'],
-        'Peugeot': ['Peugeot', 'peugeot', '205'],
-        'Porsche': ['Porsche', 'porsche', '959'],
-        'MG': ['MG', 'Metro'],
-        'Volkswagen': ['VW', 'Volkswagen', 'Golf'],
-    }
-    
-    detected_make = "Other"
-    for make, keywords in makes.items():
-        for kw in keywords:
-            if kw.lower() in name.lower():
-                detected_make = make
-                break
-        if detected_make != "Other":
-            break
+    hit = MAKE_MATCHER.match(name)
+    detected_make = hit[1] if hit else "Other"
     
     # Clean up model name
     model = name.replace('_', ' ').replace('-', ' ').strip()
@@ -5,9 +5,23 @@ Uses real formulas from Arch's physics pipeline reference.
 import math
 from car_database import get_car
 from parts_database import (
-    COILOVERS, ANGLE_KITS, WHEEL_SETUPS, BRAKE_KITS, DIFF_TYPES, TIRE_COMPOUNDS
+    COILOVERS, ANGLE_KITS, WHEEL_SETUPS, BRAKE_KITS, DIFF_TYPES, TIRE_COMPOUNDS,
+    get_compatible_parts,
 )
 
+try:
+    import numpy as np
+except ImportError:  # only sweep_physics needs numpy
+    np = None
+
+
+# Damping ratios depend on damper quality
+DAMPING_RATIOS = {
+    "basic":      {"bump": 0.22, "rebound": 0.35, "fast_mult": 0.45},
+    "adjustable": {"bump": 0.25, "rebound": 0.40, "fast_mult": 0.50},
+    "advanced":   {"bump": 0.28, "rebound": 0.45, "fast_mult": 0.55},
+}
+
 
 def calculate_tire_radius(width_m, aspect_ratio, rim_dia_inches):
     """Tire outer radius in meters."""
@@ -31,13 +45,7 @@ def calculate_critical_damping(spring_rate, sprung_mass_corner):
 def calculate_damping(spring_rate, sprung_mass_corner, quality="basic"):
     """Generate damping values based on spring rate and damper quality."""
     cc = calculate_critical_damping(spring_rate, sprung_mass_corner)
-    # Damping ratios depend on quality
-    ratios = {
-        "basic":      {"bump": 0.22, "rebound": 0.35, "fast_mult": 0.45},
-        "adjustable": {"bump": 0.25, "rebound": 0.40, "fast_mult": 0.50},
-        "advanced":   {"bump": 0.28, "rebound": 0.45, "fast_mult": 0.55},
-    }
-    r = ratios.get(quality, ratios["adjustable"])
+    r = DAMPING_RATIOS.get(quality, DAMPING_RATIOS["adjustable"])
     return {
         "bump": round(cc * r["bump"]),
         "fast_bump": round(cc * r["bump"] * r["fast_mult"]),
@@ -316,3 +324,142 @@ def generate_physics(car_id, parts_selection):
         "changes": changes,
         "comparison": comparison,
     }
+
+
+# Part axes of a sweep: parts_selection key → parts table
+SWEEP_AXES = {
+    "coilovers": COILOVERS,
+    "angle_kit": ANGLE_KITS,
+    "wheels_f": WHEEL_SETUPS,
+    "wheels_r": WHEEL_SETUPS,
+    "brakes": BRAKE_KITS,
+    "diff": DIFF_TYPES,
+    "tire_compound": TIRE_COMPOUNDS,
+}
+
+
+def sweep_physics(car_id, selections=None, **axes):
+    """
+    Evaluate many parts selections for one car at once, as NumPy arrays.
+    
+    By default sweeps the cartesian product of every part compatible with
+    the car. A keyword per SWEEP_AXES key narrows that axis to a list of
+    part ids, e.g. sweep_physics(car_id, coilovers=["bc_br", "hks_hipermax"]).
+    wheels_r follows wheels_f (same setup on both axles) unless given, and
+    a None tire_compound means the wheel setup's own compound, as in
+    generate_physics. Or pass `selections`, a list of parts_selection
+    dicts, to evaluate exactly those.
+    
+    Returns: dict of equal-length arrays, one row per selection: the part
+    ids under their parts_selection keys, then the values generate_physics
+    computes (unrounded, except the damping and ARB integers it writes).
+    """
+    if np is None:
+        raise ImportError("sweep_physics needs numpy (pip install numpy)")
+    car = get_car(car_id)
+    if not car:
+        return {"error": f"Unknown car: {car_id}"}
+
+    # Every axis as (its part ids, each row's position in them)
+    if selections is not None:
+        keys, idx = {}, {}
+        for axis in SWEEP_AXES:
+            default = None if axis == "tire_compound" else "stock"
+            picked = [s.get(axis, default) for s in selections]
+            keys[axis] = list(dict.fromkeys(picked))
+            position = {k: i for i, k in enumerate(keys[axis])}
+            idx[axis] = np.array([position[k] for k in picked], dtype=np.intp)
+    else:
+        keys = {axis: list(axes[axis]) if axes.get(axis) is not None
+                else list(get_compatible_parts(car_id, table))
+                for axis, table in SWEEP_AXES.items() if axis != "wheels_r"}
+        follow_front = axes.get("wheels_r") is None
+        if not follow_front:
+            keys["wheels_r"] = list(axes["wheels_r"])
+        names = list(keys)
+        grid = np.indices([len(keys[a]) for a in names]).reshape(len(names), -1)
+        idx = dict(zip(names, grid))
+        if follow_front:
+            keys["wheels_r"], idx["wheels_r"] = keys["wheels_f"], idx["wheels_f"]
+
+    def parts(axis):
+        table = SWEEP_AXES[axis]
+        return [table.get(k, table["stock"]) for k in keys[axis]]
+
+    def column(axis, fn, dtype=np.float64):
+        """fn of each part on the axis, gathered for every row."""
+        return np.array([fn(p) for p in parts(axis)], dtype=dtype)[idx[axis]]
+
+    coil, angle, brake, diff = "coilovers", "angle_kit", "brakes", "diff"
+    result = {axis: np.array([k or "" for k in keys[axis]])[idx[axis]] for axis in SWEEP_AXES}
+    n = len(idx[coil])
+
+    # ── Tire/wheel specs ──────────────────────────────────────
+    for axle in ("f", "r"):
+        wheels = f"wheels_{axle}"
+        width = column(wheels, lambda w: w.get("tire_width", car[f"tire_width_{axle}"]))
+        aspect = column(wheels, lambda w: w.get("tire_aspect", car[f"tire_aspect_{axle}"]))
+        rim = column(wheels, lambda w: w.get("rim_dia", car[f"rim_dia_{axle}"]))
+        result[f"tire_width_{axle}"] = width
+        result[f"tire_radius_{axle}"] = calculate_tire_radius(width, aspect, rim)
+
+    # Compound per (compound, front wheels) pair, resolved like generate_physics
+    compounds = [[_resolve_compound(c, w) for w in parts("wheels_f")] for c in keys["tire_compound"]]
+    pair = (idx["tire_compound"], idx["wheels_f"])
+    for name in ("grip_mult", "dx_ref", "dy_ref"):
+        result[name] = np.array([[c[name] for c in row] for row in compounds], dtype=np.float64)[pair]
+
+    # ── Hub / unsprung mass ───────────────────────────────────
+    hub_f = (car["hub_mass_f"] + column(brake, lambda b: b.get("mass_add_f_kg", 0))
+             + column(angle, lambda a: a.get("hub_mass_add_kg", 0)))
+    hub_r = np.full(n, float(car["hub_mass_r"]))
+    total_mass = car["mass_kg"]
+    sprung_total = total_mass - (hub_f * 2 + hub_r * 2)
+    wdf = car["weight_dist_f"]
+    sprung_f = sprung_total * wdf / 2.0
+    sprung_r = sprung_total * (1 - wdf) / 2.0
+    result.update(hub_mass_f=hub_f, hub_mass_r=hub_r, sprung_f_corner=sprung_f, sprung_r_corner=sprung_r)
+
+    # ── Springs, frequencies, damping ─────────────────────────
+    spring_f = column(coil, lambda c: c["spring_rate_f_nm"] if "spring_rate_f_nm" in c
+                      else car["spring_rate_f"] * c.get("spring_rate_f_mult", 1.0))
+    spring_r = column(coil, lambda c: c["spring_rate_r_nm"] if "spring_rate_r_nm" in c
+                      else car["spring_rate_r"] * c.get("spring_rate_r_mult", 1.0))
+    ratios = [DAMPING_RATIOS.get(c.get("damping_quality", "basic"), DAMPING_RATIOS["adjustable"])
+              for c in parts(coil)]
+    for axle, spring, sprung in (("f", spring_f, sprung_f), ("r", spring_r, sprung_r)):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            freq = np.where(sprung > 0, (1.0 / (2.0 * math.pi)) * np.sqrt(spring / sprung), 0.0)
+            cc = 2.0 * np.sqrt(spring * sprung)
+        result[f"spring_rate_{axle}"] = spring
+        result[f"natural_freq_{axle}"] = freq
+        for kind in ("bump", "rebound"):
+            ratio = np.array([r[kind] for r in ratios])[idx[coil]]
+            fast = np.array([r["fast_mult"] for r in ratios])[idx[coil]]
+            result[f"damp_{kind}_{axle}"] = np.round(cc * ratio).astype(np.int64)
+            result[f"damp_fast_{kind}_{axle}"] = np.round(cc * ratio * fast).astype(np.int64)
+
+    # ── ARB rates ─────────────────────────────────────────────
+    result["arb_f"] = (car["arb_f"] * (spring_f / max(car["spring_rate_f"], 1))).astype(np.int64)
+    result["arb_r"] = (car["arb_r"] * (spring_r / max(car["spring_rate_r"], 1))).astype(np.int64)
+
+    # ── Steering / brakes / differential ──────────────────────
+    locked = lambda a: a.get("max_angle_deg", 0) > 0
+    result["max_angle"] = column(angle, lambda a: a["max_angle_deg"] if locked(a) else car["stock_max_angle"])
+    result["steer_lock"] = column(angle, lambda a: a["max_angle_deg"] * car["steer_ratio"] if locked(a)
+                                  else car["steer_lock"])
+    result["brake_torque"] = column(brake, lambda b: int(car["brake_torque"] * b["torque_mult"])
+                                    if "torque_mult" in b else car["brake_torque"], np.int64)
+    result["brake_bias"] = column(brake, lambda b: b["bias"] if "torque_mult" in b else car["brake_bias"])
+    for name in ("diff_power", "diff_coast", "diff_preload"):
+        result[name] = column(diff, lambda d: d.get(name, car[name]))
+    return result
+
+
+def _resolve_compound(compound_key, wheels):
+    """The TIRE_COMPOUNDS entry generate_physics uses for a selection."""
+    if compound_key and compound_key in TIRE_COMPOUNDS:
+        return TIRE_COMPOUNDS[compound_key]
+    if "tire_compound" in wheels:
+        return TIRE_COMPOUNDS.get(wheels["tire_compound"], TIRE_COMPOUNDS["street"])
+    return TIRE_COMPOUNDS["street"]
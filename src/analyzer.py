@@ -4,11 +4,16 @@ The main entry point: takes any folder, figures out the layout,
 identifies the car, and produces a full physics report.
 """
 
+import os
+import time
 from pathlib import Path
-from dataclasses import dataclass, field
-from .folder_scanner import scan_folder, ScanResult
-from .ini_parser import parse_ini_file, get_value, get_raw, list_lut_references, parse_lut_file
-from .car_detector import detect_car, _identify_from_name, CarIdentity
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field, fields
+from .folder_scanner import scan_folder, read_scan_file, ScanResult, _data_dir_name, _list_dir
+from .ini_parser import PARSE_CACHE, get_value
+from .car_detector import _identify_from_name, CarIdentity
+from .schema import Field, Schema
 
 
 @dataclass 
@@ -139,48 +144,316 @@ class PhysicsReport:
         return '\n'.join(lines)
 
 
-def analyze_car(path: str | Path) -> PhysicsReport:
+# Where each PhysicsReport value comes from. Fields of a missing file keep
+# the dataclass default; a missing key gets the default given here.
+REPORT_SCHEMA = Schema([
+    # car.ini
+    Field('screen_name', 'car.ini', 'INFO', 'SCREEN_NAME', '', raw=True),
+    Field('short_name', 'car.ini', 'INFO', 'SHORT_NAME', '', raw=True),
+    Field('version', 'car.ini', 'HEADER', 'VERSION', '', raw=True),
+    Field('total_mass', 'car.ini', 'BASIC', 'TOTALMASS', 0.0),
+    Field('inertia', 'car.ini', 'BASIC', 'INERTIA', ()),
+    Field('steer_lock', 'car.ini', 'CONTROLS', 'STEER_LOCK', 0.0),
+    Field('steer_ratio', 'car.ini', 'CONTROLS', 'STEER_RATIO', 0.0),
+    Field('linear_steer_rod_ratio', 'car.ini', 'CONTROLS', 'LINEAR_STEER_ROD_RATIO', 0.0),
+    Field('fuel_capacity', 'car.ini', 'FUEL', 'MAX_FUEL', 0.0),
+    Field('fuel_start', 'car.ini', 'FUEL', 'FUEL', 0.0),
+    Field('fuel_consumption', 'car.ini', 'FUEL', 'CONSUMPTION', 0.0),
+    # suspensions.ini
+    Field('wheelbase', 'suspensions.ini', 'BASIC', 'WHEELBASE', 0.0),
+    Field('cg_location', 'suspensions.ini', 'BASIC', 'CG_LOCATION', 0.0),
+    Field('front_type', 'suspensions.ini', 'FRONT', 'TYPE', '', raw=True),
+    Field('rear_type', 'suspensions.ini', 'REAR', 'TYPE', '', raw=True),
+    Field('front_track', 'suspensions.ini', 'FRONT', 'TRACK', 0.0),
+    Field('rear_track', 'suspensions.ini', 'REAR', 'TRACK', 0.0),
+    Field('front_basey', 'suspensions.ini', 'FRONT', 'BASEY', 0.0),
+    Field('rear_basey', 'suspensions.ini', 'REAR', 'BASEY', 0.0),
+    Field('front_spring_rate', 'suspensions.ini', 'FRONT', 'SPRING_RATE', 0.0),
+    Field('rear_spring_rate', 'suspensions.ini', 'REAR', 'SPRING_RATE', 0.0),
+    Field('front_hub_mass', 'suspensions.ini', 'FRONT', 'HUB_MASS', 0.0),
+    Field('rear_hub_mass', 'suspensions.ini', 'REAR', 'HUB_MASS', 0.0),
+    Field('arb_front', 'suspensions.ini', 'ARB', 'FRONT', 0.0),
+    Field('arb_rear', 'suspensions.ini', 'ARB', 'REAR', 0.0),
+    Field('front_damp_bump', 'suspensions.ini', 'FRONT', 'DAMP_BUMP', 0.0),
+    Field('front_damp_rebound', 'suspensions.ini', 'FRONT', 'DAMP_REBOUND', 0.0),
+    Field('rear_damp_bump', 'suspensions.ini', 'REAR', 'DAMP_BUMP', 0.0),
+    Field('rear_damp_rebound', 'suspensions.ini', 'REAR', 'DAMP_REBOUND', 0.0),
+    # drivetrain.ini
+    Field('drivetrain_type', 'drivetrain.ini', 'TRACTION', 'TYPE', '', raw=True),
+    Field('gear_count', 'drivetrain.ini', 'GEARS', 'COUNT', 0),
+    Field('final_drive', 'drivetrain.ini', 'GEARS', 'FINAL', 0.0),
+    Field('diff_power', 'drivetrain.ini', 'DIFFERENTIAL', 'POWER', 0.0),
+    Field('diff_coast', 'drivetrain.ini', 'DIFFERENTIAL', 'COAST', 0.0),
+    Field('diff_preload', 'drivetrain.ini', 'DIFFERENTIAL', 'PRELOAD', 0.0),
+    # engine.ini
+    Field('rpm_limiter', 'engine.ini', 'ENGINE_DATA', 'LIMITER', 0),
+    Field('rpm_idle', 'engine.ini', 'ENGINE_DATA', 'MINIMUM', 0),
+    Field('engine_inertia', 'engine.ini', 'ENGINE_DATA', 'INERTIA', 0.0),
+    Field('power_curve_file', 'engine.ini', 'HEADER', 'POWER_CURVE', '', raw=True),
+    Field('turbo_max_boost', 'engine.ini', 'TURBO_0', 'MAX_BOOST', 0.0),
+])
+
+
+# The files a CarIdentity is filled from (see _identify / _fill_identity)
+_IDENTITY_FILES = ('car.ini', 'suspensions.ini', 'drivetrain.ini')
+
+
+class CarPipeline:
+    """One car folder, scanned once with each physics file parsed at most
+    once, shared by its CarIdentity and its PhysicsReport.
+    
+    identity only reads the files it needs; report reads the rest into the
+    same PhysicsReport. `files` can hand in files that are already parsed
+    ({logical name: sections}), e.g. an upload. `folder_name` is the name
+    tried when no SCREEN_NAME/SHORT_NAME identifies the car ('' to skip);
+    by default the car folder's name. `fingerprints` is an optional
+    FingerprintIndex, the last resort after that.
+    """
+    
+    def __init__(self, path: str | Path, files: dict | None = None,
+                 folder_name: str | None = None, fingerprints=None):
+        self.path = Path(path)
+        self.scan = scan_car(self.path)
+        self.folder_name = _folder_name(self.path) if folder_name is None else folder_name
+        self.fingerprints = fingerprints
+        self._files = dict(files or {})  # logical name → parsed sections
+        self._extracted = set()          # files already read into _report
+        self._report = PhysicsReport(scan=self.scan)
+        self._identity = None
+    
+    def parsed(self, name: str):
+        """Parsed sections of a core file by logical name, or None if missing."""
+        if name not in self._files:
+            path = self.scan.core_files.get(name)
+            self._files[name] = _parse_scanned(self.scan, path) if path is not None else None
+        return self._files[name]
+    
+    def _extract(self, names):
+        files = {}
+        for name in names:
+            if name not in self._extracted:
+                self._extracted.add(name)
+                sections = self.parsed(name)
+                if sections is not None:
+                    files[name] = sections
+        for name, value in REPORT_SCHEMA.extract(files).items():
+            setattr(self._report, name, value)
+        for name, sections in files.items():
+            if name in _DERIVED:
+                _DERIVED[name](self._report, sections)
+    
+    @property
+    def identity(self) -> CarIdentity:
+        if self._identity is None:
+            self._extract(_IDENTITY_FILES)
+            identity = _identify(self._report, self.folder_name, self.parsed('car.ini') is not None)
+            identity.files_found = list(self.scan.core_files.keys()) + list(self.scan.optional_files.keys())
+            identity.lut_files = [f.name for f in self.scan.lut_files]
+            _fill_identity(identity, self._report)
+            if identity.confidence < 0.5 and self.fingerprints is not None:
+                self.fingerprints.identify(identity)
+            self._identity = identity
+        return self._identity
+    
+    @property
+    def report(self) -> PhysicsReport:
+        if self._report.identity is None:
+            self._report.identity = self.identity
+            self._extract(REPORT_SCHEMA.files)
+        return self._report
+
+
+def analyze_car(path: str | Path, fingerprints=None) -> PhysicsReport:
     """Full analysis of an AC car from its folder."""
-    path = Path(path)
-    report = PhysicsReport()
+    return CarPipeline(path, fingerprints=fingerprints).report
+
+
+# Identity values included in a report record
+RECORD_IDENTITY_FIELDS = ('make', 'model', 'year_range', 'chassis_code', 'confidence', 'source')
+
+
+def report_record(report: PhysicsReport) -> dict:
+    """Flatten a PhysicsReport into a JSON-able dict (without the scan)."""
+    record = {}
+    for f in fields(PhysicsReport):
+        if f.name in ('identity', 'scan'):
+            continue
+        value = getattr(report, f.name)
+        record[f.name] = list(value) if isinstance(value, tuple) else value
+    identity = report.identity
+    for name in RECORD_IDENTITY_FIELDS:
+        record[name] = getattr(identity, name) if identity is not None else None
+    return record
+
+
+def record_fields() -> list[str]:
+    """The keys report_record() produces, in order."""
+    return [f.name for f in fields(PhysicsReport) if f.name not in ('identity', 'scan')] + list(RECORD_IDENTITY_FIELDS)
+
+
+def analyze_many(paths, workers: int | None = None, keys: list | None = None, chunksize: int = 4):
+    """Analyze many car folders on a process pool.
+    
+    Yields one dict per car in completion order: 'path', 'seconds' (the
+    analysis time in the worker) and either the report_record() values
+    or 'error'. `keys` limits the record to those report_record() keys,
+    in the worker, so only they are sent back. Cars travel in chunks of `chunksize`,
+    with at most two chunks per worker in flight. workers=0 analyzes in
+    the calling process.
+    """
+    paths = iter(paths)
+    keys = tuple(keys) if keys else None
+    chunks = iter(lambda: [str(p) for p in islice(paths, chunksize)], [])
+    
+    if workers == 0:
+        for chunk in chunks:
+            yield from _analyze_chunk(chunk, keys)
+        return
     
-    # Scan folder structure
-    scan = scan_folder(path)
-    report.scan = scan
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in islice(chunks, workers * 2):
+            pending.add(pool.submit(_analyze_chunk, chunk, keys))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.add(pool.submit(_analyze_chunk, chunk, keys))
+                yield from future.result()
+
+
+def _analyze_chunk(paths: list[str], keys: tuple | None) -> list[dict]:
+    """Worker side of analyze_many."""
+    out = []
+    for path in paths:
+        start = time.perf_counter()
+        try:
+            record = report_record(analyze_car(path))
+        except Exception as e:
+            out.append({'path': path, 'seconds': round(time.perf_counter() - start, 6),
+                        'error': f"{type(e).__name__}: {e}"})
+            continue
+        if keys is not None:
+            record = {name: record[name] for name in keys}
+        out.append({'path': path, 'seconds': round(time.perf_counter() - start, 6), **record})
+    return out
+
+
+def _folder_name(path: Path) -> str:
+    """The name identifying a car folder: its own, or its parent's if it is data/."""
+    return path.parent.name if path.name.lower() == 'data' else path.name
+
+
+def _parse_scanned(scan: ScanResult, path: Path):
+    """Parse one of a scan's files, decoding it from the data.acd if packed."""
+    if scan.acd_path is not None:
+        return PARSE_CACHE.parse_bytes(read_scan_file(scan, path))
+    return PARSE_CACHE.parse_file(path)
+
+
+def scan_car(path: str | Path) -> ScanResult:
+    """Scan a car folder the way analyze_car does: the folder itself, merged
+    with its data/ subfolder's files. Both scans share one listing per directory."""
+    path = Path(path)
+    listings = {}
+    scan = scan_folder(path, listings)
     
     # If we found a nested data/ with the real files, also scan that
-    data_subdir = path / 'data'
-    if data_subdir.is_dir():
-        inner_scan = scan_folder(data_subdir)
-        # Merge: prefer inner scan's files for core physics
-        for k, v in inner_scan.core_files.items():
-            if k not in scan.core_files:
-                scan.core_files[k] = v
-        for k, v in inner_scan.optional_files.items():
-            if k not in scan.optional_files:
-                scan.optional_files[k] = v
-        scan.lut_files.extend(inner_scan.lut_files)
+    # (Data/ etc. count too; a missing data/ scans as empty, so the merge
+    # is a no-op)
+    listing = _list_dir(path, listings)
+    data_name = _data_dir_name(listing) if listing is not None else None
+    inner_scan = scan_folder(path / (data_name or 'data'), listings)
+    # Merge: prefer inner scan's files for core physics
+    for k, v in inner_scan.core_files.items():
+        if k not in scan.core_files:
+            scan.core_files[k] = v
+    for k, v in inner_scan.optional_files.items():
+        if k not in scan.optional_files:
+            scan.optional_files[k] = v
+    # A standard layout's root scan already holds data/'s LUTs
+    seen = {_path_key(f) for f in scan.lut_files}
+    scan.lut_files.extend(f for f in inner_scan.lut_files if _path_key(f) not in seen)
+    return scan
+
+
+def _path_key(path: Path) -> str:
+    """The same file found by two scans, as one key."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+def update_report(report: PhysicsReport, file: str, sections: dict, changed) -> set[str]:
+    """Update a report after one of its files was edited, without re-analyzing.
     
-    # Detect car identity
+    `file` is the logical name ('suspensions.ini'), `sections` its new parse
+    and `changed` the (section, key) pairs that differ, as kept and returned
+    by ini_parser.IncrementalParser. Only the schema fields at those keys
+    are re-read; the file's derived values and the identity are refreshed
+    only if something they depend on changed. Returns the names of the
+    report fields that were re-read.
+    """
+    if not changed:
+        return set()
+    record = REPORT_SCHEMA.extract_changed(file, sections, changed)
+    for name, value in record.items():
+        setattr(report, name, value)
+    updated = set(record)
+    
+    if file in _DERIVED:
+        _DERIVED[file](report, sections)
+        updated.update(_DERIVED_FIELDS[file])
+    
+    old = report.identity
+    if old is not None:
+        if updated & {'screen_name', 'short_name'}:
+            identity = _identify(report, _folder_name(report.scan.root_path), 'car.ini' in report.scan.core_files)
+            identity.files_found = old.files_found
+            identity.lut_files = old.lut_files
+            report.identity = identity
+        _fill_identity(report.identity, report)
+    return updated
+
+
+def _derive_suspensions(report: PhysicsReport, susp: dict):
+    # CSP features
+    report.has_cosmic = report.front_type == 'COSMIC' or report.rear_type == 'COSMIC'
+    report.has_dwb2 = get_value(susp, '_EXTENSION', 'USE_DWB2', 0) == 1
+    report.has_damper_luts = get_value(susp, '_EXTENSION', 'DAMPER_LUTS', 0) == 1
+
+
+def _derive_drivetrain(report: PhysicsReport, dt: dict):
+    report.gear_ratios = []
+    for i in range(1, report.gear_count + 1):
+        g = get_value(dt, 'GEARS', f'GEAR_{i}', None)
+        if g is not None:
+            report.gear_ratios.append(g)
+
+
+def _derive_engine(report: PhysicsReport, engine: dict):
+    # Check for turbo
+    report.has_turbo = 'TURBO_0' in engine
+
+
+# Report values computed from a parsed file beyond its schema fields
+_DERIVED = {
+    'suspensions.ini': _derive_suspensions,
+    'drivetrain.ini': _derive_drivetrain,
+    'engine.ini': _derive_engine,
+}
+_DERIVED_FIELDS = {
+    'suspensions.ini': {'has_cosmic', 'has_dwb2', 'has_damper_luts'},
+    'drivetrain.ini': {'gear_ratios'},
+    'engine.ini': {'has_turbo'},
+}
+
+
+def _identify(report: PhysicsReport, folder_name: str, has_car_ini: bool) -> CarIdentity:
     identity = CarIdentity()
     
-    # Parse car.ini
-    if 'car.ini' in scan.core_files:
-        car = parse_ini_file(scan.core_files['car.ini'])
-        
-        report.screen_name = get_raw(car, 'INFO', 'SCREEN_NAME', '')
-        report.short_name = get_raw(car, 'INFO', 'SHORT_NAME', '')
-        report.version = get_raw(car, 'HEADER', 'VERSION', '')
-        report.total_mass = get_value(car, 'BASIC', 'TOTALMASS', 0.0)
-        report.inertia = get_value(car, 'BASIC', 'INERTIA', ())
-        report.steer_lock = get_value(car, 'CONTROLS', 'STEER_LOCK', 0.0)
-        report.steer_ratio = get_value(car, 'CONTROLS', 'STEER_RATIO', 0.0)
-        report.linear_steer_rod_ratio = get_value(car, 'CONTROLS', 'LINEAR_STEER_ROD_RATIO', 0.0)
-        report.fuel_capacity = get_value(car, 'FUEL', 'MAX_FUEL', 0.0)
-        report.fuel_start = get_value(car, 'FUEL', 'FUEL', 0.0)
-        report.fuel_consumption = get_value(car, 'FUEL', 'CONSUMPTION', 0.0)
-        
-        # Identity from screen name
+    # Identity from screen name
+    if has_car_ini:
         if report.screen_name:
             _identify_from_name(identity, report.screen_name, 'SCREEN_NAME')
         if identity.confidence < 0.5 and report.short_name:
@@ -188,68 +461,11 @@ def analyze_car(path: str | Path) -> PhysicsReport:
     
     # Fallback identity from folder name
     if identity.confidence < 0.5:
-        folder_name = path.name
         _identify_from_name(identity, folder_name, 'folder name')
-    
-    # Parse suspensions.ini
-    if 'suspensions.ini' in scan.core_files:
-        susp = parse_ini_file(scan.core_files['suspensions.ini'])
-        
-        report.wheelbase = get_value(susp, 'BASIC', 'WHEELBASE', 0.0)
-        report.cg_location = get_value(susp, 'BASIC', 'CG_LOCATION', 0.0)
-        report.front_type = get_raw(susp, 'FRONT', 'TYPE', '')
-        report.rear_type = get_raw(susp, 'REAR', 'TYPE', '')
-        report.front_track = get_value(susp, 'FRONT', 'TRACK', 0.0)
-        report.rear_track = get_value(susp, 'REAR', 'TRACK', 0.0)
-        report.front_basey = get_value(susp, 'FRONT', 'BASEY', 0.0)
-        report.rear_basey = get_value(susp, 'REAR', 'BASEY', 0.0)
-        report.front_spring_rate = get_value(susp, 'FRONT', 'SPRING_RATE', 0.0)
-        report.rear_spring_rate = get_value(susp, 'REAR', 'SPRING_RATE', 0.0)
-        report.front_hub_mass = get_value(susp, 'FRONT', 'HUB_MASS', 0.0)
-        report.rear_hub_mass = get_value(susp, 'REAR', 'HUB_MASS', 0.0)
-        report.arb_front = get_value(susp, 'ARB', 'FRONT', 0.0)
-        report.arb_rear = get_value(susp, 'ARB', 'REAR', 0.0)
-        report.front_damp_bump = get_value(susp, 'FRONT', 'DAMP_BUMP', 0.0)
-        report.front_damp_rebound = get_value(susp, 'FRONT', 'DAMP_REBOUND', 0.0)
-        report.rear_damp_bump = get_value(susp, 'REAR', 'DAMP_BUMP', 0.0)
-        report.rear_damp_rebound = get_value(susp, 'REAR', 'DAMP_REBOUND', 0.0)
-        
-        # CSP features
-        report.has_cosmic = report.front_type == 'COSMIC' or report.rear_type == 'COSMIC'
-        report.has_dwb2 = get_value(susp, '_EXTENSION', 'USE_DWB2', 0) == 1
-        report.has_damper_luts = get_value(susp, '_EXTENSION', 'DAMPER_LUTS', 0) == 1
-    
-    # Parse drivetrain.ini
-    if 'drivetrain.ini' in scan.core_files:
-        dt = parse_ini_file(scan.core_files['drivetrain.ini'])
-        
-        report.drivetrain_type = get_raw(dt, 'TRACTION', 'TYPE', '')
-        report.gear_count = get_value(dt, 'GEARS', 'COUNT', 0)
-        report.final_drive = get_value(dt, 'GEARS', 'FINAL', 0.0)
-        report.diff_power = get_value(dt, 'DIFFERENTIAL', 'POWER', 0.0)
-        report.diff_coast = get_value(dt, 'DIFFERENTIAL', 'COAST', 0.0)
-        report.diff_preload = get_value(dt, 'DIFFERENTIAL', 'PRELOAD', 0.0)
-        
-        report.gear_ratios = []
-        for i in range(1, report.gear_count + 1):
-            g = get_value(dt, 'GEARS', f'GEAR_{i}', None)
-            if g is not None:
-                report.gear_ratios.append(g)
-    
-    # Parse engine.ini
-    if 'engine.ini' in scan.core_files:
-        eng = parse_ini_file(scan.core_files['engine.ini'])
-        
-        report.rpm_limiter = get_value(eng, 'ENGINE_DATA', 'LIMITER', 0)
-        report.rpm_idle = get_value(eng, 'ENGINE_DATA', 'MINIMUM', 0)
-        report.engine_inertia = get_value(eng, 'ENGINE_DATA', 'INERTIA', 0.0)
-        report.power_curve_file = get_raw(eng, 'HEADER', 'POWER_CURVE', '')
-        
-        # Check for turbo
-        report.has_turbo = 'TURBO_0' in eng
-        if report.has_turbo:
-            report.turbo_max_boost = get_value(eng, 'TURBO_0', 'MAX_BOOST', 0.0)
-    
+    return identity
+
+
+def _fill_identity(identity: CarIdentity, report: PhysicsReport):
     identity.total_mass = report.total_mass
     identity.wheelbase = report.wheelbase
     identity.front_track = report.front_track
@@ -257,8 +473,79 @@ def analyze_car(path: str | Path) -> PhysicsReport:
     identity.drivetrain = report.drivetrain_type
     identity.steer_lock = report.steer_lock
     identity.max_fuel = report.fuel_capacity
-    identity.files_found = list(scan.core_files.keys()) + list(scan.optional_files.keys())
-    identity.lut_files = [f.name for f in scan.lut_files]
-    
-    report.identity = identity
-    return report
+    identity.front_susp_type = report.front_type
+    identity.rear_susp_type = report.rear_type
+    identity.front_spring_rate = report.front_spring_rate
+    identity.rear_spring_rate = report.rear_spring_rate
+
+
+if __name__ == '__main__':
+    import sys
+    import json
+    import argparse
+
+    # The pool pickles workers by module name, so use the package's copy
+    # of this module rather than __main__'s
+    from src.analyzer import analyze_many, record_fields
+
+    ap = argparse.ArgumentParser(prog='python -m src.analyzer', description="Analyze AC car folders.")
+    sub = ap.add_subparsers(dest='command', required=True)
+    one = sub.add_parser('car', help="print the physics summary of car folders")
+    one.add_argument('paths', nargs='+', type=Path)
+    batch = sub.add_parser('batch', help="analyze every car folder under a root, one JSON line per car")
+    batch.add_argument('root', type=Path)
+    batch.add_argument('-o', '--output', type=Path, help="write JSON lines here instead of stdout")
+    batch.add_argument('--workers', type=int, default=None,
+                       help="worker processes (default: CPU count; 0 = no pool)")
+    batch.add_argument('--resume', action='store_true',
+                       help="skip cars already in --output and append the rest")
+    batch.add_argument('--fields', help="comma-separated report fields to keep (path, seconds and error always are)")
+    args = ap.parse_args()
+
+    if args.command == 'car':
+        for path in args.paths:
+            print(analyze_car(path).summary())
+        sys.exit(0)
+
+    keys = None
+    if args.fields:
+        keys = [name.strip() for name in args.fields.split(',') if name.strip()]
+        unknown = sorted(set(keys) - set(record_fields()))
+        if unknown:
+            ap.error(f"unknown field(s): {', '.join(unknown)}")
+    if args.resume and args.output is None:
+        ap.error("--resume needs --output")
+
+    done = set()
+    if args.resume and args.output.exists():
+        # Drop a line cut short by an interrupted run, then skip what's there
+        data = args.output.read_bytes()
+        complete = data[:data.rfind(b'\n') + 1]
+        if len(complete) != len(data):
+            with open(args.output, 'r+b') as fh:
+                fh.truncate(len(complete))
+        for line in complete.splitlines():
+            try:
+                done.add(json.loads(line)['path'])
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    cars = sorted(str(args.root / e.name) for e in os.scandir(args.root) if e.is_dir())
+    todo = [car for car in cars if car not in done]
+    out = open(args.output, 'a' if args.resume else 'w', encoding='utf-8') if args.output else sys.stdout
+    print(f"🏎️  {len(todo)} car(s) to analyze ({len(cars) - len(todo)} already done)", file=sys.stderr)
+
+    start = time.perf_counter()
+    errors = 0
+    try:
+        for line in analyze_many(todo, workers=args.workers, keys=keys):
+            errors += 'error' in line
+            out.write(json.dumps(line, default=str) + '\n')
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    rate = len(todo) / elapsed if elapsed else 0.0
+    print(f"✅ {len(todo) - errors} analyzed, {errors} failed in {elapsed:.1f} s ({rate:.0f} cars/s)",
+          file=sys.stderr)
@@ -0,0 +1,213 @@
+"""
+AC Archive Scanner
+Finds the cars inside a .zip or .7z download and reads their physics
+files straight from the archive, without extracting it.
+
+Only the archive's index is read to list members. The layout rules are
+the same ones scan_folder uses, applied to the member tree. Then only the
+small data/ members are decompressed; KN5 models and textures are never
+touched. .7z support needs the optional py7zr package.
+"""
+
+import lzma
+import zipfile
+from pathlib import Path, PurePosixPath
+
+from .folder_scanner import ScanResult, _Listing, _scan_layout, _has_physics_files, _detect_prefix, _data_dir_name
+from .ini_parser import parse_ini_bytes
+
+try:
+    import py7zr
+    import py7zr.io
+except ImportError:  # only .7z archives need it
+    py7zr = None
+
+
+# What opening or reading a damaged or unreadable archive raises: Bad7zFile
+# and CrcError are py7zr ArchiveErrors, corrupt LZMA data fails in lzma
+# itself, and zipfile raises NotImplementedError for an unsupported
+# compression method and RuntimeError for an encrypted member
+ARCHIVE_ERRORS = (ValueError, zipfile.BadZipFile, lzma.LZMAError, NotImplementedError, RuntimeError,
+                  *((py7zr.exceptions.ArchiveError, py7zr.exceptions.PasswordRequired)
+                    if py7zr is not None else ()))
+
+_7Z_MAGIC = b'7z\xbc\xaf\x27\x1c'
+
+_ROOT = PurePosixPath('.')
+
+
+class CarArchive:
+    """A car archive opened for scanning.
+
+    cars holds one ScanResult per car found, with member paths
+    (PurePosixPath) where scan_folder would have file paths. read() and
+    parse() decompress just the members asked for.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        with open(self.path, 'rb') as fh:
+            magic = fh.read(6)
+        # is_zipfile finds the central directory, so self-extracting and
+        # empty zips count too
+        if zipfile.is_zipfile(self.path):
+            self.format = 'zip'
+            self._zip = zipfile.ZipFile(self.path)
+            names = [info.filename for info in self._zip.infolist() if not info.is_dir()]
+        elif magic == _7Z_MAGIC:
+            if py7zr is None:
+                raise ImportError("Reading .7z archives needs py7zr (pip install py7zr)")
+            self.format = '7z'
+            self._zip = None
+            with py7zr.SevenZipFile(self.path) as sz:
+                names = [info.filename for info in sz.list() if not info.is_directory]
+        else:
+            raise ValueError(f"Not a .zip or .7z archive: {self.path}")
+
+        # Member tree keyed by directory; names are normalized to / separators
+        self._members = {}   # normalized path → name as stored in the archive
+        self._tree = {}      # directory → ([(name, path)], {subdir names})
+        for name in names:
+            member = PurePosixPath(name.replace('\\', '/').lstrip('/'))
+            self._members[member] = name
+            parent = member.parent
+            self._dir(parent)[0].append((member.name, member))
+            while parent != _ROOT:
+                self._dir(parent.parent)[1].add(parent.name)
+                parent = parent.parent
+        self._cars = None
+
+    def _dir(self, directory: PurePosixPath):
+        entry = self._tree.get(directory)
+        if entry is None:
+            entry = self._tree[directory] = ([], set())
+        return entry
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def members(self) -> list[PurePosixPath]:
+        return list(self._members)
+
+    @property
+    def cars(self) -> list[ScanResult]:
+        """A ScanResult for every car folder in the archive, outermost first."""
+        if self._cars is None:
+            self._cars = self._find_cars()
+        return self._cars
+
+    def _list_dir(self, directory: PurePosixPath):
+        entry = self._tree.get(directory)
+        return _Listing(*entry) if entry is not None else None
+
+    def _find_cars(self) -> list[ScanResult]:
+        # A car root is a folder with a data/ subfolder, or a folder holding
+        # physics files itself (flat or prefixed). Roots inside a car that
+        # was already found (its data/, data/data/) are not cars of their own.
+        candidates = []
+        for directory, (files, dirs) in self._tree.items():
+            listing = _Listing(files, dirs)
+            if _data_dir_name(listing) or _has_physics_files(listing) or _detect_prefix(listing):
+                candidates.append(directory)
+        candidates.sort(key=lambda d: (len(d.parts), str(d)))
+
+        cars = []
+        claimed = []  # folders belonging to a car already found
+        for directory in candidates:
+            if any(directory == c or c in directory.parents for c in claimed):
+                continue
+            result = _scan_layout(directory, self._list_dir)
+            if not result.core_files:
+                continue
+            cars.append(result)
+            # A car at the archive root only claims its data folder, so
+            # other cars packed beside it are still found
+            claimed.append(result.root_path if result.root_path != _ROOT else result.data_path)
+        return cars
+
+    def read(self, members) -> dict:
+        """Decompress only the given members; returns {member: bytes}."""
+        members = [PurePosixPath(m) for m in members]
+        names = {self._members[m]: m for m in members}
+        if self.format == 'zip':
+            return {member: self._zip.read(name) for name, member in names.items()}
+
+        # py7zr decompresses a solid block up to the last member asked for,
+        # but only the requested members are kept
+        with py7zr.SevenZipFile(self.path) as sz:
+            if hasattr(sz, 'read'):  # py7zr < 1.0
+                data = sz.read(targets=list(names))
+                return {names[n]: bio.read() for n, bio in data.items() if n in names}
+            factory = py7zr.io.BytesIOFactory(limit=1 << 30)
+            sz.extract(targets=list(names), factory=factory)
+            return {member: factory.get(name).read() for name, member in names.items()}
+
+    def physics_members(self, car: ScanResult) -> list[PurePosixPath]:
+        """Every member a car's physics uses: core, optional, LUT and other INI files."""
+        return list(dict.fromkeys([*car.core_files.values(), *car.optional_files.values(),
+                                   *car.lut_files, *car.unknown_files]))
+
+    def parse(self, car: ScanResult, compact: bool = False) -> dict:
+        """{logical name: parsed sections} for a car's core files, in one read."""
+        data = self.read(car.core_files.values())
+        return {name: parse_ini_bytes(data[member], compact=compact)
+                for name, member in car.core_files.items()}
+
+    def extract_physics(self, car: ScanResult, dest: str | Path) -> list[Path]:
+        """Write a car's physics members into dest (flattened to their file
+        names, as an upload would have them); returns the written paths."""
+        return self.extract(self.physics_members(car), dest)
+
+    def extract(self, members, dest: str | Path) -> list[Path]:
+        """Write members into dest, flattened to their file names; returns
+        the written paths. Raises FileExistsError, before writing anything,
+        if two members share a file name, rather than letting one silently
+        replace the other."""
+        members = [PurePosixPath(m) for m in members]
+        by_name = {}
+        for member in members:
+            other = by_name.setdefault(member.name, member)
+            if other != member:
+                raise FileExistsError(f"{other} and {member} would both be extracted as {member.name}")
+        dest = Path(dest)
+        written = []
+        for member, data in self.read(members).items():
+            out = dest / member.name
+            out.write_bytes(data)
+            written.append(out)
+        return written
+
+
+def scan_archive(path: str | Path) -> list[ScanResult]:
+    """The cars in an archive, found from its member list alone."""
+    with CarArchive(path) as archive:
+        return archive.cars
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+
+    if len(sys.argv) < 2:
+        print("Usage: python -m src.archive_scanner <archive.zip|.7z> [...]")
+        sys.exit(1)
+
+    for arg in sys.argv[1:]:
+        start = time.perf_counter()
+        with CarArchive(arg) as archive:
+            cars = archive.cars
+            listed = time.perf_counter() - start
+            parsed = [archive.parse(car) for car in cars]
+        elapsed = time.perf_counter() - start
+        print(f"📦 {arg}: {len(archive.members)} members, {len(cars)} car(s) "
+              f"(listed in {listed*1000:.1f} ms, parsed in {elapsed*1000:.1f} ms)")
+        for car, files in zip(cars, parsed):
+            print(f"  {car.root_path} [{car.layout}] {', '.join(sorted(files))}")
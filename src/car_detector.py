@@ -4,10 +4,8 @@ Identifies a car's make, model, and year from its data files.
 Uses multiple signals: SCREEN_NAME, SHORT_NAME, folder name, and physics clues.
 """
 
-import re
 from pathlib import Path
 from dataclasses import dataclass, field
-from .ini_parser import parse_ini_file, get_value, get_raw
 
 
 # Known makes and common aliases
@@ -86,6 +84,41 @@ CHASSIS_CODES = {
 }
 
 
+class KeywordMatcher:
+    """Finds the best-ranked of many keywords that occurs in a text.
+    
+    Keywords are ranked in the order given and matched case-insensitively
+    as substrings, so match() gives the same answer as looping over them
+    with `kw.lower() in text.lower()`. The keywords are lower-cased and
+    de-duplicated once, up front, and the text once per call.
+    
+    For a few dozen to a few hundred short keywords against names this
+    short, a ranked scan of C-level substring checks beats one pass of a
+    big regex alternation (or a pure-Python automaton), so that is the
+    compiled form.
+    """
+    
+    def __init__(self, keywords):
+        """keywords: an iterable of keywords, or of (keyword, value) pairs."""
+        self.values = {}  # lower-cased keyword → value, in rank order
+        for item in keywords:
+            kw, value = (item, item) if isinstance(item, str) else item
+            self.values.setdefault(kw.lower(), value)
+        self._keywords = tuple(self.values)
+    
+    def match(self, text: str):
+        """(keyword, value) for the best-ranked keyword in text, or None."""
+        text = text.lower()
+        for kw in self._keywords:
+            if kw in text:
+                return kw, self.values[kw]
+        return None
+
+
+_CHASSIS_MATCHER = KeywordMatcher(CHASSIS_CODES)
+_MAKE_MATCHER = KeywordMatcher(KNOWN_MAKES.items())
+
+
 @dataclass
 class CarIdentity:
     """Detected car identity."""
@@ -137,56 +170,32 @@ class CarIdentity:
         return '\n'.join(lines)
 
 
-def detect_car(data_folder: str | Path) -> CarIdentity:
-    """Detect car identity from an AC data folder."""
+def detect_car(data_folder: str | Path, fingerprints=None) -> CarIdentity:
+    """Detect car identity from an AC data folder.
+    
+    Reads only car.ini, suspensions.ini and drivetrain.ini, through the
+    same pipeline as analyze_car. Given a car folder instead of its data/,
+    a folder name that identifies the car wins over SCREEN_NAME.
+    fingerprints is an optional src.fingerprint.FingerprintIndex, used when
+    no name identifies the car.
+    """
+    from .analyzer import CarPipeline  # the analyzer builds on this module
     data_folder = Path(data_folder)
-    identity = CarIdentity()
+    identity = CarPipeline(data_folder, fingerprints=fingerprints).identity
     
-    # Inventory all files
+    # Given a car folder rather than its data/, the folder's name has always
+    # come first; the files' SCREEN_NAME is only the fallback
+    if not (data_folder / 'car.ini').is_file():
+        by_folder = CarIdentity()
+        _identify_from_name(by_folder, data_folder.name, 'folder name')
+        if by_folder.confidence >= 0.5:
+            for name in ('make', 'model', 'year_range', 'chassis_code', 'confidence', 'source'):
+                setattr(identity, name, getattr(by_folder, name))
+    
+    # Inventory all files, not just the recognised physics ones
     if data_folder.is_dir():
         identity.files_found = [f.name for f in data_folder.iterdir() if f.is_file()]
         identity.lut_files = [f for f in identity.files_found if f.endswith('.lut')]
-    
-    # Parse car.ini
-    car_ini = data_folder / 'car.ini'
-    if car_ini.exists():
-        car = parse_ini_file(car_ini)
-        
-        screen_name = get_raw(car, 'INFO', 'SCREEN_NAME', '')
-        short_name = get_raw(car, 'INFO', 'SHORT_NAME', '')
-        
-        identity.total_mass = get_value(car, 'BASIC', 'TOTALMASS', 0.0)
-        identity.steer_lock = get_value(car, 'CONTROLS', 'STEER_LOCK', 0.0)
-        identity.max_fuel = get_value(car, 'FUEL', 'MAX_FUEL', 0.0)
-        
-        # Try to identify from screen name first
-        _identify_from_name(identity, screen_name, 'SCREEN_NAME')
-        if identity.confidence < 0.5 and short_name:
-            _identify_from_name(identity, short_name, 'SHORT_NAME')
-    
-    # Parse suspensions.ini
-    susp_ini = data_folder / 'suspensions.ini'
-    if susp_ini.exists():
-        susp = parse_ini_file(susp_ini)
-        identity.wheelbase = get_value(susp, 'BASIC', 'WHEELBASE', 0.0)
-        identity.front_track = get_value(susp, 'FRONT', 'TRACK', 0.0)
-        identity.rear_track = get_value(susp, 'REAR', 'TRACK', 0.0)
-        identity.front_susp_type = get_raw(susp, 'FRONT', 'TYPE', '')
-        identity.rear_susp_type = get_raw(susp, 'REAR', 'TYPE', '')
-        identity.front_spring_rate = get_value(susp, 'FRONT', 'SPRING_RATE', 0.0)
-        identity.rear_spring_rate = get_value(susp, 'REAR', 'SPRING_RATE', 0.0)
-    
-    # Parse drivetrain.ini
-    dt_ini = data_folder / 'drivetrain.ini'
-    if dt_ini.exists():
-        dt = parse_ini_file(dt_ini)
-        identity.drivetrain = get_raw(dt, 'TRACTION', 'TYPE', '')
-    
-    # Fallback: try folder name
-    if identity.confidence < 0.5:
-        folder_name = data_folder.parent.name if data_folder.name == 'data' else data_folder.name
-        _identify_from_name(identity, folder_name, 'folder name')
-    
     return identity
 
 
@@ -198,30 +207,30 @@ def _identify_from_name(identity: CarIdentity, name: str, source: str):
     name_lower = name.lower().strip()
     
     # Check chassis codes first (most specific)
-    for code, (make, model, years) in CHASSIS_CODES.items():
-        if code in name_lower.replace('-', '').replace(' ', ''):
-            identity.make = make
-            identity.model = model
-            identity.year_range = years
-            identity.chassis_code = code.upper()
-            identity.confidence = 0.9
-            identity.source = f"{source}: '{name}'"
-            return
+    hit = _CHASSIS_MATCHER.match(name_lower.replace('-', '').replace(' ', ''))
+    if hit:
+        code = hit[0]
+        identity.make, identity.model, identity.year_range = CHASSIS_CODES[code]
+        identity.chassis_code = code.upper()
+        identity.confidence = 0.9
+        identity.source = f"{source}: '{name}'"
+        return
     
     # Check known makes
-    for alias, make in KNOWN_MAKES.items():
-        if alias in name_lower:
-            identity.make = make
-            # Try to extract model (everything after the make name)
-            idx = name_lower.find(alias)
-            remainder = name[idx + len(alias):].strip().strip('-_').strip()
-            if remainder:
-                identity.model = remainder
-            else:
-                identity.model = name
-            identity.confidence = 0.7
-            identity.source = f"{source}: '{name}'"
-            return
+    hit = _MAKE_MATCHER.match(name_lower)
+    if hit:
+        alias, make = hit
+        identity.make = make
+        # Try to extract model (everything after the make name)
+        idx = name_lower.find(alias)
+        remainder = name[idx + len(alias):].strip().strip('-_').strip()
+        if remainder:
+            identity.model = remainder
+        else:
+            identity.model = name
+        identity.confidence = 0.7
+        identity.source = f"{source}: '{name}'"
+        return
     
     # Last resort: use the full name as model
     identity.model = name
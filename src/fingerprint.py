@@ -0,0 +1,228 @@
+"""
+AC Physics Fingerprints
+Identifies a car from its physics when its names give nothing away
+(e.g. 'X10DD.Battle-xyz'): total mass, wheelbase and track widths are
+matched against reference cars, the built-in car database and/or an
+analyzed library, through a k-d tree.
+
+Distances are in units of SCALES, so 1.0 means about 100 kg or a few
+centimetres of wheelbase/track away. A drivetrain mismatch adds
+DRIVETRAIN_PENALTY.
+"""
+
+import math
+import heapq
+from dataclasses import dataclass, replace
+
+from .car_detector import CarIdentity
+
+
+# Fingerprint features and what one unit of distance means for each
+FEATURES = ('total_mass', 'wheelbase', 'front_track', 'rear_track')
+SCALES = (100.0, 0.05, 0.04, 0.04)
+
+# Distance added between cars whose (known) drivetrains differ
+DRIVETRAIN_PENALTY = 2.0
+
+# Confidence of an exact fingerprint match; below a chassis-code hit (0.9)
+MAX_CONFIDENCE = 0.8
+
+# CarIdentity.source prefix of an identity taken from a fingerprint match
+FINGERPRINT_SOURCE = "physics fingerprint"
+
+_LEAF_SIZE = 8
+
+
+@dataclass
+class FingerprintMatch:
+    """A reference car close to the queried fingerprint."""
+    key: str            # CAR_DATABASE id or library car path
+    make: str
+    model: str
+    chassis_code: str
+    year_range: str
+    drivetrain: str
+    distance: float
+    confidence: float
+    source: str         # 'database' or 'library'
+
+
+class FingerprintIndex:
+    """Reference cars indexed by physics fingerprint.
+
+    Add references with add(), add_database() or add_library(); the trees
+    are (re)built on the first query after a change.
+    """
+
+    def __init__(self):
+        self._refs = []     # (scaled features, drivetrain, FingerprintMatch template)
+        self._trees = None  # drivetrain → _KDTree
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def add(self, key: str, make: str, model: str, total_mass: float, wheelbase: float,
+            front_track: float, rear_track: float, drivetrain: str = '',
+            chassis_code: str = '', year_range: str = '', source: str = '') -> bool:
+        """Add one reference car; False (and skipped) if a feature is missing."""
+        values = (total_mass, wheelbase, front_track, rear_track)
+        if not all(isinstance(v, (int, float)) and v > 0 for v in values):
+            return False
+        point = tuple(v / s for v, s in zip(values, SCALES))
+        drivetrain = _drivetrain_group(drivetrain)
+        self._refs.append((point, drivetrain, FingerprintMatch(
+            key=key, make=make, model=model, chassis_code=chassis_code or '',
+            year_range=year_range or '', drivetrain=drivetrain,
+            distance=0.0, confidence=0.0, source=source,
+        )))
+        self._trees = None
+        return True
+
+    def add_database(self, database: dict) -> int:
+        """Add the cars of a CAR_DATABASE-style dict; returns how many were usable."""
+        added = 0
+        for car_id, car in database.items():
+            added += self.add(
+                car_id, car.get('make', ''), car.get('model', ''),
+                car.get('mass_kg'), car.get('wheelbase_m'),
+                car.get('track_f_m'), car.get('track_r_m'),
+                drivetrain=car.get('drivetrain', ''),
+                chassis_code=car.get('chassis', ''), year_range=car.get('year', ''),
+                source='database',
+            )
+        return added
+
+    def add_library(self, index, min_confidence: float = 0.5) -> int:
+        """Add the analyzed cars of a LibraryIndex whose own identification
+        is at least min_confidence (name-only guesses make poor references)."""
+        added = 0
+        for car in index.cars(valid_only=True):
+            if (car.get('confidence') or 0.0) < min_confidence:
+                continue
+            added += self.add(
+                car['path'], car.get('make') or '', car.get('model') or '',
+                car.get('total_mass'), car.get('wheelbase'),
+                car.get('front_track'), car.get('rear_track'),
+                drivetrain=car.get('drivetrain_type') or '',
+                chassis_code=car.get('chassis_code'), year_range=car.get('year_range'),
+                source='library',
+            )
+        return added
+
+    def nearest(self, total_mass: float, wheelbase: float, front_track: float = 0.0,
+                rear_track: float = 0.0, drivetrain: str = '', k: int = 5) -> list[FingerprintMatch]:
+        """The k reference cars closest to a fingerprint, nearest first.
+
+        Features that are 0 (unknown) are left out of the distance, as is
+        the drivetrain when it is empty.
+        """
+        values = (total_mass, wheelbase, front_track, rear_track)
+        query = tuple((v or 0.0) / s for v, s in zip(values, SCALES))
+        weights = tuple(1.0 if v else 0.0 for v in values)
+        if not any(weights) or k <= 0:
+            return []
+        if self._trees is None:
+            self._build()
+
+        drivetrain = _drivetrain_group(drivetrain)
+        heap = []  # (-distance², ref number), the k best so far
+        # The drivetrain's own tree first, so the others are mostly pruned
+        for group in sorted(self._trees, key=lambda g: g != drivetrain):
+            offset = DRIVETRAIN_PENALTY ** 2 if drivetrain and group and group != drivetrain else 0.0
+            self._trees[group].query(query, weights, k, heap, offset)
+
+        matches = []
+        for neg_d2, ref in sorted(heap, reverse=True):
+            distance = math.sqrt(-neg_d2)
+            matches.append(replace(
+                self._refs[ref][2], distance=distance,
+                confidence=round(MAX_CONFIDENCE * math.exp(-distance * distance / 2), 3),
+            ))
+        return matches
+
+    def identify(self, identity: CarIdentity, k: int = 5) -> list[FingerprintMatch]:
+        """Match a CarIdentity's physics; if the best match is more
+        confident than the identity already is, take its make/model."""
+        matches = self.nearest(identity.total_mass, identity.wheelbase, identity.front_track,
+                               identity.rear_track, identity.drivetrain, k=k)
+        if matches and matches[0].confidence > identity.confidence:
+            best = matches[0]
+            identity.make = best.make
+            identity.model = best.model
+            identity.year_range = best.year_range
+            identity.chassis_code = best.chassis_code
+            identity.confidence = best.confidence
+            identity.source = f"{FINGERPRINT_SOURCE}: '{best.key}' (distance {best.distance:.2f})"
+        return matches
+
+    def _build(self):
+        groups = {}
+        for ref, (point, drivetrain, _) in enumerate(self._refs):
+            groups.setdefault(drivetrain, ([], []))
+            groups[drivetrain][0].append(point)
+            groups[drivetrain][1].append(ref)
+        self._trees = {group: _KDTree(points, ids) for group, (points, ids) in groups.items()}
+
+
+def _drivetrain_group(drivetrain: str) -> str:
+    """'RWD', 'FWD', 'AWD' (AC's AWD2 included) or '' if unknown."""
+    group = (drivetrain or '').strip().upper()[:3]
+    return group if group in ('RWD', 'FWD', 'AWD') else ''
+
+
+class _KDTree:
+    """Static k-d tree in flat lists: each range's median point sits in its
+    middle, split on the axis for its depth, down to leaves of _LEAF_SIZE."""
+
+    def __init__(self, points: list, ids: list):
+        order = list(range(len(points)))
+        self._dims = len(points[0]) if points else 0
+        self._build(points, order, 0, len(order), 0)
+        self.points = [points[i] for i in order]
+        self.ids = [ids[i] for i in order]
+
+    def _build(self, points, order, lo, hi, axis):
+        if hi - lo <= _LEAF_SIZE:
+            return
+        order[lo:hi] = sorted(order[lo:hi], key=lambda i: points[i][axis])
+        mid = (lo + hi) // 2
+        nxt = (axis + 1) % self._dims
+        self._build(points, order, lo, mid, nxt)
+        self._build(points, order, mid + 1, hi, nxt)
+
+    def query(self, q: tuple, w: tuple, k: int, heap: list, offset: float = 0.0):
+        """Push the k nearest points into heap as (-distance², id), keeping
+        whatever better entries it already holds. offset is added to every
+        distance²."""
+        points, ids, dims = self.points, self.ids, self._dims
+
+        def visit(i):
+            p = points[i]
+            d2 = offset
+            for a in range(dims):
+                diff = q[a] - p[a]
+                d2 += w[a] * diff * diff
+            if len(heap) < k:
+                heapq.heappush(heap, (-d2, ids[i]))
+            elif d2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-d2, ids[i]))
+
+        def search(lo, hi, axis):
+            if hi - lo <= _LEAF_SIZE:
+                for i in range(lo, hi):
+                    visit(i)
+                return
+            mid = (lo + hi) // 2
+            visit(mid)
+            diff = q[axis] - points[mid][axis]
+            nxt = (axis + 1) % dims
+            if diff < 0:
+                near, far = (lo, mid), (mid + 1, hi)
+            else:
+                near, far = (mid + 1, hi), (lo, mid)
+            search(near[0], near[1], nxt)
+            if len(heap) < k or offset + w[axis] * diff * diff < -heap[0][0]:
+                search(far[0], far[1], nxt)
+
+        if points:
+            search(0, len(points), 0)
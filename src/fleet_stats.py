@@ -0,0 +1,205 @@
+"""
+AC Fleet Statistics
+Distributions and outliers over many analyzed cars, computed from a
+FleetStore's columns in vectorized passes: derived chassis metrics
+(natural frequencies, weight distribution, spring and ARB balance) per
+car, their per-group distributions (per pack, make, drivetrain, ...) and
+the cars whose z-score within their group stands out.
+
+Derived values follow app_v2's stock calculations: sprung mass is the
+total minus four hub masses, split front/rear by CG_LOCATION. Values
+that can't be computed (missing fields, zero springs) are NaN and left
+out of every statistic. Requires numpy.
+"""
+
+from .fleet_store import FleetStore, np
+
+
+# Metrics derived per car (see derived_metrics), plus raw report columns
+DERIVED = ('front_weight_pct', 'nat_freq_f', 'nat_freq_r', 'freq_ratio', 'spring_ratio', 'arb_ratio')
+METRICS = DERIVED + ('total_mass', 'wheelbase', 'front_hub_mass', 'rear_hub_mass')
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+# Groups smaller than this get distributions but no outliers
+MIN_GROUP_SIZE = 5
+
+
+def derived_metrics(store: FleetStore) -> dict:
+    """{metric: float64 array over the store's rows} for DERIVED."""
+    col = {name: _floats(store[name]) for name in (
+        'total_mass', 'cg_location', 'front_hub_mass', 'rear_hub_mass',
+        'front_spring_rate', 'rear_spring_rate', 'arb_front', 'arb_rear')}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        wdf = col['cg_location']
+        sprung = col['total_mass'] - 2 * (col['front_hub_mass'] + col['rear_hub_mass'])
+        corner_f = sprung * wdf / 2
+        corner_r = sprung * (1 - wdf) / 2
+        freq_f = np.sqrt(col['front_spring_rate'] / corner_f) / (2 * np.pi)
+        freq_r = np.sqrt(col['rear_spring_rate'] / corner_r) / (2 * np.pi)
+        metrics = {
+            'front_weight_pct': wdf * 100,
+            'nat_freq_f': freq_f,
+            'nat_freq_r': freq_r,
+            'freq_ratio': freq_f / freq_r,
+            'spring_ratio': col['front_spring_rate'] / col['rear_spring_rate'],
+            'arb_ratio': col['arb_front'] / col['arb_rear'],
+        }
+    # A value from missing or zero inputs is not a measurement
+    valid_cg = (wdf > 0) & (wdf < 1)
+    for name, values in metrics.items():
+        values[~np.isfinite(values) | (values <= 0)] = np.nan
+        if name != 'spring_ratio' and name != 'arb_ratio':
+            values[~valid_cg] = np.nan
+    return metrics
+
+
+def metric_columns(store: FleetStore, metrics=METRICS) -> dict:
+    """{metric: float64 array}: derived metrics and raw columns by name.
+    Raw columns read 0 as missing."""
+    derived = derived_metrics(store) if any(m in DERIVED for m in metrics) else {}
+    out = {}
+    for name in metrics:
+        if name in derived:
+            out[name] = derived[name]
+        else:
+            values = _floats(store[name]).copy()
+            values[values == 0] = np.nan
+            out[name] = values
+    return out
+
+
+def pack_labels(store: FleetStore):
+    """The library/pack folder of every car: its path's parent folder name.
+    Paths may use either separator (a fleet built on Windows)."""
+    paths = np.char.replace(np.asarray(store['path']), '\\', '/')
+    parent = np.char.rpartition(paths, '/')[:, 0]
+    return np.char.rpartition(parent, '/')[:, 2]
+
+
+def distributions(store: FleetStore, by=None, metrics=METRICS) -> dict:
+    """{group: {metric: {count, mean, std, min, p25, median, p75, max}}}.
+
+    `by` is a column name ('make', 'drivetrain_type', ...), 'pack' for
+    pack_labels(), an array with a label per row, or None for the whole
+    fleet (one group, 'all'). Each metric is one sort plus bincounts
+    across all groups at once.
+    """
+    groups, codes = _groups(store, by)
+    table = {g: {} for g in groups}
+    for name, values in metric_columns(store, metrics).items():
+        stats = _group_stats(values, codes, len(groups))
+        for i, g in enumerate(groups):
+            table[g][name] = {key: _num(column[i]) for key, column in stats.items()}
+    return table
+
+
+def outliers(store: FleetStore, by=None, metrics=METRICS, threshold: float = 3.0,
+             min_group: int = MIN_GROUP_SIZE) -> list[dict]:
+    """Cars with |z| >= threshold for a metric within their group, most
+    extreme first. Groups smaller than min_group are skipped."""
+    groups, codes = _groups(store, by)
+    paths = store['path']
+    found = []
+    for name, values in metric_columns(store, metrics).items():
+        stats = _group_stats(values, codes, len(groups))
+        mean, std, count = stats['mean'][codes], stats['std'][codes], stats['count'][codes]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z = (values - mean) / std
+        rows = np.flatnonzero((np.abs(z) >= threshold) & (count >= min_group) & (std > 0))
+        for i in rows:
+            found.append({
+                'path': str(paths[i]), 'group': groups[codes[i]], 'metric': name,
+                'value': float(values[i]), 'z': float(z[i]),
+                'group_mean': float(mean[i]), 'group_std': float(std[i]),
+            })
+    found.sort(key=lambda o: -abs(o['z']))
+    return found
+
+
+def _groups(store: FleetStore, by):
+    """(group labels, group number of every row)."""
+    if by is None:
+        return ['all'], np.zeros(len(store), dtype=np.intp)
+    if isinstance(by, str) and by != 'pack':
+        groups, codes = store._group(by)
+    else:
+        labels = pack_labels(store) if isinstance(by, str) else np.asarray(by)
+        groups, codes = np.unique(labels, return_inverse=True)
+    return [g.item() for g in groups], codes.reshape(-1)
+
+
+def _group_stats(values, codes, n_groups: int) -> dict:
+    """Per-group count/mean/std/min/quantiles/max of values (NaNs skipped)
+    as arrays indexed by group number."""
+    valid = ~np.isnan(values)
+    v, c = values[valid], codes[valid]
+    count = np.bincount(c, minlength=n_groups)
+    total = np.bincount(c, weights=v, minlength=n_groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / count
+        var = np.bincount(c, weights=(v - mean[c]) ** 2, minlength=n_groups) / count
+
+    # Sorted by group, then value: group g's values are one contiguous run.
+    # Two argsorts (the second stable) beat np.lexsort by about 2x here
+    order = np.argsort(v)
+    order = order[np.argsort(c[order], kind='stable')]
+    v_sorted = v[order]
+    start = np.concatenate(([0], np.cumsum(count)[:-1]))
+    has = count > 0
+    stats = {'count': count, 'mean': mean, 'std': np.sqrt(var)}
+    stats['min'] = np.where(has, v_sorted[np.minimum(start, len(v) - 1)] if len(v) else np.nan, np.nan)
+    for q, key in zip(QUANTILES, ('p25', 'median', 'p75')):
+        stats[key] = _quantile(v_sorted, start, count, q)
+    stats['max'] = np.where(has, v_sorted[np.maximum(start + count - 1, 0)] if len(v) else np.nan, np.nan)
+    return stats
+
+
+def _quantile(v_sorted, start, count, q: float):
+    """Linear-interpolated quantile of each group's sorted run."""
+    if not len(v_sorted):
+        return np.full(len(count), np.nan)
+    pos = start + q * np.maximum(count - 1, 0)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, start + np.maximum(count - 1, 0)).astype(np.intp)
+    lo = np.minimum(lo, len(v_sorted) - 1)
+    hi = np.minimum(hi, len(v_sorted) - 1)
+    frac = pos - np.floor(pos)
+    result = v_sorted[lo] + (v_sorted[hi] - v_sorted[lo]) * frac
+    return np.where(count > 0, result, np.nan)
+
+
+def _floats(column):
+    return np.asarray(column, dtype=np.float64)
+
+
+def _num(x):
+    x = x.item()
+    return None if isinstance(x, float) and x != x else x
+
+
+if __name__ == '__main__':
+    import argparse
+    from pathlib import Path
+
+    ap = argparse.ArgumentParser(prog='python -m src.fleet_stats',
+                                 description="Fleet distributions and outliers.")
+    ap.add_argument('source', type=Path, help="fleet .npy, or batch .jsonl output")
+    ap.add_argument('--by', default='pack', help="group column, 'pack' (default) or 'none'")
+    ap.add_argument('--threshold', type=float, default=3.0, help="|z| for an outlier (default 3)")
+    args = ap.parse_args()
+
+    store = FleetStore.from_jsonl(args.source) if args.source.suffix == '.jsonl' else FleetStore.load(args.source)
+    by = None if args.by == 'none' else args.by
+    for group, table in distributions(store, by=by).items():
+        n = max(s['count'] for s in table.values())
+        print(f"\n📊 {group} ({n} cars)")
+        print(f"  {'metric':<18} {'mean':>10} {'std':>9} {'min':>10} {'median':>10} {'max':>10}")
+        for name, s in table.items():
+            if s['count']:
+                print(f"  {name:<18} {s['mean']:>10.3f} {s['std']:>9.3f} {s['min']:>10.3f} "
+                      f"{s['median']:>10.3f} {s['max']:>10.3f}")
+    found = outliers(store, by=by, threshold=args.threshold)
+    print(f"\n🚩 {len(found)} outlier(s) at |z| >= {args.threshold}")
+    for o in found:
+        print(f"  {o['path']}: {o['metric']} = {o['value']:.3f} (z {o['z']:+.1f} in {o['group']})")
@@ -0,0 +1,244 @@
+"""
+AC Fleet Store
+Report fields for a whole library in one NumPy structured array, one
+column per scalar field, so fleet questions ("RWD cars with wheelbase
+under 2.5 m and front springs over 60 kN/m") are answered with
+vectorized masks instead of a loop over PhysicsReports.
+
+A store is built from report records: analyze_many/batch JSONL output,
+a LibraryIndex, or PhysicsReports. It saves to a plain .npy file and
+loads back memory-mapped, so opening a 10k+ car fleet reads nothing
+until a column is touched. Requires numpy.
+"""
+
+import json
+import sys
+from pathlib import Path
+from dataclasses import fields
+
+from .analyzer import RECORD_IDENTITY_FIELDS, PhysicsReport, report_record
+
+try:
+    import numpy as np
+except ImportError:  # the rest of the tool works without numpy
+    np = None
+
+
+# Report fields with a scalar value, each stored as a column
+_SCALAR_KINDS = {float: 'f8', int: 'i8', bool: '?', str: 'U',
+                 'float': 'f8', 'int': 'i8', 'bool': '?', 'str': 'U'}
+COLUMNS = (
+    ('path', 'U'),
+    *((f.name, _SCALAR_KINDS[f.type]) for f in fields(PhysicsReport) if f.type in _SCALAR_KINDS),
+    *((name, 'f8' if name == 'confidence' else 'U') for name in RECORD_IDENTITY_FIELDS),
+)
+
+# Stored for values that are missing (None) in a record
+_MISSING = {'f8': float('nan'), 'i8': 0, '?': False, 'U': ''}
+_KIND_NAMES = {'f8': 'a number', 'i8': 'an integer', '?': 'a boolean', 'U': 'a string'}
+
+
+def _column_value(record: dict, name: str, kind: str):
+    """record[name] as the column's type. A value that isn't one (a list
+    for a number, 2.5 for an int) is reported and stored as missing
+    rather than failing the whole build."""
+    value = record.get(name)
+    if value is None:
+        return _MISSING[kind]
+    try:
+        if kind == 'U':
+            return str(value)
+        if isinstance(value, (list, tuple, dict)):
+            raise TypeError
+        if kind == 'f8':
+            return float(value)
+        if kind == 'i8':
+            number = float(value)
+            if not number.is_integer():
+                raise ValueError
+            return int(number)
+        if kind == '?' and value in (True, False):  # also 0 and 1
+            return bool(value)
+        raise ValueError
+    except (TypeError, ValueError, OverflowError):
+        print(f"⚠️  {record.get('path', '?')}: {name} = {value!r} is not {_KIND_NAMES[kind]}, stored as missing",
+              file=sys.stderr)
+        return _MISSING[kind]
+
+
+class FleetStore:
+    """A columnar table of car report records.
+
+    store['wheelbase'] is a column array; store[mask] (a boolean array
+    or index array) is a new store with those rows. where() filters by
+    criteria like LibraryIndex.find(), aggregate() summarizes a column
+    per group.
+    """
+
+    def __init__(self, data):
+        if np is None:
+            raise ImportError("FleetStore needs numpy (pip install numpy)")
+        self.data = data
+        self._groups = {}  # column → (unique values, row → group number)
+
+    # ── Building ──────────────────────────────────────────────────
+
+    @classmethod
+    def from_records(cls, records) -> 'FleetStore':
+        """Build from report_record()-style dicts (with 'path'). Columns a
+        record lacks, e.g. after a --fields projection, are left missing."""
+        if np is None:
+            raise ImportError("FleetStore needs numpy (pip install numpy)")
+        records = list(records)
+        columns = {name: [_column_value(r, name, kind) for r in records] for name, kind in COLUMNS}
+        dtype = np.dtype([(name, f'U{max(map(len, columns[name]), default=0) or 1}' if kind == 'U' else kind)
+                          for name, kind in COLUMNS])
+
+        data = np.empty(len(records), dtype=dtype)
+        for name, _ in COLUMNS:
+            data[name] = columns[name]
+        return cls(data)
+
+    @classmethod
+    def from_reports(cls, reports) -> 'FleetStore':
+        """Build from PhysicsReports (path taken from each report's scan)."""
+        return cls.from_records(
+            {'path': str(r.scan.root_path) if r.scan is not None else '', **report_record(r)}
+            for r in reports
+        )
+
+    @classmethod
+    def from_jsonl(cls, path: str | Path) -> 'FleetStore':
+        """Build from `python -m src.analyzer batch` output; failed cars are skipped."""
+        records = []
+        with open(path, encoding='utf-8') as fh:
+            for line in fh:
+                if line.strip():
+                    record = json.loads(line)
+                    if 'error' not in record:
+                        records.append(record)
+        return cls.from_records(records)
+
+    @classmethod
+    def from_index(cls, index, root: str | Path | None = None) -> 'FleetStore':
+        """Build from the cars of a LibraryIndex."""
+        return cls.from_records(index.cars(root))
+
+    # ── Files ─────────────────────────────────────────────────────
+
+    def save(self, path: str | Path):
+        """Write the table as a .npy file (no pickled objects)."""
+        with open(path, 'wb') as fh:
+            np.save(fh, self.data, allow_pickle=False)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> 'FleetStore':
+        """Open a saved store, memory-mapped (read-only) unless mmap=False."""
+        if np is None:
+            raise ImportError("FleetStore needs numpy (pip install numpy)")
+        return cls(np.load(path, mmap_mode='r' if mmap else None, allow_pickle=False))
+
+    # ── Queries ───────────────────────────────────────────────────
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.data[key]
+        return FleetStore(self.data[key])
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self.data.dtype.names)
+
+    def mask(self, **criteria):
+        """Boolean row mask for criteria, e.g.
+        mask(drivetrain_type='RWD', wheelbase=(None, 2.5), front_spring_rate=(60000, None)).
+
+        A (low, high) tuple is an inclusive range; None on either side
+        leaves it open. A list or set matches any of its values. Any
+        other value must match exactly.
+        """
+        keep = np.ones(len(self.data), dtype=bool)
+        for column, value in criteria.items():
+            if column not in self.data.dtype.names:
+                raise ValueError(f"Unknown fleet column: {column}")
+            col = self.data[column]
+            if isinstance(value, tuple):
+                low, high = value
+                if low is not None:
+                    keep &= col >= low
+                if high is not None:
+                    keep &= col <= high
+            elif isinstance(value, (list, set, frozenset)):
+                keep &= np.isin(col, list(value))
+            else:
+                keep &= col == value
+        return keep
+
+    def where(self, **criteria) -> 'FleetStore':
+        """The rows matching every criterion (see mask())."""
+        return FleetStore(self.data[self.mask(**criteria)])
+
+    def aggregate(self, column: str, by: str | None = None) -> dict:
+        """count/mean/min/max of a numeric column, overall or per value of
+        `by`. NaNs (missing values) are left out."""
+        values = self.data[column].astype(np.float64)
+        valid = ~np.isnan(values)
+        if by is None:
+            v = values[valid]
+            return _summary(len(v), v.sum(), v.min() if len(v) else np.nan, v.max() if len(v) else np.nan)
+
+        groups, inverse = self._group(by)
+        inverse = inverse[valid]
+        v = values[valid]
+        counts = np.bincount(inverse, minlength=len(groups))
+        sums = np.bincount(inverse, weights=v, minlength=len(groups))
+        mins = np.full(len(groups), np.inf)
+        maxs = np.full(len(groups), -np.inf)
+        np.minimum.at(mins, inverse, v)
+        np.maximum.at(maxs, inverse, v)
+        return {g.item(): _summary(c, s, lo, hi)
+                for g, c, s, lo, hi in zip(groups, counts, sums, mins, maxs) if c}
+
+    def _group(self, column: str):
+        # Sorting strings is most of an aggregation's cost; the data never
+        # changes, so each column is grouped once
+        if column not in self._groups:
+            self._groups[column] = np.unique(self.data[column], return_inverse=True)
+        return self._groups[column]
+
+    def records(self) -> list[dict]:
+        """The rows back as plain dicts."""
+        names = self.data.dtype.names
+        return [{name: row[i].item() for i, name in enumerate(names)} for row in self.data]
+
+
+def _summary(count, total, low, high) -> dict:
+    count = int(count)
+    return {
+        'count': count,
+        'mean': float(total) / count if count else float('nan'),
+        'min': float(low),
+        'max': float(high),
+    }
+
+
+if __name__ == '__main__':
+    import time
+
+    if len(sys.argv) < 3:
+        print("Usage: python -m src.fleet_store <batch.jsonl | library.db> <fleet.npy>")
+        sys.exit(1)
+
+    source, target = Path(sys.argv[1]), Path(sys.argv[2])
+    start = time.perf_counter()
+    if source.suffix == '.jsonl':
+        store = FleetStore.from_jsonl(source)
+    else:
+        from .library_index import LibraryIndex
+        store = FleetStore.from_index(LibraryIndex(source))
+    store.save(target)
+    print(f"🗄  {len(store)} cars, {len(store.columns)} columns → {target} "
+          f"({target.stat().st_size / 1024:.0f} KB, {(time.perf_counter() - start)*1000:.0f} ms)")
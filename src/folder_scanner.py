@@ -5,9 +5,17 @@ Handles multiple folder layouts:
 2. Prefixed: car/data/PREFIX_car.ini, PREFIX_suspensions.ini, etc.
 3. Nested: car/data/data/ (subfolder with full data)
 4. Ryan's format: files at top level with prefix, data/ subfolder with full set
+5. Packed: car/data.acd only (decoded in memory, see read_acd)
 """
 
+import os
+import time
+import struct
+import hashlib
+import threading
 from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from dataclasses import dataclass, field
 
 
@@ -44,6 +52,7 @@ class ScanResult:
     optional_files: dict = field(default_factory=dict)
     lut_files: list = field(default_factory=list)
     unknown_files: list = field(default_factory=list)
+    acd_path: Path = None  # packed layout: file paths above are data.acd/<name>
     
     @property
     def is_valid(self) -> bool:
@@ -66,121 +75,467 @@ class ScanResult:
         return '\n'.join(lines)
 
 
-def scan_folder(path: str | Path) -> ScanResult:
-    """Scan a folder and find AC physics data files."""
+def scan_folder(path: str | Path, listings: dict | None = None) -> ScanResult:
+    """Scan a folder and find AC physics data files.
+    
+    Each directory is listed with a single os.scandir() pass and every
+    layout check works from that listing. Pass the same `listings` dict to
+    several calls (e.g. a car folder and then its data/) to share them.
+    """
+    if listings is None:
+        listings = {}
     path = Path(path)
-    result = ScanResult(root_path=path)
+    result = _scan_layout(path, lambda directory: _list_dir(directory, listings))
+    
+    # Strategy 4: only a packed data.acd
+    if not result.layout:
+        listing = _list_dir(path, listings)
+        if listing is not None and 'data.acd' in listing.names:
+            acd_name = next(name for name, _ in listing.files if name.lower() == 'data.acd')
+            _scan_acd(path / acd_name, result)
+    return result
+
+
+def _scan_acd(acd_path: Path, result: ScanResult):
+    """Fill result from the entries of a packed data.acd."""
+    try:
+        entries = read_acd(acd_path)
+    except (OSError, ValueError):
+        return
+    result.data_path = acd_path.parent
+    result.layout = "acd"
+    result.acd_path = acd_path
+    _scan_directory(_Listing([(name, acd_path / name) for name in entries], set()), result)
+
+
+def read_scan_file(scan: ScanResult, path: Path) -> bytes:
+    """Raw bytes of a file from a ScanResult, whether on disk or in its data.acd."""
+    if scan.acd_path is not None and path.parent == scan.acd_path:
+        return read_acd(scan.acd_path)[path.name]
+    return Path(path).read_bytes()
+
+
+def physics_sources(scan: ScanResult) -> list[Path]:
+    """The files on disk a scanned car's physics come from, once each: its
+    core, optional and LUT files, or just the data.acd they are packed in."""
+    if scan.acd_path is not None:
+        return [scan.acd_path]
+    return list(dict.fromkeys([*scan.core_files.values(), *scan.optional_files.values(), *scan.lut_files]))
+
+
+# ── data.acd ──────────────────────────────────────────────────────
+# A data.acd is a list of (name, contents) entries. Every content byte is
+# stored in its own little-endian int32, shifted by a key derived from the
+# car's folder name. A -1111 marker plus a version int may come first.
+
+_ACD_INT = struct.Struct('<i')
+_ACD_HEADER = -1111
+_ACD_CACHE_SIZE = 64
+_acd_cache = OrderedDict()   # (archive hash, key) → {name: bytes}
+_acd_lock = threading.Lock()
+_sub_tables = {}             # key byte → bytes.translate table for (b - key) & 0xff
+
+
+def read_acd(path: str | Path, key: str | None = None) -> dict[str, bytes]:
+    """Decode a data.acd into {file name: contents}, in memory.
+    
+    The key is derived from the name of the folder holding the archive
+    (the car id) unless given, e.g. for a renamed car folder. Decoded
+    archives are cached by content hash, so analyzing the same car again
+    only re-hashes the file. Treat the returned dict as read-only.
+    """
+    path = Path(path)
+    if key is None:
+        key = acd_key(path.parent.name)
+    data = path.read_bytes()
+    cache_key = (hashlib.blake2b(data, digest_size=16).hexdigest(), key)
+    with _acd_lock:
+        entries = _acd_cache.get(cache_key)
+        if entries is not None:
+            _acd_cache.move_to_end(cache_key)
+            return entries
     
-    if not path.is_dir():
+    entries = decode_acd(data, key)
+    with _acd_lock:
+        _acd_cache[cache_key] = entries
+        while len(_acd_cache) > _ACD_CACHE_SIZE:
+            _acd_cache.popitem(last=False)
+    return entries
+
+
+def decode_acd(data: bytes, key: str) -> dict[str, bytes]:
+    """Decode the raw bytes of a data.acd with the given key."""
+    key = key.encode('ascii')
+    entries = {}
+    pos = 0
+    if len(data) >= 8 and _ACD_INT.unpack_from(data, 0)[0] == _ACD_HEADER:
+        pos = 8  # marker + version
+    while pos < len(data):
+        if pos + 4 > len(data):
+            raise ValueError("Truncated data.acd entry header")
+        (name_len,) = _ACD_INT.unpack_from(data, pos)
+        if name_len <= 0 or pos + 8 + name_len > len(data):
+            raise ValueError(f"Corrupt data.acd entry at offset {pos}")
+        name = data[pos + 4:pos + 4 + name_len].decode('latin-1')
+        pos += 4 + name_len
+        (size,) = _ACD_INT.unpack_from(data, pos)
+        pos += 4
+        if size < 0 or pos + size * 4 > len(data):
+            raise ValueError(f"Corrupt data.acd entry {name!r}")
+        entries[name] = _acd_decrypt(data[pos:pos + size * 4:4], key)
+        pos += size * 4
+    return entries
+
+
+def _acd_decrypt(enc: bytes, key: bytes) -> bytes:
+    # Byte i is shifted by key[i % len(key)]: undo it one key position at a
+    # time with a C-level translate over every len(key)-th byte
+    out = bytearray(len(enc))
+    step = len(key)
+    for r in range(min(step, len(enc))):
+        k = key[r]
+        table = _sub_tables.get(k)
+        if table is None:
+            table = _sub_tables[k] = bytes((b - k) & 0xFF for b in range(256))
+        out[r::step] = enc[r::step].translate(table)
+    return bytes(out)
+
+
+def acd_key(car_id: str) -> str:
+    """The data.acd key for a car folder name, e.g. '237-70-1-...'.
+    
+    Eight checksums over the lower-cased name, computed with 32-bit
+    integer arithmetic (truncating division) and kept to their low byte.
+    """
+    c = [ord(ch) for ch in car_id.lower()]
+    n = len(c)
+    
+    k1 = sum(c)
+    k2 = 0
+    for i in range(0, n - 1, 2):
+        k2 = _i32(_i32(k2 * c[i]) - c[i + 1])
+    k3 = 0
+    for i in range(1, n - 3, 3):
+        k3 = _i32(k3 * c[i])
+        k3 = _div32(k3, c[i + 1] + 27)
+        k3 = _i32(k3 - 27 - c[i - 1])
+    k4 = 5763
+    for i in range(1, n):
+        k4 -= c[i]
+    k5 = 66
+    for i in range(1, n - 4, 4):
+        k5 = _i32((c[i] + 15) * k5 * (c[i - 1] + 15) + 22)
+    k6 = 101
+    for i in range(0, n - 2, 2):
+        k6 -= c[i]
+    k7 = 171
+    for i in range(0, n - 2, 2):
+        k7 %= c[i]
+    k8 = 171
+    i = 0
+    while i < n - 1:
+        k8 = _div32(k8, c[i])
+        i += 1
+        k8 += c[i]
+    return '-'.join(str(k & 0xFF) for k in (k1, k2, k3, k4, k5, k6, k7, k8))
+
+
+def _i32(x: int) -> int:
+    """Wrap to a signed 32-bit int."""
+    return (x + 0x80000000) % 0x100000000 - 0x80000000
+
+
+def _div32(a: int, b: int) -> int:
+    """Integer division truncating toward zero, as in C."""
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def _scan_layout(path, list_dir) -> ScanResult:
+    """The layout rules behind scan_folder, over any directory tree.
+    
+    list_dir(directory) returns the _Listing of a directory, or None if
+    there is none. `path` only needs to support `/`, so the tree can be
+    an archive's members as well as a real folder.
+    """
+    result = ScanResult(root_path=path)
+    listing = list_dir(path)
+    if listing is None:
         return result
     
-    # Strategy 1: Look for data/ subfolder
-    data_dir = path / 'data'
-    if data_dir.is_dir():
-        # Check if data/data/ exists (double nesting)
-        inner_data = data_dir / 'data'
-        if inner_data.is_dir() and _has_physics_files(inner_data):
-            # Use the inner data folder as primary, outer for prefixed overview files
-            result.data_path = inner_data
-            result.layout = "nested"
-            _scan_directory(inner_data, result)
-            # Also check outer level for prefixed files
-            _scan_for_prefixed(data_dir, result)
-            return result
+    # Strategy 1: Look for data/ subfolder (any case, like data.acd)
+    data_name = _data_dir_name(listing)
+    if data_name:
+        data_dir = path / data_name
+        data_listing = list_dir(data_dir)
         
-        # Standard data/ folder
-        if _has_physics_files(data_dir):
-            result.data_path = data_dir
-            result.layout = "standard"
-            _scan_directory(data_dir, result)
-            return result
+        # Check if data/data/ exists (double nesting)
+        inner_name = _data_dir_name(data_listing) if data_listing is not None else None
+        if inner_name:
+            inner_data = data_dir / inner_name
+            inner_listing = list_dir(inner_data)
+            if inner_listing is not None and _has_physics_files(inner_listing):
+                # Use the inner data folder as primary, outer for prefixed overview files
+                result.data_path = inner_data
+                result.layout = "nested"
+                _scan_directory(inner_listing, result)
+                # Also check outer level for prefixed files
+                _scan_for_prefixed(data_listing, result)
+                return result
         
-        # Check for prefixed files in data/
-        prefix = _detect_prefix(data_dir)
-        if prefix:
-            result.data_path = data_dir
-            result.layout = "prefixed"
-            result.prefix = prefix
-            _scan_directory(data_dir, result, prefix)
-            return result
+        if data_listing is not None:
+            # Standard data/ folder
+            if _has_physics_files(data_listing):
+                result.data_path = data_dir
+                result.layout = "standard"
+                _scan_directory(data_listing, result)
+                return result
+            
+            # Check for prefixed files in data/
+            prefix = _detect_prefix(data_listing)
+            if prefix:
+                result.data_path = data_dir
+                result.layout = "prefixed"
+                result.prefix = prefix
+                _scan_directory(data_listing, result, prefix)
+                return result
     
     # Strategy 2: Files directly in the given folder
-    if _has_physics_files(path):
+    if _has_physics_files(listing):
         result.data_path = path
         result.layout = "flat"
-        _scan_directory(path, result)
+        _scan_directory(listing, result)
         return result
     
     # Strategy 3: Prefixed files in given folder
-    prefix = _detect_prefix(path)
+    prefix = _detect_prefix(listing)
     if prefix:
         result.data_path = path
         result.layout = "prefixed"
         result.prefix = prefix
-        _scan_directory(path, result, prefix)
+        _scan_directory(listing, result, prefix)
         return result
     
     return result
 
 
-def _has_physics_files(directory: Path) -> bool:
+def _data_dir_name(listing) -> str | None:
+    """The listing's data/ subdirectory as named on disk, matched case-insensitively."""
+    if 'data' in listing.dirs:
+        return 'data'
+    return next((name for name in listing.dirs if name.lower() == 'data'), None)
+
+
+def scan_library(root: str | Path, workers: int = 8, max_pending: int | None = None) -> 'LibraryScan':
+    """Scan every car folder in a library (e.g. content/cars) on a thread pool.
+    
+    Iterate the returned LibraryScan to get ScanResults as they complete;
+    its counters report progress while that happens. Folders that hold no
+    physics data still yield a result, with is_valid False.
+    """
+    return LibraryScan(root, workers=workers, max_pending=max_pending)
+
+
+class LibraryScan:
+    """A library-wide scan_folder() run, streamed in completion order.
+    
+    Car folders are discovered lazily and at most `max_pending` scans
+    (default two per worker) are queued at once, so memory stays flat on
+    libraries of any size. scan_folder is I/O bound, so threads overlap
+    the directory reads. workers=0 scans in the calling thread.
+    
+    Counters are updated as results are yielded: found, scanned, errors
+    (with the exceptions in `failed`), scan_time (summed over workers)
+    and elapsed/rate. Iterating again runs a fresh scan.
+    """
+    
+    def __init__(self, root: str | Path, workers: int = 8, max_pending: int | None = None):
+        self.root = Path(root)
+        self.workers = workers
+        self.max_pending = max_pending or max(workers, 1) * 2
+        self._reset()
+    
+    def _reset(self):
+        self.found = 0
+        self.scanned = 0
+        self.failed = []        # (path, exception)
+        self.scan_time = 0.0
+        self.started = None
+        self.finished = None
+    
+    @property
+    def errors(self) -> int:
+        return len(self.failed)
+    
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+    
+    @property
+    def rate(self) -> float:
+        """Folders scanned per second so far."""
+        elapsed = self.elapsed
+        return self.scanned / elapsed if elapsed else 0.0
+    
+    def stats(self) -> dict:
+        return {
+            'found': self.found,
+            'scanned': self.scanned,
+            'errors': self.errors,
+            'elapsed': self.elapsed,
+            'scan_time': self.scan_time,
+            'rate': self.rate,
+        }
+    
+    def __iter__(self):
+        self._reset()
+        self.started = time.perf_counter()
+        folders = self._folders()
+        try:
+            if self.workers == 0:
+                for path in folders:
+                    self.found += 1
+                    result = self._record(path, _timed_scan, path)
+                    if result is not None:
+                        yield result
+                return
+            
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                pending = {}
+                try:
+                    for path in folders:
+                        self.found += 1
+                        pending[pool.submit(_timed_scan, path)] = path
+                        if len(pending) >= self.max_pending:
+                            yield from self._collect(pending)
+                    while pending:
+                        yield from self._collect(pending)
+                finally:
+                    # Stopped early: drop the queued scans instead of finishing them
+                    for future in pending:
+                        future.cancel()
+        finally:
+            self.finished = time.perf_counter()
+    
+    def _folders(self):
+        """Car folders directly under the root, read in one scandir pass."""
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    yield self.root / entry.name
+    
+    def _collect(self, pending: dict):
+        """Wait for at least one queued scan and yield what finished."""
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            result = self._record(pending.pop(future), future.result)
+            if result is not None:
+                yield result
+    
+    def _record(self, path: Path, get, *args):
+        """Count one finished scan; returns its ScanResult, or None if it failed."""
+        try:
+            result, seconds = get(*args)
+        except OSError as e:
+            self.failed.append((path, e))
+            return None
+        self.scanned += 1
+        self.scan_time += seconds
+        return result
+
+
+def _timed_scan(path: Path):
+    start = time.perf_counter()
+    return scan_folder(path), time.perf_counter() - start
+
+
+class _Listing:
+    """The files and subdirectories of one directory."""
+    __slots__ = ('files', 'dirs', 'names')
+    
+    def __init__(self, files: list, dirs: set):
+        self.files = files  # (name, path) in directory order
+        self.dirs = dirs    # subdirectory names
+        self.names = {name.lower() for name, _ in files}
+    
+    @classmethod
+    def scandir(cls, directory: Path) -> '_Listing':
+        """One os.scandir() pass. The file/dir split comes from the DirEntry
+        type info, which on most platforms needs no extra stat() per entry."""
+        files = []
+        dirs = set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    files.append((entry.name, directory / entry.name))
+                elif entry.is_dir():
+                    dirs.add(entry.name)
+        return cls(files, dirs)
+
+
+def _list_dir(directory: Path, listings: dict):
+    """The listing of a directory, or None if it isn't one."""
+    listing = listings.get(directory)
+    if listing is None and directory not in listings:
+        try:
+            listing = _Listing.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            listing = None
+        listings[directory] = listing
+    return listing
+
+
+def _has_physics_files(listing: _Listing) -> bool:
     """Check if directory has standard-named physics files."""
-    files = {f.name.lower() for f in directory.iterdir() if f.is_file()}
-    return 'car.ini' in files or 'suspensions.ini' in files
+    return 'car.ini' in listing.names or 'suspensions.ini' in listing.names
 
 
-def _detect_prefix(directory: Path) -> str:
+def _detect_prefix(listing: _Listing) -> str:
     """Detect a file prefix from physics files in a directory."""
-    for f in directory.iterdir():
-        if f.is_file() and f.name.lower().endswith('_car.ini'):
-            return f.name[:-len('car.ini')]
-    for f in directory.iterdir():
-        if f.is_file() and f.name.lower().endswith('_suspensions.ini'):
-            return f.name[:-len('suspensions.ini')]
+    for name, _ in listing.files:
+        if name.lower().endswith('_car.ini'):
+            return name[:-len('car.ini')]
+    for name, _ in listing.files:
+        if name.lower().endswith('_suspensions.ini'):
+            return name[:-len('suspensions.ini')]
     return ""
 
 
-def _scan_directory(directory: Path, result: ScanResult, prefix: str = ""):
-    """Scan a directory for physics files with optional prefix."""
-    for f in directory.iterdir():
-        if not f.is_file():
-            continue
-        
-        name_lower = f.name.lower()
+def _scan_directory(listing: _Listing, result: ScanResult, prefix: str = ""):
+    """Scan a directory listing for physics files with optional prefix."""
+    prefix_lower = prefix.lower()
+    for name, f in listing.files:
+        name_lower = name.lower()
         
         # Strip prefix for matching
-        if prefix:
-            if name_lower.startswith(prefix.lower()):
-                logical_name = f.name[len(prefix):]
-            else:
-                logical_name = f.name
+        if prefix and name_lower.startswith(prefix_lower):
+            logical_lower = name_lower[len(prefix):]
         else:
-            logical_name = f.name
-        
-        logical_lower = logical_name.lower()
+            logical_lower = name_lower
         
         # Check core files
         if logical_lower in CORE_FILES:
             result.core_files[logical_lower] = f
         elif logical_lower in OPTIONAL_FILES:
             result.optional_files[logical_lower] = f
-        elif f.suffix.lower() == '.lut':
+        elif name_lower.endswith('.lut'):
             result.lut_files.append(f)
-        elif f.suffix.lower() in ('.ini', '.lut'):
+        elif name_lower.endswith('.ini'):
             result.unknown_files.append(f)
 
 
-def _scan_for_prefixed(directory: Path, result: ScanResult):
+def _scan_for_prefixed(listing: _Listing, result: ScanResult):
     """Look for prefixed overview files (like BMW_E46_car.ini alongside data/)."""
-    prefix = _detect_prefix(directory)
+    prefix = _detect_prefix(listing)
     if not prefix:
         return
     result.prefix = prefix
-    for f in directory.iterdir():
-        if not f.is_file():
-            continue
-        name_lower = f.name.lower()
-        if name_lower.startswith(prefix.lower()):
-            logical = f.name[len(prefix):].lower()
+    prefix_lower = prefix.lower()
+    for name, f in listing.files:
+        name_lower = name.lower()
+        if name_lower.startswith(prefix_lower):
+            logical = name_lower[len(prefix):]
             if logical in CORE_FILES and logical not in result.core_files:
                 result.core_files[logical] = f
@@ -10,75 +10,772 @@ Handles AC-specific quirks:
 - Numeric values with units in comments
 """
 
+import os
 import re
+import json
+import atexit
+import codecs
+import hashlib
+import threading
+from array import array
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from sys import intern
 from pathlib import Path
 from collections import OrderedDict
+from collections.abc import Mapping
 
+try:
+    import numpy as np
+except ImportError:  # only LutTable needs numpy
+    np = None
 
-def parse_ini_file(filepath: str | Path) -> dict:
-    """Parse an AC physics INI file into a nested dict of sections."""
+
+# KEY = value ; comment  (line is already stripped, value stops at the first ;)
+_KV_PATTERN = re.compile(r'([A-Za-z0-9_]+)\s*=([^;]*)(?:;(.*))?')
+
+# A [SECTION] header running to the end of its line. Line breaks are the
+# same set str.splitlines() uses, so the index agrees with the tokenizer.
+_LINE_BREAKS = '\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029'
+_SECTION_PATTERN = re.compile(
+    rf'\[([^{_LINE_BREAKS}]+)\][^\S{_LINE_BREAKS}]*(?=[{_LINE_BREAKS}]|\Z)'
+)
+
+# Bytes versions for parsing straight from a buffer. Only \r and \n end a
+# line here; AC files never use the exotic breaks str.splitlines() knows.
+_SECTION_PATTERN_B = re.compile(rb'\[([^\r\n]+)\][ \t\x0b\x0c]*(?=[\r\n]|\Z)')
+_LINE_PATTERN_B = re.compile(rb'[^\r\n]+')
+_NON_ASCII_B = re.compile(rb'[\x80-\xff]')
+
+# A raw key=value line split into (KEY = )(value)( ; comment + line ending)
+_KV_LINE_PATTERN = re.compile(
+    rf'(\s*[A-Za-z0-9_]+\s*=[^\S{_LINE_BREAKS}]*)([^;{_LINE_BREAKS}]*?)'
+    rf'([^\S{_LINE_BREAKS}]*(?:;[^{_LINE_BREAKS}]*)?[{_LINE_BREAKS}]*)\Z'
+)
+
+# Bump when the parsed structure changes so old on-disk cache files are ignored
+_CACHE_VERSION = 2
+
+
+def parse_ini_file(filepath: str | Path, lazy: bool = False, compact: bool = False) -> dict:
+    """Parse an AC physics INI file into a nested dict of sections.
+    
+    With lazy=True a LazyIniDocument is returned instead, which only
+    parses the sections that are actually read. With compact=True entries
+    are IniEntry objects and section/key names are interned, for holding
+    many parsed files in memory at once.
+    """
     filepath = Path(filepath)
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
     
-    content = filepath.read_text(encoding='utf-8', errors='replace')
-    return parse_ini_string(content)
+    return parse_ini_bytes(filepath.read_bytes(), lazy=lazy, compact=compact)
 
 
-def parse_ini_string(content: str) -> dict:
+def parse_ini_string(content: str, lazy: bool = False, compact: bool = False) -> dict:
     """Parse AC INI content string into structured dict."""
-    sections = OrderedDict()
-    current_section = None
+    if lazy:
+        return LazyIniDocument(content, compact=compact)
     
-    for line in content.splitlines():
-        line = line.strip()
-        
-        # Skip empty lines
-        if not line:
+    sections = {} if compact else OrderedDict()
+    for name, start, end in _index_sections(content):
+        if compact:
+            name = intern(name)
+        section = sections.get(name)
+        if section is None:
+            section = sections[name] = {} if compact else OrderedDict()
+        _parse_entries(content[start:end].splitlines(), section, compact)
+    return sections
+
+
+def parse_ini_bytes(data, lazy: bool = False, compact: bool = False,
+                    encoding: str | None = None) -> dict:
+    """Parse AC INI content from bytes, a bytearray, memoryview or mmap.
+    
+    The encoding is sniffed once (BOM, UTF-16 NUL pattern, UTF-8 validity,
+    else cp1252) unless given. With lazy=True and an ASCII-compatible
+    encoding the document indexes and tokenizes the raw buffer directly,
+    decoding only the lines of sections that are read; it keeps a
+    reference to the buffer, so an mmap must stay open while it is used.
+    """
+    if encoding is None:
+        encoding = detect_encoding(data)
+    start = 0
+    if encoding == 'utf-8-sig':
+        encoding = 'utf-8'
+        start = len(codecs.BOM_UTF8) if bytes(data[:3]) == codecs.BOM_UTF8 else 0
+    
+    if lazy and _is_ascii_compatible(encoding):
+        return LazyIniDocument(data, compact=compact, encoding=encoding, start=start)
+    
+    # A full parse touches every line anyway, and one C-level decode beats
+    # decoding line by line
+    return parse_ini_string(str(data[start:], encoding, 'replace'), lazy=lazy, compact=compact)
+
+
+def detect_encoding(data) -> str:
+    """Best guess at the text encoding of an AC data file's raw bytes."""
+    head = bytes(data[:4])
+    if head.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if head.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+        return 'utf-32'
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+    
+    # UTF-16 without a BOM: ASCII text leaves every other byte NUL
+    sample = bytes(data[:1024])
+    if sample.count(0) > len(sample) // 4:
+        return 'utf-16-be' if sample[0::2].count(0) > sample[1::2].count(0) else 'utf-16-le'
+    
+    if data.isascii() if isinstance(data, (bytes, bytearray)) else _NON_ASCII_B.search(data) is None:
+        return 'utf-8'
+    try:
+        str(data, 'utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp1252'  # what Windows editors save when it isn't UTF-8
+
+
+def decode_text(data) -> str:
+    """Decode an AC data file's raw bytes using its sniffed encoding."""
+    return str(data, detect_encoding(data), 'replace')
+
+
+def _is_ascii_compatible(encoding: str) -> bool:
+    """True if the INI syntax characters encode to themselves (no UTF-16/32)."""
+    try:
+        return '[]=;\r\n'.encode(encoding) == b'[]=;\r\n'
+    except (LookupError, UnicodeError):
+        return False
+
+
+def _index_sections(content: str):
+    """Yield (section_name, body_start, body_end) for every header in order.
+    
+    Text before the first header is ignored, as AC does. A section that
+    appears twice yields two spans with the same name.
+    """
+    name = None
+    start = 0
+    for m in _SECTION_PATTERN.finditer(content):
+        # Only whitespace may precede the [ on its line
+        i = m.start()
+        while i and content[i - 1] not in _LINE_BREAKS and content[i - 1].isspace():
+            i -= 1
+        if i and content[i - 1] not in _LINE_BREAKS:
             continue
-        
-        # Section header
-        section_match = re.match(r'^\[(.+)\]$', line)
-        if section_match:
-            current_section = section_match.group(1)
-            if current_section not in sections:
-                sections[current_section] = OrderedDict()
+        if name is not None:
+            yield name, start, i
+        name = m.group(1)
+        start = m.end()
+    if name is not None:
+        yield name, start, len(content)
+
+
+def _index_buffer_sections(buf, encoding: str, pos: int = 0):
+    """Bytes counterpart of _index_sections, for buf[pos:]."""
+    name = None
+    start = pos
+    for m in _SECTION_PATTERN_B.finditer(buf, pos):
+        # Only whitespace may precede the [ on its line
+        i = m.start()
+        while i > pos and buf[i - 1] in b' \t\x0b\x0c':
+            i -= 1
+        if i > pos and buf[i - 1] not in b'\r\n':
             continue
+        if name is not None:
+            yield name, start, i
+        name = m.group(1).decode(encoding, 'replace')
+        start = m.end()
+    if name is not None:
+        yield name, start, len(buf)
+
+
+def _buffer_lines(buf, start: int, end: int, encoding: str):
+    """Decoded lines of buf[start:end] for _parse_entries.
+    
+    Walks a bytes, memoryview or mmap buffer without copying it; blank and
+    comment-only lines are dropped before they are ever decoded.
+    """
+    for m in _LINE_PATTERN_B.finditer(buf, start, end):
+        line = m.group().lstrip()
+        if line and line[0] != 0x3B:  # ;
+            yield line.decode(encoding, 'replace')
+
+
+def _parse_entries(lines, section: dict, compact: bool = False):
+    """Tokenize the key=value lines of one section body into `section`."""
+    kv_match = _KV_PATTERN.fullmatch
+    parse_value = _parse_value
+    
+    for line in lines:
+        line = line.strip()
         
-        # Skip lines before any section
-        if current_section is None:
+        # Skip empty lines, comment-only lines (;) and malformed headers
+        if not line or line[0] == ';' or line[0] == '[':
             continue
         
         # Key=Value pair (with optional inline comment)
-        kv_match = re.match(r'^([A-Za-z0-9_]+)\s*=\s*(.*?)(?:\s*;(.*))?$', line)
-        if kv_match:
-            key = kv_match.group(1)
-            value = kv_match.group(2).strip()
-            comment = kv_match.group(3).strip() if kv_match.group(3) else None
-            
-            # Try to parse numeric values
-            parsed_value = _parse_value(value)
-            
-            entry = {
-                'raw': value,
-                'value': parsed_value,
-            }
+        m = kv_match(line)
+        if m is None:
+            continue
+        key, value, comment = m.groups()
+        value = value.strip()
+        comment = comment.strip() if comment else ''
+        
+        if compact:
+            entry = IniEntry(value, parse_value(value), comment or None)
+        else:
+            entry = {'raw': value, 'value': parse_value(value)}
             if comment:
                 entry['comment'] = comment
-            
-            # Handle duplicate keys (append _N)
-            if key in sections[current_section]:
+        
+        # Handle duplicate keys (append _N)
+        if key in section:
+            n = 2
+            while f"{key}_{n}" in section:
+                n += 1
+            key = f"{key}_{n}"
+        
+        section[intern(key) if compact else key] = entry
+
+
+class IniEntry:
+    """Compact stand-in for the {'raw', 'value', 'comment'} entry dict.
+    
+    Supports the dict-style reads the rest of the tool does on entries
+    (entry['value'], entry.get('comment')), at roughly a quarter of the
+    memory of a small dict.
+    """
+    __slots__ = ('raw', 'value', 'comment')
+    _FIELDS = ('raw', 'value', 'comment')
+    
+    def __init__(self, raw: str, value, comment: str | None = None):
+        self.raw = raw
+        self.value = value
+        self.comment = comment
+    
+    def __getitem__(self, name: str):
+        if name in self:
+            return getattr(self, name)
+        raise KeyError(name)
+    
+    def __contains__(self, name) -> bool:
+        return name in self._FIELDS and (name != 'comment' or self.comment is not None)
+    
+    def get(self, name: str, default=None):
+        return getattr(self, name) if name in self else default
+    
+    def to_dict(self) -> dict:
+        entry = {'raw': self.raw, 'value': self.value}
+        if self.comment is not None:
+            entry['comment'] = self.comment
+        return entry
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IniEntry):
+            other = other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"IniEntry({self.raw!r}, {self.value!r}, {self.comment!r})"
+
+
+class LazyIniDocument(Mapping):
+    """Read-only sections mapping that parses each section on first access.
+    
+    Construction does a single regex scan for [SECTION] headers and keeps
+    their offsets; the key=value lines of a section are only tokenized and
+    coerced when the section is first looked up. Works anywhere the dict
+    from parse_ini_string() does (get_value, get_raw, list_lut_references).
+    """
+    
+    def __init__(self, content, compact: bool = False, encoding: str | None = None,
+                 start: int = 0):
+        # content is a str, or a bytes-like buffer in an ASCII-compatible
+        # encoding (see parse_ini_bytes) starting at offset `start`
+        self._content = content
+        self._compact = compact
+        self._encoding = encoding
+        self._spans = OrderedDict()  # section name → [(start, end), ...]
+        self._parsed = {}
+        # Documents are shared between threads (PARSE_CACHE); section
+        # parses are serialized so dropping _content can't race one
+        self._lock = threading.Lock()
+        if encoding is None:
+            index = _index_sections(content)
+        else:
+            index = _index_buffer_sections(content, encoding, start)
+        for name, start, end in index:
+            self._spans.setdefault(intern(name) if compact else name, []).append((start, end))
+    
+    def __getitem__(self, name: str) -> dict:
+        section = self._parsed.get(name)
+        if section is not None:
+            return section
+        spans = self._spans[name]
+        with self._lock:
+            section = self._parsed.get(name)
+            if section is None:
+                section = {} if self._compact else OrderedDict()
+                for start, end in spans:
+                    if self._encoding is None:
+                        lines = self._content[start:end].splitlines()
+                    else:
+                        lines = _buffer_lines(self._content, start, end, self._encoding)
+                    _parse_entries(lines, section, self._compact)
+                self._parsed[name] = section
+                if len(self._parsed) == len(self._spans):
+                    self._content = None  # fully parsed, source no longer needed
+        return section
+    
+    def __contains__(self, name) -> bool:
+        return name in self._spans
+    
+    def __iter__(self):
+        return iter(self._spans)
+    
+    def __len__(self) -> int:
+        return len(self._spans)
+    
+    @property
+    def parsed_sections(self) -> list[str]:
+        """Names of the sections that have been parsed so far."""
+        return [name for name in self._spans if name in self._parsed]
+    
+    def _preload(self, sections: dict):
+        """Take already parsed sections (e.g. from ParseCache's disk tier)
+        instead of parsing them from the source."""
+        with self._lock:
+            for name, section in sections.items():
+                if name in self._spans:
+                    self._parsed.setdefault(name, section)
+            if len(self._parsed) == len(self._spans):
+                self._content = None
+    
+    def to_dict(self) -> dict:
+        """Parse everything and return a plain parse_ini_string()-style dict."""
+        return OrderedDict((name, self[name]) for name in self._spans)
+
+
+class IniDocument:
+    """Round-trip INI document for editing values without reformatting.
+    
+    Keeps every original line (comments, blank lines, spacing, line
+    endings) and indexes each (section, key) to its line, so set() is a
+    dict lookup plus one line rewrite and dumps() is a single join.
+    Section and key lookups are case-insensitive; duplicate keys are
+    addressed as KEY, KEY_2, ... exactly like parse_ini_string() names them.
+    """
+    
+    def __init__(self, content: str):
+        self._lines = content.splitlines(keepends=True)
+        self._keys = {}           # (SECTION, KEY) → line index
+        self._section_names = {}  # SECTION → name as written in the file
+        self._section_end = {}    # SECTION → index of the line new keys go after
+        self._added = OrderedDict()  # SECTION → OrderedDict(KEY → line) for new keys
+        self.encoding = 'utf-8'     # what save() writes; from_file() keeps the source's
+        self.newline = '\n'
+        if self._lines:
+            first = self._lines[0]
+            self.newline = first[len(first.rstrip(_LINE_BREAKS)):] or '\n'
+        
+        current = None
+        for i, line in enumerate(self._lines):
+            stripped = line.strip()
+            if not stripped or stripped[0] == ';':
+                continue
+            if stripped[0] == '[':
+                if stripped[-1] == ']' and len(stripped) > 2:
+                    current = stripped[1:-1].upper()
+                    self._section_names.setdefault(current, stripped[1:-1])
+                    self._section_end[current] = i
+                continue
+            if current is None:
+                continue
+            m = _KV_PATTERN.fullmatch(stripped)
+            if m is None:
+                continue
+            key = m.group(1).upper()
+            if (current, key) in self._keys:
                 n = 2
-                while f"{key}_{n}" in sections[current_section]:
+                while (current, f"{key}_{n}") in self._keys:
                     n += 1
                 key = f"{key}_{n}"
-            
-            sections[current_section][key] = entry
+            self._keys[(current, key)] = i
+            self._section_end[current] = i
+    
+    @classmethod
+    def from_file(cls, filepath: str | Path) -> 'IniDocument':
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"File not found: {filepath}")
+        data = filepath.read_bytes()
+        encoding = detect_encoding(data)
+        doc = cls(str(data, encoding, 'replace'))
+        doc.encoding = encoding
+        return doc
+    
+    def has_section(self, section: str) -> bool:
+        section = section.upper()
+        return section in self._section_names or section in self._added
+    
+    def get(self, section: str, key: str, default=None):
+        """Raw value string of a key, or default."""
+        idx = self._keys.get((section.upper(), key.upper()))
+        if idx is not None:
+            return _KV_LINE_PATTERN.match(self._lines[idx]).group(2)
+        added = self._added.get(section.upper(), {}).get(key.upper())
+        if added is not None:
+            return _KV_LINE_PATTERN.match(added).group(2)
+        return default
+    
+    def set(self, section: str, key: str, value, add_section: bool = False) -> bool:
+        """Set a key's value in place, keeping its spacing and comment.
         
-        # Comment-only lines (starting with ;)
-        # Skip these silently
+        A key missing from an existing section is added after the section's
+        last entry. A missing section is only created with add_section=True;
+        otherwise nothing is written and False is returned.
+        """
+        sec, k = section.upper(), key.upper()
+        idx = self._keys.get((sec, k))
+        if idx is not None:
+            m = _KV_LINE_PATTERN.match(self._lines[idx])
+            self._lines[idx] = f"{m.group(1)}{value}{m.group(3)}"
+            return True
+        if sec not in self._section_names and sec not in self._added and not add_section:
+            return False
+        self._added.setdefault(sec, OrderedDict())[k] = f"{key}={value}{self.newline}"
+        self._section_names.setdefault(sec, section)
+        return True
     
-    return sections
+    def apply(self, changes: dict, add_sections: bool = False) -> list[tuple[str, str]]:
+        """Apply {section: {key: value}} changes. Returns the (section, key)
+        pairs that were skipped because their section is not in the file."""
+        skipped = []
+        for section, values in changes.items():
+            for key, value in values.items():
+                if not self.set(section, key, value, add_section=add_sections):
+                    skipped.append((section, key))
+        return skipped
+    
+    def dumps(self) -> str:
+        """Serialize the document, original formatting intact."""
+        if not self._added:
+            return ''.join(self._lines)
+        
+        inserts = {}
+        tail = []
+        for sec, keys in self._added.items():
+            if sec in self._section_end:
+                inserts[self._section_end[sec]] = keys.values()
+            else:
+                if tail or self._lines:
+                    tail.append(self.newline)
+                tail.append(f"[{self._section_names[sec]}]{self.newline}")
+                tail.extend(keys.values())
+        
+        out = []
+        for i, line in enumerate(self._lines):
+            out.append(line)
+            extra = inserts.get(i)
+            if extra:
+                if line == line.rstrip(_LINE_BREAKS):
+                    out.append(self.newline)
+                out.extend(extra)
+        if tail and out and out[-1] == out[-1].rstrip(_LINE_BREAKS):
+            out.append(self.newline)
+        out.extend(tail)
+        return ''.join(out)
+    
+    def save(self, filepath: str | Path):
+        """Write the document back in the encoding it was read with."""
+        with open(filepath, 'w', encoding=self.encoding, newline='') as fh:
+            fh.write(self.dumps())
+
+
+class IncrementalParser:
+    """Re-parses a file as it is edited, rebuilding only the sections whose
+    text changed since the previous update().
+    
+    Each section body is hashed; unchanged sections keep their parsed dict
+    from last time. update() returns the (section, key) pairs whose raw
+    value was added, removed or changed, so callers can recompute only what
+    depends on them (see analyzer.update_report). Comment-only and spacing
+    edits parse the section again but report nothing.
+    """
+    
+    def __init__(self, compact: bool = False):
+        self.compact = compact
+        self.sections = {} if compact else OrderedDict()
+        self._digests = {}  # section name → hash of its body text
+    
+    def update(self, content: str) -> set[tuple[str, str]]:
+        """Parse new content for the file; return the changed (section, key) pairs."""
+        # A section that appears twice is parsed as its bodies joined, which
+        # is what parse_ini_string() does span by span
+        bodies = {}
+        for name, start, end in _index_sections(content):
+            bodies.setdefault(name, []).append(content[start:end])
+        
+        old_sections, old_digests = self.sections, self._digests
+        sections = {} if self.compact else OrderedDict()
+        digests = {}
+        changed = set()
+        for name, parts in bodies.items():
+            body = ''.join(parts)
+            digest = _content_digest(body.encode('utf-8', errors='surrogatepass'))
+            old = old_sections.get(name)
+            if old is not None and old_digests.get(name) == digest:
+                section = old
+            else:
+                section = {} if self.compact else OrderedDict()
+                _parse_entries(body.splitlines(), section, self.compact)
+                changed.update(_changed_keys(name, old or {}, section))
+            if self.compact:
+                name = intern(name)
+            sections[name] = section
+            digests[name] = digest
+        
+        for name, old in old_sections.items():
+            if name not in sections:
+                changed.update((name, key) for key in old)
+        
+        self.sections, self._digests = sections, digests
+        return changed
+    
+    def update_file(self, filepath: str | Path) -> set[tuple[str, str]]:
+        """update() with a file's current contents."""
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"File not found: {filepath}")
+        return self.update(decode_text(filepath.read_bytes()))
+
+
+def _changed_keys(name: str, old: dict, new: dict):
+    """(name, key) for every key whose raw value differs between two parses of a section."""
+    for key, entry in new.items():
+        prev = old.get(key)
+        if prev is None or prev['raw'] != entry['raw']:
+            yield name, key
+    for key in old:
+        if key not in new:
+            yield name, key
+
+
+class ParseCache:
+    """Bounded LRU cache of parsed INI documents, keyed by content hash.
+    
+    Files are looked up by (path, mtime, size) first so an unchanged file
+    is not even re-read; anything else is keyed by a hash of its bytes, so
+    the same car.ini uploaded twice or read from two paths parses once.
+    Cached documents are LazyIniDocuments shared between callers and must
+    be treated as read-only.
+    
+    max_bytes bounds the total size of the cached source text; the parsed
+    structures are a small multiple of that. With disk_dir set, the
+    sections of a document that were parsed are written there as JSON when
+    it leaves memory (eviction, flush(), interpreter exit) and are not
+    parsed again after a restart; sections nobody read stay unparsed. The
+    files are plain data, but anyone who can write disk_dir can still feed
+    wrong values to the tool, so it must be a directory you trust.
+    """
+    
+    def __init__(self, max_entries: int = 512, max_bytes: int = 32 * 1024 * 1024,
+                 disk_dir: str | Path | None = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._docs = OrderedDict()   # (digest, compact) → (document, size, sections on disk)
+        self._stat_keys = OrderedDict()  # (path, mtime_ns, size) → digest
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.evictions = 0
+    
+    def parse_file(self, filepath: str | Path, compact: bool = False):
+        """Cached equivalent of parse_ini_file(filepath, lazy=True)."""
+        filepath = Path(filepath)
+        try:
+            st = filepath.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {filepath}") from None
+        stat_key = (str(filepath.resolve()), st.st_mtime_ns, st.st_size)
+        
+        with self._lock:
+            digest = self._stat_keys.get(stat_key)
+            if digest is not None:
+                doc = self._lookup((digest, compact))
+                if doc is not None:
+                    return doc
+        
+        data = filepath.read_bytes()
+        digest = _content_digest(data)
+        with self._lock:
+            self._stat_keys[stat_key] = digest
+            self._stat_keys.move_to_end(stat_key)
+            while len(self._stat_keys) > self.max_entries * 4:
+                self._stat_keys.popitem(last=False)
+        return self._get_or_parse(digest, compact, lambda: parse_ini_bytes(data, lazy=True, compact=compact), len(data))
+    
+    def parse_bytes(self, data: bytes, compact: bool = False):
+        """Cached equivalent of parse_ini_bytes(data, lazy=True), for file
+        contents that were read some other way (e.g. from a data.acd)."""
+        digest = _content_digest(data)
+        return self._get_or_parse(digest, compact, lambda: parse_ini_bytes(data, lazy=True, compact=compact), len(data))
+    
+    def parse_string(self, content: str, compact: bool = False):
+        """Cached equivalent of parse_ini_string(content, lazy=True)."""
+        digest = _content_digest(content.encode('utf-8', errors='surrogatepass'))
+        return self._get_or_parse(digest, compact, lambda: LazyIniDocument(content, compact=compact), len(content))
+    
+    def _get_or_parse(self, digest: str, compact: bool, build, size: int):
+        key = (digest, compact)
+        with self._lock:
+            doc = self._lookup(key)
+            if doc is not None:
+                return doc
+        
+        doc = build()
+        saved = self._load_from_disk(key, doc)
+        
+        with self._lock:
+            if saved:
+                self.disk_hits += 1
+            else:
+                self.misses += 1
+            evicted = self._store(key, doc, size, saved)
+        for item in evicted:
+            self._save_to_disk(*item)
+        return doc
+    
+    def _lookup(self, key):
+        """Return a cached document and mark it recently used (lock held)."""
+        item = self._docs.get(key)
+        if item is None:
+            return None
+        self._docs.move_to_end(key)
+        self.hits += 1
+        return item[0]
+    
+    def _store(self, key, doc, size: int, saved: int = 0) -> list:
+        """Insert a document and evict least recently used ones (lock held).
+        Returns the evicted (key, document, sections on disk) to write out."""
+        evicted = []
+        if size > self.max_bytes or key in self._docs:
+            return evicted
+        self._docs[key] = (doc, size, saved)
+        self._bytes += size
+        while len(self._docs) > self.max_entries or self._bytes > self.max_bytes:
+            old_key, (old_doc, old_size, old_saved) = self._docs.popitem(last=False)
+            self._bytes -= old_size
+            self.evictions += 1
+            evicted.append((old_key, old_doc, old_saved))
+        return evicted
+    
+    def _disk_path(self, key) -> Path:
+        digest, compact = key
+        return self.disk_dir / f"{digest}{'_c' if compact else ''}.v{_CACHE_VERSION}.json"
+    
+    def _load_from_disk(self, key, doc) -> int:
+        """Fill doc with the sections saved for it; returns how many."""
+        if self.disk_dir is None or not isinstance(doc, LazyIniDocument):
+            return 0
+        compact = key[1]
+        try:
+            with open(self._disk_path(key), encoding='utf-8') as fh:
+                saved = json.load(fh)
+            sections = {}
+            for name, entries in saved.items():
+                section = {} if compact else OrderedDict()
+                for entry_key, raw, value, comment in entries:
+                    if isinstance(value, list):  # JSON has no tuples
+                        value = tuple(value)
+                    if compact:
+                        section[intern(entry_key)] = IniEntry(raw, value, comment)
+                    else:
+                        entry = section[entry_key] = {'raw': raw, 'value': value}
+                        if comment is not None:
+                            entry['comment'] = comment
+                sections[intern(name) if compact else name] = section
+        except (OSError, ValueError, TypeError, AttributeError):
+            return 0  # missing, or not a file this version wrote
+        doc._preload(sections)
+        return len(sections)
+    
+    def _save_to_disk(self, key, doc, saved: int = 0) -> int:
+        """Write the parsed sections of doc, if there are more than the
+        `saved` already on disk; returns how many sections are on disk."""
+        if self.disk_dir is None or not isinstance(doc, LazyIniDocument):
+            return saved
+        names = doc.parsed_sections
+        if len(names) <= saved:
+            return saved
+        sections = {}
+        for name in names:
+            sections[name] = [[entry_key, entry['raw'], entry['value'], entry.get('comment')]
+                              for entry_key, entry in doc[name].items()]
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            path = self._disk_path(key)
+            tmp = path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp, 'w', encoding='utf-8') as fh:
+                json.dump(sections, fh, separators=(',', ':'))
+            os.replace(tmp, path)
+        except OSError:
+            return saved  # the disk tier is best-effort
+        return len(names)
+    
+    def flush(self):
+        """Write the newly parsed sections of every in-memory document to
+        disk_dir (if set), as eviction would."""
+        if self.disk_dir is None:
+            return
+        with self._lock:
+            items = [(key, doc, saved) for key, (doc, _, saved) in self._docs.items()]
+        for key, doc, saved in items:
+            saved = self._save_to_disk(key, doc, saved)
+            with self._lock:
+                item = self._docs.get(key)
+                if item is not None and item[0] is doc:
+                    self._docs[key] = (doc, item[1], saved)
+    
+    def clear(self):
+        """Drop every in-memory entry, after writing them out (see flush())."""
+        self.flush()
+        with self._lock:
+            self._docs.clear()
+            self._stat_keys.clear()
+            self._bytes = 0
+    
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            'entries': len(self._docs),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+def _content_digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+# Shared by the analyzer, detector and web apps so a file parsed by one is
+# free for the others. Set PARSE_CACHE.disk_dir to a Path to persist it.
+PARSE_CACHE = ParseCache()
+atexit.register(PARSE_CACHE.flush)
 
 
 def _parse_value(value: str):
@@ -138,8 +835,13 @@ def parse_lut_file(filepath: str | Path) -> list[tuple[float, float]]:
     if not filepath.exists():
         raise FileNotFoundError(f"LUT not found: {filepath}")
     
+    return parse_lut_string(decode_text(filepath.read_bytes()))
+
+
+def parse_lut_string(content: str) -> list[tuple[float, float]]:
+    """Parse AC LUT content string into a list of (input, output) points."""
     points = []
-    for line in filepath.read_text(encoding='utf-8', errors='replace').splitlines():
+    for line in content.splitlines():
         line = line.strip()
         if not line or line.startswith(';') or line.startswith('#'):
             continue
@@ -152,3 +854,186 @@ def parse_lut_file(filepath: str | Path) -> list[tuple[float, float]]:
             except (ValueError, IndexError):
                 continue
     return points
+
+
+class LutTable:
+    """AC lookup table stored as two contiguous float64 numpy arrays.
+    
+    interp() evaluates any number of inputs in one vectorized call, with
+    linear interpolation and values clamped to the end points like AC does.
+    from_file() can keep a binary .npy copy of each table in a cache
+    directory, keyed by the LUT's content hash, so later loads skip the
+    text parsing. Requires numpy.
+    """
+    
+    def __init__(self, x, y):
+        if np is None:
+            raise ImportError("LutTable needs numpy (pip install numpy)")
+        self.x = np.ascontiguousarray(x, dtype=np.float64)
+        self.y = np.ascontiguousarray(y, dtype=np.float64)
+        if self.x.ndim != 1 or self.x.shape != self.y.shape:
+            raise ValueError("LUT x and y must be 1-D arrays of the same length")
+        self._by_x = None  # (x, y) sorted by x, built on first interp()
+        self._by_y = None  # (y, x) sorted by y, built on first inverse()
+    
+    @classmethod
+    def from_points(cls, points) -> 'LutTable':
+        points = list(points)
+        return cls([p[0] for p in points], [p[1] for p in points])
+    
+    @classmethod
+    def from_string(cls, content: str) -> 'LutTable':
+        return cls.from_points(parse_lut_string(content))
+    
+    @classmethod
+    def from_file(cls, filepath: str | Path, cache_dir: str | Path | None = None) -> 'LutTable':
+        """Load a .lut file, going through the binary cache if cache_dir is set."""
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"LUT not found: {filepath}")
+        data = filepath.read_bytes()
+        if cache_dir is None:
+            return cls.from_string(decode_text(data))
+        
+        cache_path = Path(cache_dir) / f"{_content_digest(data)}.lut.npy"
+        try:
+            xy = np.load(cache_path, allow_pickle=False)
+            return cls(xy[0], xy[1])
+        except (OSError, ValueError):
+            pass
+        
+        table = cls.from_string(decode_text(data))
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp, 'wb') as fh:
+                np.save(fh, np.stack([table.x, table.y]))
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass  # the cache is best-effort
+        return table
+    
+    def __len__(self) -> int:
+        return len(self.x)
+    
+    def __repr__(self) -> str:
+        if not len(self):
+            return "LutTable(empty)"
+        return f"LutTable({len(self)} points, x {self.x.min():g}..{self.x.max():g})"
+    
+    def points(self) -> list[tuple[float, float]]:
+        """The table as parse_lut_file()-style (x, y) tuples."""
+        return list(zip(self.x.tolist(), self.y.tolist()))
+    
+    @property
+    def is_increasing(self) -> bool:
+        """True if x is strictly increasing (how AC expects LUTs to be written)."""
+        return bool(np.all(np.diff(self.x) > 0))
+    
+    def is_monotonic(self, strict: bool = False) -> bool:
+        """True if y only rises or only falls along the table."""
+        dy = np.diff(self.y)
+        if strict:
+            return bool(np.all(dy > 0) or np.all(dy < 0))
+        return bool(np.all(dy >= 0) or np.all(dy <= 0))
+    
+    def interp(self, xs):
+        """Output at the given input(s); a float for a scalar, else an array."""
+        if not len(self):
+            raise ValueError("Cannot interpolate an empty LUT")
+        if self._by_x is None:
+            if self.is_increasing:
+                self._by_x = (self.x, self.y)
+            else:
+                order = np.argsort(self.x, kind='stable')
+                self._by_x = (self.x[order], self.y[order])
+        result = np.interp(xs, *self._by_x)
+        return float(result) if np.ndim(result) == 0 else result
+    
+    __call__ = interp
+    
+    def inverse(self, ys):
+        """Input that produces the given output(s). y must be strictly monotonic."""
+        if not len(self):
+            raise ValueError("Cannot interpolate an empty LUT")
+        if self._by_y is None:
+            if not self.is_monotonic(strict=True):
+                raise ValueError("Inverse lookup needs a strictly monotonic LUT")
+            order = np.argsort(self.y, kind='stable')
+            self._by_y = (self.y[order], self.x[order])
+        result = np.interp(ys, *self._by_y)
+        return float(result) if np.ndim(result) == 0 else result
+
+
+def parse_many(paths, workers: int | None = None, chunksize: int = 64):
+    """Parse many .ini/.lut files on a process pool.
+    
+    Yields (path, result) in completion order, where result is a compact
+    sections dict (as parse_ini_file(compact=True)) for INI files, a list
+    of (x, y) points for .lut files, or the exception raised for that file.
+    Files travel in chunks of `chunksize` and results come back as flat
+    tuples and packed float arrays rather than pickled dicts. At most two
+    chunks per worker are in flight, so memory stays flat on huge trees.
+    workers=0 parses in the calling process.
+    """
+    paths = iter(paths)
+    chunks = iter(lambda: [str(p) for p in islice(paths, chunksize)], [])
+    
+    if workers == 0:
+        for chunk in chunks:
+            yield from _decode_chunk(_parse_chunk(chunk))
+        return
+    
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in islice(chunks, workers * 2):
+            pending.add(pool.submit(_parse_chunk, chunk))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.add(pool.submit(_parse_chunk, chunk))
+                yield from _decode_chunk(future.result())
+
+
+def _parse_chunk(paths: list[str]) -> list:
+    """Worker side of parse_many: parse files into picklable flat records."""
+    out = []
+    for path in paths:
+        try:
+            if path.lower().endswith('.lut'):
+                flat = array('d')
+                for x, y in parse_lut_file(path):
+                    flat.append(x)
+                    flat.append(y)
+                out.append((path, 'lut', flat.tobytes()))
+            else:
+                sections = parse_ini_file(path, compact=True)
+                out.append((path, 'ini', tuple(
+                    (name, tuple((key, e.raw, e.value, e.comment) for key, e in section.items()))
+                    for name, section in sections.items()
+                )))
+        except Exception as e:
+            out.append((path, 'error', e))
+    return out
+
+
+def _decode_chunk(records: list):
+    """Parent side of parse_many: rebuild results from the flat records."""
+    for path, kind, payload in records:
+        if kind == 'ini':
+            yield Path(path), {
+                intern(name): {
+                    intern(key): IniEntry(raw, value, comment)
+                    for key, raw, value, comment in entries
+                }
+                for name, entries in payload
+            }
+        elif kind == 'lut':
+            flat = array('d')
+            flat.frombytes(payload)
+            yield Path(path), list(zip(flat[0::2], flat[1::2]))
+        else:
+            yield Path(path), payload
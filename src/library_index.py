@@ -0,0 +1,372 @@
+"""
+AC Library Index
+A persistent SQLite index of a car library: each car folder's physics
+files (with mtime, size and content hash) and its analyzed PhysicsReport.
+
+update() rescans incrementally. Only cars whose folder mtimes or physics
+file stats changed are looked at again, and only cars whose physics file
+contents actually changed are re-analyzed. The query helpers read
+straight from the index, so callers never touch the library on disk.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from dataclasses import fields
+
+from .analyzer import RECORD_IDENTITY_FIELDS, CarPipeline, PhysicsReport, report_record, scan_car
+from .folder_scanner import _Listing, _data_dir_name, physics_sources
+
+
+# Bump when the tables or the stored record change; older indexes are rebuilt
+_INDEX_VERSION = 1
+
+# Identity values stored alongside the report fields
+_IDENTITY_COLUMNS = RECORD_IDENTITY_FIELDS
+
+# Report fields with a scalar value get their own column so they can be queried
+_REPORT_COLUMNS = tuple(
+    f.name for f in fields(PhysicsReport)
+    if f.type in (float, int, str, bool, 'float', 'int', 'str', 'bool')
+)
+
+_QUERY_COLUMNS = frozenset(('path', 'name', 'root', 'layout', 'is_valid', 'analyzed_at')
+                           + _IDENTITY_COLUMNS + _REPORT_COLUMNS)
+
+
+class LibraryIndex:
+    """On-disk index of analyzed cars, updated incrementally.
+
+    One index can hold several library roots; every car is keyed by its
+    folder path. Safe to share between threads.
+    """
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        # One commit per analyzed car; WAL keeps that cheap
+        self._db.execute('PRAGMA journal_mode = WAL')
+        self._db.execute('PRAGMA synchronous = NORMAL')
+        self._create_tables()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _create_tables(self):
+        db = self._db
+        with self._lock, db:
+            if db.execute('PRAGMA user_version').fetchone()[0] != _INDEX_VERSION:
+                db.execute('DROP TABLE IF EXISTS cars')
+                db.execute('DROP TABLE IF EXISTS files')
+                db.execute('DROP TABLE IF EXISTS dirs')
+            columns = ', '.join(f'"{name}"' for name in _IDENTITY_COLUMNS + _REPORT_COLUMNS)
+            db.execute(f"""
+                CREATE TABLE IF NOT EXISTS cars (
+                    path TEXT PRIMARY KEY,
+                    root TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    layout TEXT,
+                    is_valid INTEGER,
+                    error TEXT,
+                    analyzed_at REAL,
+                    report TEXT,
+                    {columns}
+                )""")
+            db.execute('CREATE INDEX IF NOT EXISTS cars_root ON cars (root)')
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    car_path TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    mtime_ns INTEGER,
+                    size INTEGER,
+                    hash TEXT,
+                    PRIMARY KEY (car_path, path)
+                )""")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS dirs (
+                    car_path TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    mtime_ns INTEGER,
+                    PRIMARY KEY (car_path, path)
+                )""")
+            db.execute(f'PRAGMA user_version = {_INDEX_VERSION}')
+
+    # ── Updating ──────────────────────────────────────────────────
+
+    def update(self, root: str | Path, full: bool = False) -> dict:
+        """Bring the index up to date with the car folders under root.
+
+        A car whose folder mtimes (car/, data/, data/data/) are unchanged
+        only has its recorded physics files stat()ed; otherwise it is
+        rescanned to pick up added and removed files. Files whose mtime or
+        size moved are hashed, and the car is re-analyzed only if a hash
+        differs. full=True re-analyzes every car.
+
+        Returns counts of added, updated, unchanged and removed cars.
+        """
+        root = Path(root)
+        counts = {'added': 0, 'updated': 0, 'unchanged': 0, 'removed': 0}
+        with self._lock:
+            known = {row['path'] for row in self._db.execute(
+                'SELECT path FROM cars WHERE root = ?', (str(root),))}
+
+        seen = set()
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                car = root / entry.name
+                key = str(car)
+                seen.add(key)
+                if key not in known:
+                    self._analyze(root, car)
+                    counts['added'] += 1
+                elif full or self._changed(car):
+                    self._analyze(root, car)
+                    counts['updated'] += 1
+                else:
+                    counts['unchanged'] += 1
+
+        removed = known - seen
+        if removed:
+            with self._lock, self._db:
+                for key in removed:
+                    self._delete(key)
+            counts['removed'] = len(removed)
+        return counts
+
+    def _changed(self, car: Path) -> bool:
+        """True if any physics file of an indexed car has different content."""
+        key = str(car)
+        with self._lock:
+            dirs = {row['path']: row['mtime_ns'] for row in self._db.execute(
+                'SELECT path, mtime_ns FROM dirs WHERE car_path = ?', (key,))}
+            recorded = {row['path']: (row['mtime_ns'], row['size'], row['hash'])
+                        for row in self._db.execute(
+                            'SELECT path, mtime_ns, size, hash FROM files WHERE car_path = ?', (key,))}
+
+        dir_mtimes = _dir_mtimes(car, dirs)
+        if dir_mtimes != dirs:
+            # Files may have been added, removed or renamed: rescan the folder
+            paths = {str(p) for p in physics_sources(scan_car(car))}
+            if paths != set(recorded):
+                return True
+
+        restat = []
+        for path, (mtime_ns, size, digest) in recorded.items():
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                return True
+            if st.st_mtime_ns == mtime_ns and st.st_size == size:
+                continue
+            try:
+                if _file_digest(path) != digest:
+                    return True
+            except FileNotFoundError:
+                return True
+            restat.append((st.st_mtime_ns, st.st_size, key, path))
+
+        # Touched but identical: remember the new stats so they aren't looked at again
+        if restat or dir_mtimes != dirs:
+            with self._lock, self._db:
+                self._db.executemany(
+                    'UPDATE files SET mtime_ns = ?, size = ? WHERE car_path = ? AND path = ?', restat)
+                self._db.execute('DELETE FROM dirs WHERE car_path = ?', (key,))
+                self._db.executemany('INSERT INTO dirs VALUES (?, ?, ?)',
+                                     [(key, d, m) for d, m in dir_mtimes.items()])
+        return False
+
+    def _analyze(self, root: Path, car: Path):
+        """(Re-)analyze one car and replace its rows."""
+        key = str(car)
+        dir_mtimes = _dir_mtimes(car)  # before reading, so a concurrent edit is seen next time
+        record, error, layout, is_valid, files = None, None, None, False, []
+        try:
+            pipeline = CarPipeline(car)
+            # Files are stat'ed and hashed before they are analyzed, so an
+            # edit saved meanwhile doesn't count as indexed
+            for path in physics_sources(pipeline.scan):
+                try:
+                    st = os.stat(path)
+                    files.append((key, str(path), st.st_mtime_ns, st.st_size, _file_digest(path)))
+                except FileNotFoundError:
+                    continue
+            report = pipeline.report
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            files = []
+        else:
+            record = report_record(report)
+            layout = report.scan.layout
+            is_valid = report.scan.is_valid
+
+        columns = _IDENTITY_COLUMNS + _REPORT_COLUMNS
+        values = [record.get(name) if record else None for name in columns]
+        values = [json.dumps(v) if isinstance(v, (list, dict)) else v for v in values]
+        with self._lock, self._db:
+            self._delete(key)
+            names = ', '.join(f'"{name}"' for name in columns)
+            marks = ', '.join('?' * (8 + len(columns)))
+            self._db.execute(
+                f'INSERT INTO cars (path, root, name, layout, is_valid, error, analyzed_at, report, {names}) '
+                f'VALUES ({marks})',
+                [key, str(root), car.name, layout, int(is_valid), error, time.time(),
+                 json.dumps(record) if record is not None else None, *values])
+            self._db.executemany('INSERT INTO files VALUES (?, ?, ?, ?, ?)', files)
+            self._db.executemany('INSERT INTO dirs VALUES (?, ?, ?)',
+                                 [(key, d, m) for d, m in dir_mtimes.items()])
+
+    def _delete(self, key: str):
+        """Drop one car's rows (lock held, inside a transaction)."""
+        self._db.execute('DELETE FROM cars WHERE path = ?', (key,))
+        self._db.execute('DELETE FROM files WHERE car_path = ?', (key,))
+        self._db.execute('DELETE FROM dirs WHERE car_path = ?', (key,))
+
+    # ── Queries ───────────────────────────────────────────────────
+
+    def get(self, path: str | Path) -> dict | None:
+        """The indexed record of one car folder, or None."""
+        rows = self._select('WHERE path = ?', (str(Path(path)),))
+        return rows[0] if rows else None
+
+    def cars(self, root: str | Path | None = None, valid_only: bool = False) -> list[dict]:
+        """Every indexed car, optionally only those under one root / with car.ini."""
+        where, params = [], []
+        if root is not None:
+            where.append('root = ?')
+            params.append(str(Path(root)))
+        if valid_only:
+            where.append('is_valid = 1')
+        return self._select(('WHERE ' + ' AND '.join(where)) if where else '', params)
+
+    def find(self, **criteria) -> list[dict]:
+        """Cars matching every criterion, e.g.
+        find(make='Nissan', drivetrain_type='RWD', total_mass=(1100, 1300)).
+
+        A (low, high) tuple is an inclusive range; None on either side
+        leaves it open. Any other value must match exactly.
+        """
+        where, params = [], []
+        for column, value in criteria.items():
+            if column not in _QUERY_COLUMNS:
+                raise ValueError(f"Unknown index column: {column}")
+            if isinstance(value, tuple):
+                low, high = value
+                if low is not None:
+                    where.append(f'"{column}" >= ?')
+                    params.append(low)
+                if high is not None:
+                    where.append(f'"{column}" <= ?')
+                    params.append(high)
+            else:
+                where.append(f'"{column}" = ?')
+                params.append(value)
+        return self._select(('WHERE ' + ' AND '.join(where)) if where else '', params)
+
+    def search(self, text: str) -> list[dict]:
+        """Cars whose folder name, screen name, make or model contains text."""
+        like = f"%{text}%"
+        return self._select(
+            'WHERE name LIKE ? OR screen_name LIKE ? OR make LIKE ? OR model LIKE ?',
+            (like, like, like, like))
+
+    def files(self, path: str | Path) -> list[dict]:
+        """The physics files recorded for one car."""
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT path, mtime_ns, size, hash FROM files WHERE car_path = ? ORDER BY path',
+                (str(Path(path)),)).fetchall()
+        return [dict(row) for row in rows]
+
+    def stats(self) -> dict:
+        with self._lock:
+            cars, valid, errors = self._db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(is_valid), 0), COUNT(error) FROM cars').fetchone()
+            files = self._db.execute('SELECT COUNT(*) FROM files').fetchone()[0]
+        return {'cars': cars, 'valid': valid, 'errors': errors, 'files': files}
+
+    def _select(self, where: str, params) -> list[dict]:
+        with self._lock:
+            rows = self._db.execute(
+                f'SELECT path, root, name, layout, is_valid, error, analyzed_at, report '
+                f'FROM cars {where} ORDER BY path', params).fetchall()
+        out = []
+        for row in rows:
+            record = json.loads(row['report']) if row['report'] else {}
+            record.update(path=row['path'], root=row['root'], name=row['name'],
+                          layout=row['layout'], is_valid=bool(row['is_valid']),
+                          error=row['error'], analyzed_at=row['analyzed_at'])
+            out.append(record)
+        return out
+
+
+def _dir_mtimes(car: Path, recorded: dict | None = None) -> dict:
+    """mtime_ns of the directories scan_car lists (the car, its data/ and
+    data/data/, in any case), for those that exist. A directory whose mtime
+    matches `recorded` (a previous result) has the same subfolders as then,
+    so its data/ is taken from there instead of listing it again."""
+    recorded = recorded or {}
+    mtimes = {}
+    directory = car
+    for _ in range(3):
+        key = str(directory)
+        try:
+            mtimes[key] = os.stat(directory).st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            break
+        if recorded.get(key) == mtimes[key]:
+            directory = next((Path(d) for d in recorded if os.path.dirname(d) == key), None)
+        else:
+            directory = _data_subdir(directory)
+        if directory is None:
+            break
+    return mtimes
+
+
+def _data_subdir(directory: Path) -> Path | None:
+    """directory's data/ subfolder, matched like _scan_layout does. The
+    usual lower-case name is tried first, without listing the directory."""
+    if (directory / 'data').is_dir():
+        return directory / 'data'
+    try:
+        name = _data_dir_name(_Listing.scandir(directory))
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return directory / name if name else None
+
+
+def _file_digest(path) -> str:
+    with open(path, 'rb') as fh:
+        return hashlib.blake2b(fh.read(), digest_size=16).hexdigest()
+
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) != 3:
+        print("Usage: python -m src.library_index <index.db> <content/cars>")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    with LibraryIndex(sys.argv[1]) as index:
+        counts = index.update(sys.argv[2])
+        stats = index.stats()
+    elapsed = time.perf_counter() - start
+    print(f"📇 {stats['cars']} cars indexed ({stats['valid']} valid, {stats['errors']} errors) "
+          f"in {elapsed:.2f}s")
+    print(f"   added {counts['added']}, updated {counts['updated']}, "
+          f"unchanged {counts['unchanged']}, removed {counts['removed']}")
@@ -0,0 +1,247 @@
+"""
+AC Physics Diff
+Structural comparison of two cars' physics: every INI section and key
+(changed, added, removed, with numeric deltas) and the contents of every
+LUT, e.g. a mod against its stock car or a car against its previous
+release.
+
+Files are compared byte for byte first, so identical files (most of
+them, between two releases of a pack) are never parsed. Changed INIs go
+through PARSE_CACHE, keyed by content hash, so a version seen before is
+not parsed again. Changed LUTs are compared as LutTables: both curves are
+evaluated on the union of their inputs in one vectorized call.
+"""
+
+import os
+from pathlib import Path
+from dataclasses import dataclass, field
+
+from .analyzer import scan_car
+from .folder_scanner import read_scan_file
+from .ini_parser import PARSE_CACHE, LutTable, decode_text, np
+
+
+@dataclass
+class KeyChange:
+    """One INI key that differs between the two cars."""
+    file: str
+    section: str
+    key: str
+    status: str          # 'changed', 'added' or 'removed'
+    old: str = None      # raw values
+    new: str = None
+    delta: object = None  # new - old: a number, a tuple for coordinates, or None
+
+
+@dataclass
+class LutChange:
+    """A LUT whose contents differ."""
+    file: str
+    old_points: int
+    new_points: int
+    max_delta: float = None   # largest |new - old| output over both curves' inputs
+    at_input: float = None    # where it occurs
+    x_range_changed: bool = False
+
+
+@dataclass
+class CarDiff:
+    """Everything that differs between two cars' physics files."""
+    old: str = ''
+    new: str = ''
+    added_files: list = field(default_factory=list)
+    removed_files: list = field(default_factory=list)
+    identical_files: int = 0
+    keys: list = field(default_factory=list)       # KeyChange
+    luts: list = field(default_factory=list)       # LutChange
+    other_files: list = field(default_factory=list)  # changed, but neither INI nor LUT
+
+    @property
+    def is_identical(self) -> bool:
+        return not (self.added_files or self.removed_files or self.keys or self.luts or self.other_files)
+
+    def summary(self) -> str:
+        lines = [f"Diff: {self.old} → {self.new}"]
+        if self.is_identical:
+            lines.append(f"  identical ({self.identical_files} files)")
+            return '\n'.join(lines)
+        lines.append(f"  {self.identical_files} identical file(s)")
+        for name in self.added_files:
+            lines.append(f"  + {name}")
+        for name in self.removed_files:
+            lines.append(f"  - {name}")
+        current = None
+        for c in self.keys:
+            if (c.file, c.section) != current:
+                current = (c.file, c.section)
+                lines.append(f"  {c.file} [{c.section}]")
+            if c.status == 'added':
+                lines.append(f"    + {c.key} = {c.new}")
+            elif c.status == 'removed':
+                lines.append(f"    - {c.key} = {c.old}")
+            else:
+                lines.append(f"    ~ {c.key}: {c.old} → {c.new}{_format_delta(c.delta)}")
+        for lut in self.luts:
+            line = f"  ~ {lut.file}: {lut.old_points} → {lut.new_points} points"
+            if lut.max_delta is not None:
+                line += f", max Δ {lut.max_delta:g} at {lut.at_input:g}"
+            if lut.x_range_changed:
+                line += ", input range changed"
+            lines.append(line)
+        for name in self.other_files:
+            lines.append(f"  ~ {name}")
+        return '\n'.join(lines)
+
+
+@dataclass
+class PackDiff:
+    """Two releases of a pack (or library), car folder by car folder."""
+    added: list = field(default_factory=list)      # car names only in the new pack
+    removed: list = field(default_factory=list)    # car names only in the old pack
+    unchanged: list = field(default_factory=list)
+    changed: dict = field(default_factory=dict)    # car name → CarDiff
+
+    def summary(self) -> str:
+        lines = [f"{len(self.changed)} changed, {len(self.added)} added, "
+                 f"{len(self.removed)} removed, {len(self.unchanged)} unchanged"]
+        lines += [f"+ {name}" for name in self.added]
+        lines += [f"- {name}" for name in self.removed]
+        for diff in self.changed.values():
+            lines.append(diff.summary())
+        return '\n'.join(lines)
+
+
+def car_files(path: str | Path) -> dict[str, bytes]:
+    """{file name: contents} of every physics file of a car folder (INIs and
+    LUTs, unpacked from data.acd if need be). Names are lower case, without
+    any car prefix."""
+    scan = scan_car(path)
+    files = {**scan.core_files, **scan.optional_files}
+    for f in (*scan.lut_files, *scan.unknown_files):
+        files.setdefault(f.name.lower(), f)
+    return {name: read_scan_file(scan, f) for name, f in files.items()}
+
+
+def diff_cars(old: str | Path, new: str | Path) -> CarDiff:
+    """Compare the physics of two car folders."""
+    diff = diff_files(car_files(old), car_files(new))
+    diff.old, diff.new = str(old), str(new)
+    return diff
+
+
+def diff_files(old: dict[str, bytes], new: dict[str, bytes]) -> CarDiff:
+    """Compare two {file name: contents} sets (see car_files())."""
+    diff = CarDiff()
+    for name in old:
+        if name not in new:
+            diff.removed_files.append(name)
+    for name, data in new.items():
+        if name not in old:
+            diff.added_files.append(name)
+            continue
+        previous = old[name]
+        if previous == data:
+            diff.identical_files += 1
+        elif name.endswith('.ini'):
+            diff.keys.extend(diff_sections(PARSE_CACHE.parse_bytes(previous), PARSE_CACHE.parse_bytes(data), name))
+        elif name.endswith('.lut'):
+            change = diff_luts(LutTable.from_string(decode_text(previous)) if np is not None else None,
+                               LutTable.from_string(decode_text(data)) if np is not None else None, name)
+            if change is not None:
+                diff.luts.append(change)
+        else:
+            diff.other_files.append(name)
+    return diff
+
+
+def diff_sections(old, new, file: str = '') -> list[KeyChange]:
+    """KeyChanges between two parsed INIs (sections dicts), in the new
+    file's order, removed sections and keys last. Keys compare by raw value."""
+    changes = []
+    for section, entries in new.items():
+        before = old.get(section)
+        if before is None:
+            changes.extend(KeyChange(file, section, key, 'added', new=e['raw']) for key, e in entries.items())
+            continue
+        if before == entries:
+            continue
+        for key, entry in entries.items():
+            prev = before.get(key)
+            if prev is None:
+                changes.append(KeyChange(file, section, key, 'added', new=entry['raw']))
+            elif prev['raw'] != entry['raw']:
+                changes.append(KeyChange(file, section, key, 'changed', prev['raw'], entry['raw'],
+                                         _delta(prev['value'], entry['value'])))
+        changes.extend(KeyChange(file, section, key, 'removed', old=e['raw'])
+                       for key, e in before.items() if key not in entries)
+    for section, entries in old.items():
+        if section not in new:
+            changes.extend(KeyChange(file, section, key, 'removed', old=e['raw']) for key, e in entries.items())
+    return changes
+
+
+def diff_luts(old: LutTable, new: LutTable, file: str = '') -> LutChange | None:
+    """How two LUTs differ, or None if their points are the same. Without
+    numpy (old/new None) only the file is reported."""
+    if old is None or new is None:
+        return LutChange(file, 0, 0)
+    if len(old) == len(new) and np.array_equal(old.x, new.x) and np.array_equal(old.y, new.y):
+        return None
+    change = LutChange(file, len(old), len(new))
+    if len(old) and len(new):
+        xs = np.union1d(old.x, new.x)
+        gap = np.abs(new.interp(xs) - old.interp(xs))
+        worst = int(np.argmax(gap))
+        change.max_delta, change.at_input = float(gap[worst]), float(xs[worst])
+        change.x_range_changed = bool(old.x.min() != new.x.min() or old.x.max() != new.x.max())
+    return change
+
+
+def diff_packs(old_root: str | Path, new_root: str | Path) -> PackDiff:
+    """Compare every car folder of two pack releases, matched by folder name."""
+    old_cars = {e.name: e.path for e in os.scandir(old_root) if e.is_dir()}
+    new_cars = {e.name: e.path for e in os.scandir(new_root) if e.is_dir()}
+    pack = PackDiff(added=sorted(set(new_cars) - set(old_cars)),
+                    removed=sorted(set(old_cars) - set(new_cars)))
+    for name in sorted(set(old_cars) & set(new_cars)):
+        diff = diff_cars(old_cars[name], new_cars[name])
+        if diff.is_identical:
+            pack.unchanged.append(name)
+        else:
+            pack.changed[name] = diff
+    return pack
+
+
+def _delta(old, new):
+    """new - old for numbers, element-wise for equal-length coordinate tuples."""
+    number = (int, float)
+    if isinstance(old, number) and isinstance(new, number) and not isinstance(old, bool):
+        return new - old
+    if isinstance(old, tuple) and isinstance(new, tuple) and len(old) == len(new):
+        return tuple(b - a for a, b in zip(old, new))
+    return None
+
+
+def _format_delta(delta) -> str:
+    if delta is None:
+        return ''
+    if isinstance(delta, tuple):
+        return f" (Δ {', '.join(f'{d:+g}' for d in delta)})"
+    return f" (Δ {delta:+g})"
+
+
+if __name__ == '__main__':
+    import sys
+    import time
+
+    if len(sys.argv) < 3:
+        print("Usage: python -m src.physics_diff <old car | old pack> <new car | new pack> [--pack]")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    if '--pack' in sys.argv[3:]:
+        result = diff_packs(sys.argv[1], sys.argv[2])
+    else:
+        result = diff_cars(sys.argv[1], sys.argv[2])
+    print(result.summary())
+    print(f"\n⏱  {(time.perf_counter() - start)*1000:.0f} ms", file=sys.stderr)
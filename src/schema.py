@@ -0,0 +1,98 @@
+"""
+AC Field Schema
+Declares which (file, section, key) each extracted value comes from and
+compiles the list into an extractor that visits every parsed file and
+section once, filling a flat record.
+
+Adding a value to a report is one Field(...) line.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Field:
+    """One extracted value: where it lives and what to use when it's missing."""
+    name: str       # key in the output record (e.g. a PhysicsReport attribute)
+    file: str       # logical file name, e.g. 'suspensions.ini'
+    section: str
+    key: str
+    default: object = None
+    raw: bool = False  # True → raw string (like get_raw), else parsed value (get_value)
+
+
+class Schema:
+    """A compiled list of Fields.
+
+    The fields are grouped by file and then section up front, so extract()
+    does one section lookup per (file, section) and one dict lookup per key,
+    instead of a full get_value() call for every field.
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+
+        seen = set()
+        plan = {}
+        self._by_key = {}  # (file, section, key) → fields read from there
+        for f in self.fields:
+            if f.name in seen:
+                raise ValueError(f"Duplicate field name in schema: {f.name}")
+            seen.add(f.name)
+            self._by_key.setdefault((f.file, f.section, f.key), []).append(f)
+            attr = 'raw' if f.raw else 'value'
+            plan.setdefault(f.file, {}).setdefault(f.section, []).append(
+                (f.key, f.name, attr, f.default))
+
+        self._plan = tuple(
+            (file, tuple((section, tuple(keys)) for section, keys in sections.items()))
+            for file, sections in plan.items()
+        )
+
+    @property
+    def files(self) -> list[str]:
+        """Logical file names the schema reads from."""
+        return [file for file, _ in self._plan]
+
+    def defaults(self) -> dict:
+        return {f.name: f.default for f in self.fields}
+
+    def extract(self, files: dict, record: dict | None = None) -> dict:
+        """Fill a flat record from {logical file name: parsed sections}.
+
+        Fields of files missing from `files` are left out of the record (or
+        untouched, if one is passed in), so callers keep their own defaults.
+        """
+        if record is None:
+            record = {}
+        for file, sections_plan in self._plan:
+            sections = files.get(file)
+            if sections is None:
+                continue
+            for section_name, keys in sections_plan:
+                section = sections[section_name] if section_name in sections else None
+                if section is None:
+                    for key, name, attr, default in keys:
+                        record[name] = default
+                    continue
+                for key, name, attr, default in keys:
+                    entry = section.get(key)
+                    record[name] = default if entry is None else entry[attr]
+        return record
+
+    __call__ = extract
+    
+    def extract_changed(self, file: str, sections: dict, changed, record: dict | None = None) -> dict:
+        """Re-extract only the fields of one file whose (section, key) is in
+        `changed`, e.g. the pairs IncrementalParser.update() returned."""
+        if record is None:
+            record = {}
+        for section_name, key in changed:
+            fields = self._by_key.get((file, section_name, key))
+            if not fields:
+                continue
+            section = sections[section_name] if section_name in sections else None
+            entry = section.get(key) if section is not None else None
+            for f in fields:
+                record[f.name] = f.default if entry is None else entry['raw' if f.raw else 'value']
+        return record
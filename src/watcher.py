@@ -0,0 +1,337 @@
+"""
+AC Physics Watcher
+Watches car folders while a tuner edits them and re-analyzes a car as soon
+as its physics files settle, printing the new summary or a JSON diff of
+the PhysicsReport fields that changed.
+
+Changes are picked up with inotify on Linux and by polling elsewhere.
+Every event is confirmed against a stat() snapshot of the car's physics
+files and data folders, so activity elsewhere (skins, UI) does nothing.
+Rapid saves of the same car are
+debounced into one re-analysis. When only core INI files were edited,
+the affected report fields are updated through IncrementalParser rather
+than re-running analyze_car.
+"""
+
+import os
+import sys
+import json
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+from pathlib import Path
+from dataclasses import dataclass
+from urllib import request as urlrequest
+
+from .analyzer import REPORT_SCHEMA, PhysicsReport, analyze_car, report_record, scan_car, update_report
+from .folder_scanner import physics_sources
+from .ini_parser import IncrementalParser
+
+
+class _CarState:
+    """What the watcher knows about one car folder."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.report = None
+        self.snapshot = {}       # watched path → (mtime_ns, size), dirs included
+        self.analyzed = {}       # the snapshot the report was built from
+        self.parsers = {}        # logical name → IncrementalParser
+        self.first_change = None  # monotonic time of the first unflushed change
+        self.last_change = None
+
+    def dirs(self) -> list[Path]:
+        """The directories scan_car lists for this car."""
+        return [self.path, self.path / 'data', self.path / 'data' / 'data']
+
+    def load(self, track: dict | None = None):
+        """Analyze from scratch and take a fresh snapshot.
+        
+        `track` maps logical names to files whose edits should be applied
+        incrementally from now on. Their parsers read the files before
+        analyze_car does, so an edit landing in between shows up in the
+        next diff instead of being lost.
+        """
+        self.parsers = {}
+        for name, path in (track or {}).items():
+            parser = IncrementalParser(compact=True)
+            try:
+                parser.update_file(path)
+            except FileNotFoundError:
+                continue
+            self.parsers[name] = parser
+        self.report = analyze_car(self.path)
+        self.snapshot = self.analyzed = _snapshot(self.dirs(), physics_sources(self.report.scan))
+
+
+class CarWatcher:
+    """Watches car folders and yields a WatchEvent per settled change.
+
+    debounce is how long a car's files must stay unchanged before it is
+    re-analyzed; interval is the polling period when inotify isn't used.
+    """
+
+    def __init__(self, cars, debounce: float = 0.25, interval: float = 0.5, use_inotify: bool = True):
+        self.debounce = debounce
+        self.interval = interval
+        self.cars = {}
+        for path in cars:
+            state = _CarState(Path(path))
+            state.load()
+            self.cars[state.path] = state
+        self.backend = None
+        if use_inotify:
+            self.backend = _Inotify.create()
+        if self.backend is not None:
+            for state in self.cars.values():
+                self.backend.watch(state)
+        self.latencies = []  # seconds from first change seen to event ready
+
+    @property
+    def mode(self) -> str:
+        return 'inotify' if self.backend is not None else 'polling'
+
+    def events(self):
+        """Yield WatchEvents forever (until the caller stops iterating)."""
+        while True:
+            now = time.monotonic()
+            pending = [s for s in self.cars.values() if s.last_change is not None]
+            timeout = self.interval
+            if pending:
+                timeout = min(timeout, max(0.0, min(s.last_change for s in pending) + self.debounce - now))
+
+            if self.backend is not None:
+                touched = self.backend.wait(timeout)
+            else:
+                time.sleep(timeout)
+                touched = self.cars.values()
+
+            # One batched stat() sweep over every car that may have changed
+            now = time.monotonic()
+            for state in touched:
+                if self._restat(state):
+                    state.first_change = state.first_change or now
+                    state.last_change = now
+
+            for state in self.cars.values():
+                if state.last_change is not None and now - state.last_change >= self.debounce:
+                    event = self._reanalyze(state)
+                    if event is not None:
+                        yield event
+
+    def _restat(self, state: _CarState) -> bool:
+        """Refresh a car's snapshot; True if anything in it moved."""
+        dirs = state.dirs()
+        snapshot = _snapshot(dirs, [p for p in state.snapshot if p not in dirs])
+        if snapshot == state.snapshot:
+            return False
+        if [snapshot.get(d) for d in dirs] != [state.snapshot.get(d) for d in dirs]:
+            # A directory changed: files may have come or gone
+            snapshot = _snapshot(dirs, physics_sources(scan_car(state.path)))
+            if self.backend is not None:
+                self.backend.watch(state)
+        state.snapshot = snapshot
+        return True
+
+    def _reanalyze(self, state: _CarState):
+        first_change = state.first_change
+        state.first_change = state.last_change = None
+        dirs = state.dirs()
+        changed_files = sorted(
+            str(p) for p in state.snapshot.keys() | state.analyzed.keys()
+            if state.snapshot.get(p) != state.analyzed.get(p) and p not in dirs
+        )
+        if not changed_files:
+            state.analyzed = state.snapshot
+            return None
+
+        before = report_record(state.report)
+        start = time.perf_counter()
+        # Report files that were edited, by logical name
+        logical = {str(p): name for name, p in state.report.scan.core_files.items()}
+        edited = {logical[p]: p for p in changed_files
+                  if p in logical and logical[p] in REPORT_SCHEMA.files}
+        
+        mode = 'full'
+        if (state.report.scan.acd_path is None and state.snapshot.keys() == state.analyzed.keys()
+                and edited.keys() <= state.parsers.keys()):
+            # Only files already being tracked were edited: update just the
+            # report fields at the keys that changed
+            mode = 'incremental'
+            try:
+                for name, path in edited.items():
+                    parser = state.parsers[name]
+                    keys = parser.update_file(path)
+                    update_report(state.report, name, parser.sections, keys)
+            except FileNotFoundError:
+                mode = 'full'  # gone since the snapshot; the rescan sorts it out
+            else:
+                state.analyzed = state.snapshot
+        if mode == 'full':
+            # A file's first edit: re-analyze and track it from here on
+            core = state.report.scan.core_files
+            tracked = {name: core[name] for name in state.parsers if name in core}
+            state.load({**tracked, **edited})
+        analysis = time.perf_counter() - start
+
+        after = report_record(state.report)
+        latency = time.monotonic() - first_change
+        self.latencies.append(latency)
+        return WatchEvent(
+            car=state.path,
+            report=state.report,
+            files=changed_files,
+            changes={k: (before.get(k), v) for k, v in after.items() if before.get(k) != v},
+            mode=mode,
+            analysis_seconds=analysis,
+            latency_seconds=latency,
+        )
+
+    def stats(self) -> dict:
+        lat = sorted(self.latencies)
+        return {
+            'events': len(lat),
+            'latency_mean': sum(lat) / len(lat) if lat else 0.0,
+            'latency_max': lat[-1] if lat else 0.0,
+            'latency_p50': lat[len(lat) // 2] if lat else 0.0,
+        }
+
+
+@dataclass
+class WatchEvent:
+    """One re-analysis of a car after its files changed."""
+    car: Path
+    report: PhysicsReport
+    files: list             # paths whose stat changed
+    changes: dict           # report field → (old, new)
+    mode: str               # 'incremental' or 'full'
+    analysis_seconds: float
+    latency_seconds: float  # first change seen → event ready, debounce included
+
+    def to_dict(self) -> dict:
+        return {
+            'car': str(self.car),
+            'files': self.files,
+            'changes': {k: {'old': old, 'new': new} for k, (old, new) in self.changes.items()},
+            'mode': self.mode,
+            'analysis_ms': round(self.analysis_seconds * 1000, 2),
+            'latency_ms': round(self.latency_seconds * 1000, 2),
+        }
+
+
+def _snapshot(dirs, files) -> dict:
+    """(mtime_ns, size) of each existing path, stat()ed in one pass."""
+    snapshot = {}
+    for path in (*dirs, *files):
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        snapshot[path] = (st.st_mtime_ns, st.st_size)
+    return snapshot
+
+
+class _Inotify:
+    """Minimal Linux inotify through libc; create() returns None elsewhere."""
+
+    _EVENT = struct.Struct('iIII')
+    _MASK = (0x00000002 | 0x00000004 | 0x00000008 | 0x00000040 | 0x00000080  # MODIFY ATTRIB CLOSE_WRITE MOVED_FROM MOVED_TO
+             | 0x00000100 | 0x00000200 | 0x00000400 | 0x00000800)            # CREATE DELETE DELETE_SELF MOVE_SELF
+
+    def __init__(self, libc, fd: int):
+        self._libc = libc
+        self.fd = fd
+        self._cars = {}   # watch descriptor → _CarState
+        self._wds = {}    # (car path, dir) → watch descriptor
+
+    @classmethod
+    def create(cls):
+        if not sys.platform.startswith('linux'):
+            return None
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+        return cls(libc, fd)
+
+    def watch(self, state: _CarState):
+        """Watch the car's directories that exist now (again after a rescan)."""
+        for directory in state.dirs():
+            if not directory.is_dir():
+                continue
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(directory), self._MASK)
+            if wd >= 0:
+                self._cars[wd] = state
+                self._wds[(state.path, directory)] = wd
+
+    def wait(self, timeout: float) -> set:
+        """Cars with events within timeout seconds."""
+        touched = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        while ready:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            pos = 0
+            while pos < len(buf):
+                wd, _, _, name_len = self._EVENT.unpack_from(buf, pos)
+                pos += self._EVENT.size + name_len
+                state = self._cars.get(wd)
+                if state is not None:
+                    touched.add(state)
+            ready, _, _ = select.select([self.fd], [], [], 0)
+        return touched
+
+
+def _post(url: str, payload: dict):
+    data = json.dumps(payload).encode('utf-8')
+    req = urlrequest.Request(url, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        urlrequest.urlopen(req, timeout=2).close()
+    except OSError as e:
+        print(f"⚠️  POST to {url} failed: {e}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    ap = argparse.ArgumentParser(prog='python -m src.watcher',
+                                 description="Re-analyze AC cars as their physics files change.")
+    ap.add_argument('paths', nargs='+', type=Path, help="car folders (or library roots with --library)")
+    ap.add_argument('--library', action='store_true', help="watch every car folder under each path")
+    ap.add_argument('--json', action='store_true', help="print JSON diffs instead of summaries")
+    ap.add_argument('--post', metavar='URL', help="also POST each JSON diff to a local endpoint")
+    ap.add_argument('--debounce', type=float, default=0.25, help="seconds a car must be quiet (default 0.25)")
+    ap.add_argument('--interval', type=float, default=0.5, help="poll period in seconds (default 0.5)")
+    ap.add_argument('--poll', action='store_true', help="poll even where inotify is available")
+    args = ap.parse_args()
+
+    cars = args.paths
+    if args.library:
+        cars = [p / e.name for p in args.paths for e in os.scandir(p) if e.is_dir()]
+
+    watcher = CarWatcher(cars, debounce=args.debounce, interval=args.interval, use_inotify=not args.poll)
+    print(f"👀 Watching {len(watcher.cars)} car(s) ({watcher.mode}). Ctrl+C to stop.", file=sys.stderr)
+    try:
+        for event in watcher.events():
+            if args.json:
+                print(json.dumps(event.to_dict(), default=str), flush=True)
+            else:
+                print(event.report.summary())
+                changed = ', '.join(event.changes) or 'no report fields'
+                print(f"⏱  {event.car.name}: {changed} changed — analysis "
+                      f"{event.analysis_seconds*1000:.1f} ms ({event.mode}), "
+                      f"latency {event.latency_seconds*1000:.0f} ms", flush=True)
+            if args.post:
+                _post(args.post, event.to_dict())
+    except KeyboardInterrupt:
+        stats = watcher.stats()
+        print(f"\n📊 {stats['events']} re-analyses, latency mean "
+              f"{stats['latency_mean']*1000:.0f} ms / p50 {stats['latency_p50']*1000:.0f} ms / "
+              f"max {stats['latency_max']*1000:.0f} ms", file=sys.stderr)
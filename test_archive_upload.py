@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Test archive extraction and the app_v2 upload route on small synthetic
+archives: loose files, clashing file names, unreadable zips."""
+import io
+import sys
+import struct
+import zipfile
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.archive_scanner import CarArchive
+import app_v2
+
+CAR_INI = b"[HEADER]\nVERSION=1\n[BASIC]\nTOTALMASS=1300\n"
+ENGINE_INI = b"[HEADER]\nVERSION=1\n[ENGINE_DATA]\nLIMITER=7500\n"
+POWER_LUT = b"0|100\n7500|300\n"
+
+
+def make_zip(members: dict) -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as z:
+        for name, data in members.items():
+            z.writestr(name, data)
+    return buf.getvalue()
+
+
+def patch_zip(data: bytes, flags: int = 0, method: int | None = None) -> bytes:
+    """Set general-purpose flag bits and/or the compression method in every
+    local and central header, which zipfile checks only when reading."""
+    data = bytearray(data)
+    for sig, offset in ((b'PK\x03\x04', 6), (b'PK\x01\x02', 8)):
+        pos = data.find(sig)
+        while pos != -1:
+            old_flags, = struct.unpack_from('<H', data, pos + offset)
+            struct.pack_into('<H', data, pos + offset, old_flags | flags)
+            if method is not None:
+                struct.pack_into('<H', data, pos + offset + 2, method)
+            pos = data.find(sig, pos + 4)
+    return bytes(data)
+
+
+def upload(data: bytes):
+    client = app_v2.app.test_client()
+    return client.post('/api/upload', data={'zipfile': (io.BytesIO(data), 'car.zip')},
+                       content_type='multipart/form-data')
+
+
+def test_extract_rejects_name_clash():
+    data = make_zip({'a/data/engine.ini': ENGINE_INI, 'b/data/engine.ini': ENGINE_INI})
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'car.zip'
+        path.write_bytes(data)
+        out = Path(tmp) / 'out'
+        out.mkdir()
+        with CarArchive(path) as archive:
+            try:
+                archive.extract(archive.members, out)
+            except FileExistsError:
+                pass
+            else:
+                raise AssertionError("clashing members were extracted")
+            assert not list(out.iterdir())  # nothing written
+            assert [p.name for p in archive.extract(['a/data/engine.ini'], out)] == ['engine.ini']
+
+
+def test_upload_name_clash_is_400():
+    # Not a car (no car.ini), so every .ini is extracted, and two clash
+    r = upload(make_zip({'a/engine.ini': ENGINE_INI, 'b/engine.ini': ENGINE_INI}))
+    assert r.status_code == 400 and 'engine.ini' in r.get_json()['error']
+
+
+def test_upload_loose_files():
+    # No car layout in the archive: fall back to every .ini/.lut member
+    r = upload(make_zip({'engine.ini': ENGINE_INI, 'power.lut': POWER_LUT, 'readme.txt': b'hi'}))
+    assert r.status_code == 200, r.get_json()
+    assert sorted(r.get_json()['files']) == ['engine.ini', 'power.lut']
+
+
+def test_upload_car():
+    r = upload(make_zip({'my_car/data/car.ini': CAR_INI, 'my_car/data/engine.ini': ENGINE_INI,
+                         'my_car/data/power.lut': POWER_LUT}))
+    assert r.status_code == 200, r.get_json()
+    assert 'car.ini' in r.get_json()['files']
+
+
+def test_upload_unreadable_zip_is_400():
+    members = {'my_car/data/car.ini': CAR_INI, 'my_car/data/engine.ini': ENGINE_INI}
+    for data in (patch_zip(make_zip(members), flags=0x1),   # encrypted
+                 patch_zip(make_zip(members), method=97),   # unsupported method
+                 b'PK\x03\x04 not really a zip'):
+        assert upload(data).status_code == 400
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Test which name detect_car identifies a car by: the folder name for a
+car folder, SCREEN_NAME for its data/ folder."""
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.car_detector import detect_car
+
+CAR_INI = "[INFO]\nSCREEN_NAME=Street JZX90 Tourer\n[BASIC]\nTOTALMASS=1400\n"
+SUSPENSIONS_INI = "[BASIC]\nWHEELBASE=2.73\n[FRONT]\nTRACK=1.5\n[REAR]\nTRACK=1.5\n"
+
+
+def make_car(root: Path, folder: str) -> Path:
+    data = root / folder / 'data'
+    data.mkdir(parents=True)
+    (data / 'car.ini').write_text(CAR_INI)
+    (data / 'suspensions.ini').write_text(SUSPENSIONS_INI)
+    (data / 'power.lut').write_text("0|100\n")
+    return root / folder
+
+
+def test_car_folder_uses_folder_name():
+    with tempfile.TemporaryDirectory() as tmp:
+        car = make_car(Path(tmp), 'toyota_jzx100_drift')
+        identity = detect_car(car)
+        assert identity.chassis_code == 'JZX100'
+        assert identity.source == "folder name: 'toyota_jzx100_drift'"
+        assert identity.total_mass == 1400  # physics still come from data/
+
+
+def test_data_folder_uses_screen_name():
+    with tempfile.TemporaryDirectory() as tmp:
+        identity = detect_car(make_car(Path(tmp), 'toyota_jzx100_drift') / 'data')
+        assert identity.chassis_code == 'JZX90'
+        assert identity.source.startswith('SCREEN_NAME')
+        assert sorted(identity.files_found) == ['car.ini', 'power.lut', 'suspensions.ini']
+
+
+def test_unknown_folder_name_falls_back_to_screen_name():
+    with tempfile.TemporaryDirectory() as tmp:
+        identity = detect_car(make_car(Path(tmp), 'my_build_v3'))
+        assert identity.chassis_code == 'JZX90'
+        assert identity.source.startswith('SCREEN_NAME')
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test that /api/optimize answers bad input with a 400, never a 500."""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from app import app
+
+CAR = 'bmw_e46_m3'
+
+
+def post(body):
+    return app.test_client().post('/api/optimize', json=body)
+
+
+def test_bad_body():
+    for raw in ('null', '[1]', '"x"'):
+        r = app.test_client().post('/api/optimize', data=raw, content_type='application/json')
+        assert r.status_code == 400, raw
+
+
+def test_bad_car_id():
+    for car_id in (None, ['x'], {'a': 1}, 3):
+        assert post({'car_id': car_id, 'targets': {}}).status_code == 400, car_id
+    assert post({'car_id': 'no_such_car', 'targets': {}}).status_code == 400
+
+
+def test_bad_targets():
+    for targets in ('x', {'natural_freq_f': 'abc'}, {'natural_freq_f': {}},
+                    {'natural_freq_f': [1, 2, 3]}, {'no_such_column': 2.0}):
+        assert post({'car_id': CAR, 'targets': targets}).status_code == 400, targets
+
+
+def test_bad_numbers():
+    for extra in ({'top': 0}, {'top': -3}, {'top': 'x'}, {'tolerance': [1]}):
+        assert post({'car_id': CAR, 'targets': {}, **extra}).status_code == 400, extra
+
+
+def test_bad_parts():
+    for parts in ('x', ['coilovers'], {'coilovers': 'stock'}, {'coilovers': [['a']]},
+                  {'coilovers': [{'a': 1}]}, {'coilovers': [1]}, {'no_such_axis': ['stock']},
+                  {'angle_kit': ['wisefab_s13']}):  # not compatible with the car
+        assert post({'car_id': CAR, 'targets': {}, 'parts': parts}).status_code == 400, parts
+
+
+def test_parts_override():
+    r = post({'car_id': CAR, 'targets': {'max_angle': [50, None]},
+              'parts': {'angle_kit': ['wisefab_s13', 'wisefab_e46']}})
+    assert r.status_code == 200
+    builds = r.get_json()['builds']
+    assert builds and {b['parts']['angle_kit'] for b in builds} == {'wisefab_e46'}
+
+
+if __name__ == '__main__':
+    for name, test in list(globals().items()):
+        if name.startswith('test_'):
+            test()
+            print(f"✅ {name}")
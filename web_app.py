@@ -1,8 +1,7 @@
 """AC Physics Tool — Web UI for testing."""
 import os, json, io, zipfile, shutil, tempfile
 from flask import Flask, request, render_template_string, send_file, jsonify
-from src.ini_parser import parse_ini_file
-from src.car_detector import detect_car
+from src.ini_parser import PARSE_CACHE, IniDocument
 from modifier import CLASS_PRESETS, modify_car, get_value
 
 app = Flask(__name__)
@@ -303,7 +302,7 @@ def upload():
     for name in saved:
         path = os.path.join(upload_dir, name)
         try:
-            parsed[name] = parse_ini_file(path)
+            parsed[name] = PARSE_CACHE.parse_file(path)
         except Exception as e:
             parsed[name] = {"_error": str(e)}
     
@@ -447,27 +446,11 @@ def download():
             modified = False
             for mod_fname, sections in result["changes"].items():
                 if mod_fname.split(".")[0].lower() in fname.lower():
-                    # Read original file and apply changes
-                    with open(filepath, 'r') as f:
-                        content = f.read()
-                    
-                    # Apply each change by finding [SECTION] and KEY= lines
-                    for section, values in sections.items():
-                        for key, new_val in values.items():
-                            # Find the key in the file and replace its value
-                            import re
-                            # Look for key=value pattern (case insensitive)
-                            pattern = rf'((?:^|\n)\s*{re.escape(key)}\s*=)\s*[^\n;]*'
-                            replacement = rf'\g<1>{new_val}'
-                            new_content = re.sub(pattern, replacement, content, flags=re.IGNORECASE)
-                            if new_content != content:
-                                content = new_content
-                            else:
-                                # Key not found — append to end of relevant section
-                                section_pattern = rf'(\[{re.escape(section)}\][^\[]*)'
-                                def append_key(m):
-                                    return m.group(0).rstrip() + f'\n{key}={new_val}\n'
-                                content = re.sub(section_pattern, append_key, content, count=1, flags=re.IGNORECASE)
+                    # Read original file and apply changes to the matching sections,
+                    # keeping its encoding
+                    doc = IniDocument.from_file(filepath)
+                    doc.apply(sections)
+                    content = doc.dumps().encode(doc.encoding, errors='replace')
                     
                     zf.writestr(f"data/{fname}", content)
                     modified = True